@@ -0,0 +1,74 @@
+"""Measure the peak memory of loading a large generated schema.
+
+Every loader runs in its own process and reports its peak resident set size, so results
+aren't affected by the memory other loaders already took.
+
+Usage:
+    python benchmarks/memory.py --types 50000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+LOADERS = {
+    'from_file': 'SchemaLoader.from_file(path)',
+    'from_file (low memory)': 'SchemaLoader.from_file(path, low_memory=True)',
+}
+
+MEASURE = """
+import resource, sys, time
+from schemadiff.schema_loader import SchemaLoader
+path = sys.argv[1]
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+schema = {loader}
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline, time.perf_counter() - start)
+"""
+
+
+def generate_schema(path, types):
+    """Write a CRUD-like schema with a query field, an object type and an input per table"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('type Query {\n')
+        for i in range(types):
+            f.write(f'  table{i}(id: ID!, filter: Table{i}Filter): Table{i}\n')
+        f.write('}\n')
+        for i in range(types):
+            f.write(
+                f'"""Rows of table {i}"""\n'
+                f'type Table{i} {{\n  id: ID!\n  name: String\n  value{i}: Int\n  tags: [String!]!\n}}\n'
+                f'input Table{i}Filter {{\n  name: String\n  value{i}: Int = 0\n}}\n'
+            )
+
+
+def measure(loader, path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEASURE.format(loader=loader), path], cwd=root, universal_newlines=True
+    )
+    peak, seconds = output.split()
+    # ru_maxrss is in kilobytes on linux and in bytes on macOS
+    peak_mb = int(peak) / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    return peak_mb, float(seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--types', type=int, default=20000, help='Amount of generated tables')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'schema.graphql')
+        generate_schema(path, args.types)
+        print(f'Schema of {os.path.getsize(path) / (1024 * 1024):.1f} MB with {args.types} tables')
+
+        results = {name: measure(loader, path) for name, loader in LOADERS.items()}
+        reference, _ = results['from_file']
+        for name, (peak, seconds) in results.items():
+            print(f'{name:<24} peak RSS {peak:8.1f} MB ({peak / reference:6.1%})  {seconds:6.1f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,44 +1,80 @@
-from typing import Union, List
+from typing import Union
 
 from graphql import GraphQLSchema as GQLSchema, is_schema
 
+from schemadiff.aio import adiff
+from schemadiff.cache import DiffCache
 from schemadiff.changes import Change
+from schemadiff.changeset import ChangeSet
 from schemadiff.diff.schema import Schema
+from schemadiff.fingerprint import print_schema_sdl
 from schemadiff.schema_loader import SchemaLoader
 from schemadiff.formatting import print_diff, format_diff
+from schemadiff.incremental import IncrementalDiff
+from schemadiff.scope import DiffScope
+from schemadiff.summary import DiffSummary, diff_summary
 from schemadiff.validation import validate_changes
 
 
 SDL = str  # Alias for string describing schema through schema definition language
 
 
-def diff(old_schema: Union[SDL, GQLSchema], new_schema: Union[SDL, GQLSchema]) -> List[Change]:
+def diff(old_schema: Union[SDL, GQLSchema], new_schema: Union[SDL, GQLSchema],
+         detect_renames: bool = False, cache: DiffCache = None, scope: DiffScope = None) -> ChangeSet:
     """Compare two graphql schemas highlighting dangerous and breaking changes.
 
+    Args:
+        detect_renames: Report removed and added types or fields that look alike as renames
+        cache: Reuse the result of a previous comparison of the same schemas stored in this cache
+        scope: Compare only the types and directives of these paths and keep only these kinds of changes
+
     Returns:
-        changes (List[Change]): List of differences between both schemas with details about each change
+        changes (ChangeSet): List of differences between both schemas with details about each change
     """
+    if cache is not None:
+        old_sdl = print_schema_sdl(old_schema) if is_schema(old_schema) else old_schema
+        new_sdl = print_schema_sdl(new_schema) if is_schema(new_schema) else new_schema
+        key = DiffCache.key(old_sdl, new_sdl, detect_renames=detect_renames, scope=scope.key() if scope else None)
+        return cache.get_or_compute(key, lambda: diff(old_schema, new_schema, detect_renames, scope=scope))
+
     first = SchemaLoader.from_sdl(old_schema) if not is_schema(old_schema) else old_schema
     second = SchemaLoader.from_sdl(new_schema) if not is_schema(new_schema) else new_schema
-    return Schema(first, second).diff()
+    return ChangeSet.from_changes(Schema(first, second, detect_renames, scope).diff())
 
 
-def diff_from_file(schema_file: str, other_schema_file: str):
+def diff_from_file(schema_file: str, other_schema_file: str, detect_renames: bool = False,
+                   cache: DiffCache = None, scope: DiffScope = None) -> ChangeSet:
     """Compare two graphql schema files highlighting dangerous and breaking changes.
 
+    Args:
+        detect_renames: Report removed and added types or fields that look alike as renames
+        cache: Reuse the result of a previous comparison of the same schemas stored in this cache
+        scope: Compare only the types and directives of these paths and keep only these kinds of changes
+
     Returns:
-        changes (List[Change]): List of differences between both schemas with details about each change
+        changes (ChangeSet): List of differences between both schemas with details about each change
     """
+    if cache is not None:
+        with open(schema_file, encoding='utf-8') as old, open(other_schema_file, encoding='utf-8') as new:
+            return diff(old.read(), new.read(), detect_renames, cache, scope)
+
     first = SchemaLoader.from_file(schema_file)
     second = SchemaLoader.from_file(other_schema_file)
-    return Schema(first, second).diff()
+    return ChangeSet.from_changes(Schema(first, second, detect_renames, scope).diff())
 
 
 __all__ = [
     'diff',
     'diff_from_file',
+    'diff_summary',
+    'adiff',
     'format_diff',
     'print_diff',
     'validate_changes',
     'Change',
+    'ChangeSet',
+    'DiffCache',
+    'DiffScope',
+    'DiffSummary',
+    'IncrementalDiff',
 ]
@@ -1,15 +1,46 @@
+import heapq
+import json
+import os
 import sys
 import argparse
 
 from schemadiff.allow_list import read_allowed_changes
-from schemadiff.diff.schema import Schema
-from schemadiff.schema_loader import SchemaLoader
-from schemadiff.formatting import print_diff, print_json
+from schemadiff.cache import DiffCache
+from schemadiff.changes import CriticalityLevel
+from schemadiff.changeset import ChangeSet
+from schemadiff.cost import cost_changes
+from schemadiff.diff.schema import Schema, change_order
+from schemadiff.federation import InvalidSupergraph, diff_subgraphs, diff_supergraphs, read_subgraphs
+from schemadiff.fingerprint import files_fingerprint
+from schemadiff.html_report import write_html
+from schemadiff.impact import annotate_impact
+from schemadiff.locations import LocationIndex, SchemaLocations, annotate_locations
+from schemadiff.schema_loader import SchemaLoader, expand_paths
+from schemadiff.formatting import LEVEL_NAMES, format_delta, print_diff, print_json, write_junit, write_sarif
+from schemadiff.operations import OperationIndex, annotate_changes
+from schemadiff.reachability import ReachabilityIndex
+from schemadiff.registry import SchemaRegistry, RegistryError
+from schemadiff.reports import ADDED, InvalidReport, diff_reports
+from schemadiff.scope import DiffScope, change_kinds
+from schemadiff.summary import format_summary, summarize
+from schemadiff.scan import InvalidManifest, format_scan, read_manifest, scan, scan_report
 from schemadiff.validation import rules_list, validate_changes
+from schemadiff.watch import watch_diff
+
+OPERATIONS_CACHE_FILE = '.schemadiff-operations.json'
+REPORT_WRITERS = {
+    'sarif': write_sarif,
+    'junit': write_junit,
+    'html': write_html,
+}
 
 
 def cli():
-    args = parse_args(sys.argv[1:])
+    arguments = sys.argv[1:]
+    if arguments and arguments[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[arguments[0]](arguments[1:])
+
+    args = parse_args(arguments)
     return main(args)
 
 
@@ -17,18 +48,25 @@ def parse_args(arguments):
     parser = argparse.ArgumentParser(description='Schema comparator')
     parser.add_argument('-o', '--old-schema',
                         dest='old_schema',
-                        type=argparse.FileType('r', encoding='UTF-8'),
-                        help='Path to old graphql schema file',
+                        type=schema_paths,
+                        nargs='+',
+                        help='Path to old graphql schema. Accepts many files, directories and globs',
                         required=True)
     parser.add_argument('-n', '--new-schema',
                         dest='new_schema',
-                        type=argparse.FileType('r', encoding='UTF-8'),
-                        help='Path to new graphql schema file',
+                        type=schema_paths,
+                        nargs='+',
+                        help='Path to new graphql schema. Accepts many files, directories and globs',
                         required=True)
     parser.add_argument('-j', '--as-json',
                         action='store_true',
                         help='Output a detailed summary of changes in json format',
                         required=False)
+    parser.add_argument('-f', '--format',
+                        choices=('text', 'json', 'sarif', 'junit', 'html'),
+                        default='text',
+                        help='Output format. SARIF, JUnit and HTML reports point to the lines where changed members '
+                             'are defined in the schema files. HTML reports are a single page with a filterable table')
     parser.add_argument('-a', '--allow-list',
                         type=argparse.FileType('r', encoding='UTF-8'),
                         help='Path to the allowed list of changes')
@@ -40,38 +78,260 @@ def parse_args(arguments):
                         help="Strict mode. Error out on dangerous and breaking changes.")
     parser.add_argument('-r', '--validation-rules', choices=rules_list(), nargs='*',
                         help="Evaluate rules mode. Error out on changes that fail some validation rule.")
+    parser.add_argument('--detect-renames',
+                        action='store_true',
+                        help="Report removed and added types or fields that look alike as renames")
+    parser.add_argument('--operations',
+                        help="Path to a directory of persisted client operations. Changes are annotated with the "
+                             "operations they affect and changes that affect none don't cause an error exit code")
+    parser.add_argument('--operations-cache',
+                        help="Path to the cache of the operations index. "
+                             "Defaults to a .schemadiff-operations.json file inside the operations directory")
+    parser.add_argument('--cost',
+                        action='store_true',
+                        help="Report root fields whose worst-case query cost grows, i.e. when fields become lists. "
+                             "Uses @cost and @listSize directives when the schemas apply them")
+    parser.add_argument('--reachable-only',
+                        action='store_true',
+                        help="Leave out changes on types that can't be reached from the query, mutation "
+                             "or subscription types of either schema")
+    parser.add_argument('--impact',
+                        action='store_true',
+                        help="Show how many root fields lead to each change, with some sample paths in json output")
+    parser.add_argument('--locations', action='store_true',
+                        help="Add where every changed member is defined in the old and new schema files "
+                             "(old_location and new_location) to the json output")
+    parser.add_argument('--include', action='append', default=[], metavar='GLOB',
+                        help="Only compare the types and directives of the paths matching this glob, like `Query.*` "
+                             "or `User`, which also matches the fields of `User`. Can be repeated")
+    parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                        help="Never compare the types and directives of the paths matching this glob. Can be repeated")
+    parser.add_argument('--kinds', nargs='+', metavar='KIND',
+                        help="Only look for these kinds of changes, like ObjectTypeFieldRemoved")
+    parser.add_argument('--summary',
+                        action='store_true',
+                        help="Only count the changes per criticality and kind, with a sample of the paths of "
+                             "breaking changes. Faster than listing them, as their messages are never built")
+    parser.add_argument('--group-by-type',
+                        action='store_true',
+                        help="Group the text and json output by the type of each change, with the amount of "
+                             "changes per criticality of each type")
+    parser.add_argument('--watch',
+                        action='store_true',
+                        help="Compare the schemas again every time the new schema files change, "
+                             "printing only the changes that appeared (+) or disappeared (-). Stop with Ctrl+C")
+    parser.add_argument('--low-memory',
+                        action='store_true',
+                        help="Parse very large schemas by parts without keeping source locations")
+    parser.add_argument('--federation',
+                        choices=('supergraph', 'subgraphs'),
+                        help="Compare a federated graph subgraph by subgraph and show the subgraph of each change. "
+                             "Schemas are either composed supergraphs or subgraph files named after their subgraph. "
+                             "Results aren't cached")
+    parser.add_argument('--cache',
+                        action='store_true',
+                        help="Reuse the result of previous comparisons of the same schemas. "
+                             "Results are stored in $SCHEMADIFF_CACHE_DIR or ~/.cache/schemadiff")
+    parser.add_argument('--cache-dir',
+                        help="Directory of the cache of comparison results. Implies --cache")
 
-    return parser.parse_args(arguments)
+    args = parser.parse_args(arguments)
+    whole_graph_options = {
+        '--operations': args.operations,
+        '--cost': args.cost,
+        '--reachable-only': args.reachable_only,
+        '--impact': args.impact,
+    }
+    for option, value in whole_graph_options.items():
+        if value and args.federation == 'subgraphs':
+            parser.error(f'{option} needs the whole graph. Compare supergraphs instead of subgraphs')
+    if args.watch and args.federation:
+        parser.error("--watch can't compare federated graphs")
+    unknown_kinds = set(args.kinds or ()) - change_kinds().keys()
+    if unknown_kinds:
+        parser.error(f"unknown kinds of changes: {', '.join(sorted(unknown_kinds))}")
+    if args.watch:
+        # Watching only prints the changes as they appear and disappear, without allowed ones
+        ignored_options = {
+            '--as-json': args.as_json,
+            '--format': args.format != 'text',
+            '--tolerant': args.tolerant,
+            '--strict': args.strict,
+            '--validation-rules': args.validation_rules,
+            '--detect-renames': args.detect_renames,
+            '--operations': args.operations,
+            '--cost': args.cost,
+            '--reachable-only': args.reachable_only,
+            '--impact': args.impact,
+            '--locations': args.locations,
+            '--include': args.include,
+            '--exclude': args.exclude,
+            '--kinds': args.kinds,
+            '--group-by-type': args.group_by_type,
+            '--low-memory': args.low_memory,
+            '--cache': args.cache,
+            '--cache-dir': args.cache_dir,
+        }
+        for option, value in ignored_options.items():
+            if value:
+                parser.error(f"{option} can't be combined with --watch")
+    if args.summary:
+        # These options need the changes themselves, which aren't kept
+        listing_options = {
+            '--allow-list': args.allow_list,
+            '--validation-rules': args.validation_rules,
+            '--operations': args.operations,
+            '--cost': args.cost,
+            '--reachable-only': args.reachable_only,
+            '--impact': args.impact,
+            '--locations': args.locations,
+            '--group-by-type': args.group_by_type,
+            '--watch': args.watch,
+            '--federation': args.federation,
+            '--format': args.format != 'text',
+            '--cache': args.cache,
+            '--cache-dir': args.cache_dir,
+        }
+        for option, value in listing_options.items():
+            if value:
+                parser.error(f"{option} can't be combined with --summary")
+    if args.locations and args.low_memory:
+        parser.error("--locations needs source locations, which --low-memory doesn't keep")
+    return args
 
 
 def main(args) -> int:
     # Load schemas from file path args
-    old_schema = SchemaLoader.from_sdl(args.old_schema.read())
-    new_schema = SchemaLoader.from_sdl(args.new_schema.read())
-    args.old_schema.close()
-    args.new_schema.close()
+    old_paths = expand_paths(args.old_schema)
+    new_paths = expand_paths(args.new_schema)
     if args.allow_list:
         allowed_changes = read_allowed_changes(args.allow_list.read())
         args.allow_list.close()
     else:
         allowed_changes = {}
 
-    diff = Schema(old_schema, new_schema).diff()
+    if args.watch:
+        return watch_main(old_paths, args.new_schema, allowed_changes)
+    scope = DiffScope(args.include, args.exclude, args.kinds) if args.include or args.exclude or args.kinds else None
+    if args.summary:
+        return summary_main(old_paths, new_paths, args, scope)
+
+    cache = DiffCache(args.cache_dir) if args.cache or args.cache_dir else None
+    if args.federation:
+        try:
+            diff = compare_federated_files(old_paths, new_paths, args.detect_renames, args.federation, scope)
+        except InvalidSupergraph as e:
+            print(e, file=sys.stderr)
+            return 1
+    else:
+        diff = compare_files(old_paths, new_paths, args.detect_renames, cache, args.low_memory, scope)
+    if args.cost or args.reachable_only or args.impact:
+        old_schema = SchemaLoader.from_paths(old_paths, low_memory=args.low_memory)
+        new_schema = SchemaLoader.from_paths(new_paths, low_memory=args.low_memory)
+        if args.cost:
+            costs = cost_changes(old_schema, new_schema)
+            if scope is not None:
+                costs = scope.filter(costs)
+            diff = ChangeSet.from_changes(heapq.merge(diff, sorted(costs, key=change_order), key=change_order))
+        if args.reachable_only:
+            # Unreachable changes are dropped before validation, so they can't fail any rule
+            diff = ReachabilityIndex(old_schema, new_schema).filter(diff)
+        if args.impact:
+            annotate_impact(diff, old_schema, new_schema)
     validation_result = validate_changes(diff, args.validation_rules, allowed_changes)
-    diff = [change for change in diff if change.checksum() not in allowed_changes]
+    diff = diff.filter(exclude_checksums=allowed_changes)
+    relevant_changes = diff
+    if args.operations:
+        cache_path = args.operations_cache or os.path.join(args.operations, OPERATIONS_CACHE_FILE)
+        old_schema = SchemaLoader.from_paths(old_paths, low_memory=args.low_memory)
+        operations = OperationIndex.from_directory(args.operations, old_schema, cache_path=cache_path)
+        annotate_changes(diff, operations)
+        relevant_changes = ChangeSet.from_changes(change for change in diff if change.affected_operations)
+
+    output_format = 'json' if args.as_json else args.format
+    locations = None
+    if args.locations or output_format in REPORT_WRITERS:
+        # The schema files were just parsed to compare them, so indexing them reuses their documents if they are few
+        locations = SchemaLocations(LocationIndex.from_paths(old_paths), LocationIndex.from_paths(new_paths))
+    if args.locations:
+        annotate_locations(diff, locations.old, locations.new)
+
+    if output_format in REPORT_WRITERS:
+        REPORT_WRITERS[output_format](diff, sys.stdout, locations.locate)
+    elif output_format == 'json':
+        print_json(diff, args.group_by_type)
+    else:
+        print_diff(diff, args.group_by_type)
+
+    return exit_code(relevant_changes, args.strict, not validation_result.ok, args.tolerant)
+
+
+def summary_main(old_paths, new_paths, args, scope) -> int:
+    old_schema = SchemaLoader.from_paths(old_paths, low_memory=args.low_memory)
+    new_schema = SchemaLoader.from_paths(new_paths, low_memory=args.low_memory)
+    summary = summarize(Schema(old_schema, new_schema, args.detect_renames, scope=scope).iter_changes())
     if args.as_json:
-        print_json(diff)
+        print(json.dumps(summary.to_dict(), indent=4))
     else:
-        print_diff(diff)
+        print(format_summary(summary))
+
+    levels = {level: summary.levels[level_name] for level, level_name in LEVEL_NAMES.items()}
+    return levels_exit_code(levels, args.strict, False, args.tolerant)
+
+
+def watch_main(old_paths, new_patterns, allowed_changes) -> int:
+    updates = watch_diff(old_paths, new_patterns, exclude_checksums=allowed_changes)
+    try:
+        changes, _, _ = next(updates)
+        print_diff(changes)
+        for _, appeared, disappeared in updates:
+            print(format_delta(appeared, disappeared), flush=True)
+    except KeyboardInterrupt:
+        updates.close()
+    return 0
+
+
+def schema_paths(pattern: str) -> str:
+    try:
+        expand_paths(pattern)
+    except FileNotFoundError as e:
+        raise argparse.ArgumentTypeError(f"can't open '{pattern}': {e}")
+    return pattern
 
-    return exit_code(diff, args.strict, not validation_result.ok, args.tolerant)
+
+def compare_files(old_paths, new_paths, detect_renames, cache, low_memory, scope=None) -> ChangeSet:
+    def compare():
+        old_schema = SchemaLoader.from_paths(old_paths, low_memory=low_memory)
+        new_schema = SchemaLoader.from_paths(new_paths, low_memory=low_memory)
+        return Schema(old_schema, new_schema, detect_renames, scope).diff()
+
+    if cache is None:
+        return ChangeSet.from_changes(compare())
+
+    key = DiffCache.key_from_fingerprints(files_fingerprint(old_paths), files_fingerprint(new_paths),
+                                          detect_renames=detect_renames, scope=scope.key() if scope else None)
+    return cache.get_or_compute(key, compare)
+
+
+def compare_federated_files(old_paths, new_paths, detect_renames, federation, scope=None) -> ChangeSet:
+    if federation == 'subgraphs':
+        return diff_subgraphs(read_subgraphs(old_paths), read_subgraphs(new_paths), detect_renames, scope=scope)
+
+    old_sdl = '\n'.join(SchemaLoader.read_paths(old_paths).values())
+    new_sdl = '\n'.join(SchemaLoader.read_paths(new_paths).values())
+    return diff_supergraphs(old_sdl, new_sdl, detect_renames, scope=scope)
 
 
 def exit_code(changes, strict, some_change_is_restricted, tolerant) -> int:
+    return levels_exit_code(ChangeSet.from_changes(changes).counts('level'), strict, some_change_is_restricted,
+                            tolerant)
+
+
+def levels_exit_code(levels, strict, some_change_is_restricted, tolerant) -> int:
     exit_code = 0
-    if strict and any(change.breaking or change.dangerous for change in changes):
+    if strict and (levels.get(CriticalityLevel.Breaking) or levels.get(CriticalityLevel.Dangerous)):
         exit_code = 1
-    elif tolerant and any(change.breaking for change in changes):
+    elif tolerant and levels.get(CriticalityLevel.Breaking):
         exit_code = 2
     elif some_change_is_restricted:
         exit_code = 3
@@ -79,5 +339,142 @@ def exit_code(changes, strict, some_change_is_restricted, tolerant) -> int:
     return exit_code
 
 
+def parse_registry_args(arguments):
+    parser = argparse.ArgumentParser(prog='schemadiff registry', description='Local registry of schema versions')
+    parser.add_argument('-d', '--database',
+                        default='schemas.db',
+                        help='Path to the registry SQLite file')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    publish = commands.add_parser('publish', help='Store a new version of a service schema')
+    publish.add_argument('service')
+    publish.add_argument('version')
+    publish.add_argument('schema', type=argparse.FileType('r', encoding='UTF-8'), help='Path to the schema file')
+
+    versions = commands.add_parser('list', help='List the services or the versions of a service')
+    versions.add_argument('service', nargs='?')
+
+    show = commands.add_parser('show', help='Print the schema of a stored version')
+    show.add_argument('service')
+    show.add_argument('version')
+
+    compare = commands.add_parser('diff', help='Compare two stored versions of a service')
+    compare.add_argument('service')
+    compare.add_argument('old_version')
+    compare.add_argument('new_version')
+    compare.add_argument('-j', '--as-json',
+                         action='store_true',
+                         help='Output a detailed summary of changes in json format')
+
+    return parser.parse_args(arguments)
+
+
+def registry_main(args) -> int:
+    with SchemaRegistry(args.database) as registry:
+        try:
+            run_registry_command(registry, args)
+        except RegistryError as e:
+            print(e, file=sys.stderr)
+            return 1
+
+    return 0
+
+
+def run_registry_command(registry, args):
+    if args.command == 'publish':
+        new_members = registry.publish(args.service, args.version, args.schema.read())
+        args.schema.close()
+        print(f"Published `{args.service}` version `{args.version}` ({new_members} new definitions stored)")
+    elif args.command == 'list':
+        names = registry.versions(args.service) if args.service else registry.services()
+        print('\n'.join(names))
+    elif args.command == 'show':
+        print(registry.load_sdl(args.service, args.version), end='')
+    elif args.command == 'diff':
+        diff = registry.diff(args.service, args.old_version, args.new_version)
+        if args.as_json:
+            print_json(diff)
+        else:
+            print_diff(diff)
+
+
+def registry_cli(arguments) -> int:
+    return registry_main(parse_registry_args(arguments))
+
+
+def parse_scan_args(arguments):
+    parser = argparse.ArgumentParser(prog='schemadiff scan',
+                                     description='Compare the old and new schemas of every service of a manifest')
+    parser.add_argument('manifest', help='Path to a YAML or JSON manifest with a list of `services`, '
+                                         'each with a `name`, an `old` and a `new` schema path or url')
+    parser.add_argument('--report', help='Path to write the aggregated report to, in json format')
+    parser.add_argument('-w', '--workers', type=int,
+                        help='Amount of processes comparing services. All cpus by default')
+    parser.add_argument('--detect-renames',
+                        action='store_true',
+                        help="Report removed and added types or fields that look alike as renames")
+    return parser.parse_args(arguments)
+
+
+def scan_main(args) -> int:
+    try:
+        services = read_manifest(args.manifest)
+    except InvalidManifest as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    results = scan(services, args.detect_renames, args.workers)
+    print(format_scan(results))
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(scan_report(results), f, indent=4)
+
+    return 1 if any(result.failed for result in results) else 0
+
+
+def scan_cli(arguments) -> int:
+    return scan_main(parse_scan_args(arguments))
+
+
+def parse_delta_args(arguments):
+    parser = argparse.ArgumentParser(prog='schemadiff delta',
+                                     description='Show the changes that differ between two stored diff results')
+    parser.add_argument('previous', help='Path to the previous result: json or NDJSON output, binary result or '
+                                         'cache entry')
+    parser.add_argument('current', help='Path to the current result, in any of the same formats')
+    parser.add_argument('-j', '--as-json',
+                        action='store_true',
+                        help='Output a json object per line with the `status` (added or removed) of each change')
+    return parser.parse_args(arguments)
+
+
+def delta_main(args) -> int:
+    try:
+        for status, change in diff_reports(args.previous, args.current):
+            if args.as_json:
+                print(json.dumps({'status': status, **change.to_dict()}))
+            elif status == ADDED:
+                print(format_delta([change], []))
+            else:
+                print(format_delta([], [change]))
+    except (InvalidReport, OSError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def delta_cli(arguments) -> int:
+    return delta_main(parse_delta_args(arguments))
+
+
+SUBCOMMANDS = {
+    'registry': registry_cli,
+    'scan': scan_cli,
+    'delta': delta_cli,
+}
+
+
 if __name__ == '__main__':
     sys.exit(cli())
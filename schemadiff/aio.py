@@ -0,0 +1,301 @@
+"""Asyncio API to compare schemas of files, SDL strings or running servers.
+
+Sources are fetched concurrently: files are read and servers introspected on a thread pool, over
+keep-alive connections reused between requests to the same server. Building the schemas and comparing
+them is CPU bound, so it runs on a process pool, and the event loop is never blocked.
+"""
+import asyncio
+import http.client
+import os
+import threading
+import urllib.parse
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from graphql import GraphQLError, GraphQLSchema, build_client_schema, is_schema
+
+from schemadiff.changeset import ChangeSet
+from schemadiff.diff.schema import Schema
+from schemadiff.fingerprint import print_schema_sdl
+from schemadiff.schema_loader import (
+    INTROSPECTION_TIMEOUT,
+    IntrospectionError,
+    SchemaLoader,
+    introspection_data,
+    introspection_request_body,
+    introspection_request_headers,
+)
+from schemadiff.serialization import dumps_with_violations, loads_with_violations
+
+DEFAULT_CONCURRENCY = 8
+# Strings longer than this can't be paths, so they are always SDL
+MAX_PATH_LENGTH = 4096
+
+Source = Union[str, GraphQLSchema]
+# What a source is fetched into before building its schema: `('sdl', text)`, `('files', {name: text})`
+# or `('introspection', data)`. Unlike schemas and changes, they are cheap to send to other processes
+FetchedSource = Tuple[str, Any]
+
+
+def is_url(source: str) -> bool:
+    return source.startswith(('http://', 'https://'))
+
+
+def is_path(source: str) -> bool:
+    return len(source) < MAX_PATH_LENGTH and '\n' not in source and '{' not in source and os.path.exists(source)
+
+
+class InvalidSchemaError(Exception):
+    """The SDL or introspection result of a source couldn't be built into a schema"""
+
+
+class ConnectionPool:
+    """Keep-alive http connections, reused by the requests to the same server. It's thread safe.
+
+    Args:
+        size: Amount of idle connections kept per server
+    """
+
+    def __init__(self, size: int = DEFAULT_CONCURRENCY):
+        self.size = size
+        self._idle: Dict[Tuple[str, str, Optional[int]], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def post(self, url: str, body: bytes, headers: Dict[str, str], timeout: float) -> bytes:
+        """Send a POST request and get the content of its response.
+
+        Raises:
+            IntrospectionError: If the server can't be reached or answers with an error status
+        """
+        parts = urllib.parse.urlsplit(url)
+        server = (parts.scheme, parts.hostname, parts.port)
+        target = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        connection, reused = self._acquire(server, timeout)
+        try:
+            try:
+                response = self._send(connection, target, body, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server closed the idle connection, so the request is sent again on a new one
+                connection.close()
+                connection = self._new_connection(server, timeout)
+                response = self._send(connection, target, body, headers)
+            content = response.read()
+        except (http.client.HTTPException, OSError) as e:
+            connection.close()
+            raise IntrospectionError(f"Can't introspect {url}: {e}") from e
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(server, connection)
+        if response.status >= 400:
+            raise IntrospectionError(f"Can't introspect {url}: HTTP Error {response.status}: {response.reason}")
+        return content
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    @staticmethod
+    def _send(connection: http.client.HTTPConnection, target: str, body: bytes,
+              headers: Dict[str, str]) -> http.client.HTTPResponse:
+        connection.request('POST', target, body, headers)
+        return connection.getresponse()
+
+    def _acquire(self, server: Tuple, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(server)
+            connection = idle.pop() if idle else None
+        if connection is None:
+            return self._new_connection(server, timeout), False
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    @staticmethod
+    def _new_connection(server: Tuple, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = server
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(host, port, timeout=timeout)
+
+    def _release(self, server: Tuple, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(server, [])
+            if len(idle) < self.size:
+                idle.append(connection)
+                return
+        connection.close()
+
+
+class AsyncDiffer:
+    """Compare schemas from asyncio code.
+
+    Share a differ between comparisons to limit how many sources are fetched at the same time
+    across all of them, and to reuse its connections and pools.
+
+    Args:
+        concurrency: Amount of sources fetched at the same time in each event loop. It's also the size
+            of the thread pool that reads files and sends requests
+        timeout: Seconds to wait for each source to be fetched
+        headers: Headers sent along introspection queries, like authorization ones
+        workers: Amount of processes that build and compare schemas. All cpus by default
+        executor: Pool to build and compare schemas on instead of a pool of `workers` processes
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, timeout: float = INTROSPECTION_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None, workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.headers = headers
+        self.workers = workers
+        self.connections = ConnectionPool(concurrency)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        # Semaphores belong to the event loop they are first used in, so each loop gets its own
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(self.workers)
+            return self._executor
+
+    @property
+    def io_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._io_executor is None:
+                self._io_executor = ThreadPoolExecutor(self.concurrency, thread_name_prefix='schemadiff')
+            return self._io_executor
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore limiting the sources fetched at the same time in the running event loop"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+        return semaphore
+
+    async def fetch(self, source: Source) -> FetchedSource:
+        """Read a file, or introspect a server, without building its schema.
+
+        Raises:
+            asyncio.TimeoutError: If the source took longer than `timeout` to be fetched
+            IntrospectionError: If a server couldn't be introspected
+        """
+        loop = asyncio.get_running_loop()
+        if is_schema(source):
+            return await loop.run_in_executor(self.io_executor, _print_schema, source)
+        if not is_url(source) and not is_path(source):
+            return 'sdl', source
+
+        async with self.semaphore:
+            fetch = self._introspect if is_url(source) else _read_files
+            return await asyncio.wait_for(loop.run_in_executor(self.io_executor, fetch, source), self.timeout)
+
+    def _introspect(self, url: str) -> FetchedSource:
+        content = self.connections.post(url, introspection_request_body(),
+                                        introspection_request_headers(self.headers), self.timeout)
+        return 'introspection', introspection_data(url, content)
+
+    async def load(self, source: Source) -> GraphQLSchema:
+        """Build the schema of a file, SDL string or introspection url.
+
+        Raises:
+            asyncio.TimeoutError: If the source took longer than `timeout` to be fetched
+            IntrospectionError: If a server couldn't be introspected
+            InvalidSchemaError: If the schema couldn't be built
+        """
+        if is_schema(source):
+            return source
+        return await self._run(_build, await self.fetch(source))
+
+    async def diff(self, old_source: Source, new_source: Source, detect_renames: bool = False) -> ChangeSet:
+        """Compare two schemas, fetching both of them at the same time.
+
+        Raises:
+            asyncio.TimeoutError: If a source took longer than `timeout` to be fetched
+            IntrospectionError: If a server couldn't be introspected
+            InvalidSchemaError: If either schema couldn't be built
+        """
+        old, new = await asyncio.gather(self.fetch(old_source), self.fetch(new_source))
+        return loads_with_violations(await self._run(_compare, old, new, detect_renames))
+
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    def close(self) -> None:
+        """Shut down the pools and close the idle connections. Executors given to the differ are kept running"""
+        with self._lock:
+            if self._owns_executor and self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._io_executor is not None:
+                self._io_executor.shutdown(wait=False)
+                self._io_executor = None
+        self.connections.close()
+
+    async def __aenter__(self) -> 'AsyncDiffer':
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        self.close()
+
+
+def _print_schema(schema: GraphQLSchema) -> FetchedSource:
+    return 'sdl', print_schema_sdl(schema)
+
+
+def _read_files(patterns: str) -> FetchedSource:
+    return 'files', SchemaLoader.read_paths(patterns)
+
+
+def _build(fetched: FetchedSource) -> GraphQLSchema:
+    kind, content = fetched
+    try:
+        if kind == 'introspection':
+            return build_client_schema(content)
+        if kind == 'files':
+            return SchemaLoader.from_sources(content)
+        return SchemaLoader.from_sdl(content)
+    except (GraphQLError, TypeError) as e:
+        # graphql errors can't always be rebuilt in the event loop's process, so only their message is sent
+        raise InvalidSchemaError(str(e)) from None
+
+
+def _compare(old: FetchedSource, new: FetchedSource, detect_renames: bool) -> bytes:
+    # Changes reference graphql types that can't be sent between processes, so they are sent encoded
+    # along the rules they violate, which can't be checked on decoded changes
+    return dumps_with_violations(Schema(_build(old), _build(new), detect_renames).diff())
+
+
+async def adiff(old_source: Source, new_source: Source, detect_renames: bool = False,
+                differ: Optional[AsyncDiffer] = None) -> ChangeSet:
+    """Compare two schemas without blocking the event loop.
+
+    Sources may be schema file paths, SDL strings, http(s) urls of graphql servers to introspect or schemas.
+
+    Args:
+        detect_renames: Report removed and added types or fields that look alike as renames
+        differ: Differ to share its concurrency limit, connections and pools between many comparisons
+
+    Returns:
+        changes (ChangeSet): List of differences between both schemas with details about each change
+    """
+    if differ is not None:
+        return await differ.diff(old_source, new_source, detect_renames)
+
+    async with AsyncDiffer() as new_differ:
+        return await new_differ.diff(old_source, new_source, detect_renames)
@@ -0,0 +1,173 @@
+"""On-disk cache of diff results.
+
+Results are keyed by the hashes of both schemas, the options of the diff and the versions of
+schemadiff and graphql-core that computed them, so CI jobs comparing the same schemas only
+compute the diff once. Entries are written atomically and evicted when they are older than
+the cache TTL or when the cache grows over its maximum size, holding a lock file so concurrent
+processes can share the same cache directory.
+"""
+import json
+import os
+import struct
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Optional
+
+from graphql import version as graphql_version
+
+from schemadiff.changes import Change
+from schemadiff.changeset import ChangeSet
+from schemadiff.fingerprint import sdl_fingerprint
+from schemadiff.serialization import FORMAT_VERSION, InvalidDiffBuffer, dumps_with_violations, loads_with_violations
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover. Windows relies only on the atomic writes of entries
+    fcntl = None
+
+DEFAULT_TTL = 7 * 24 * 60 * 60
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+ENTRY_SUFFIX = '.diff'
+LOCK_FILE = '.lock'
+
+
+def default_cache_dir() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.environ.get('SCHEMADIFF_CACHE_DIR') or os.path.join(cache_home, 'schemadiff')
+
+
+def engine_version() -> str:
+    """Describe the code that computes a diff. Cached results of other versions are never used"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            schemadiff_version = version('graphql-schema-diff')
+        except PackageNotFoundError:
+            schemadiff_version = 'unknown'
+    except ImportError:  # Python < 3.8
+        schemadiff_version = 'unknown'
+    return f'{schemadiff_version}/{graphql_version}/{FORMAT_VERSION}'
+
+
+class DiffCache:
+    """Cache diff results in a local directory.
+
+    Cached changes keep their message, path, criticality and checksum, and the outcome of every
+    validation rule is recorded along them so rules can still be evaluated on cached results.
+
+    Usage:
+        >>> cache = DiffCache('.schemadiff-cache')
+        >>> changes = diff(old_sdl, new_sdl, cache=cache)  # Computed and stored
+        >>> changes = diff(old_sdl, new_sdl, cache=cache)  # Read from the cache
+    """
+
+    def __init__(self, directory: str = None, ttl: float = DEFAULT_TTL, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory or default_cache_dir()
+        self.ttl = ttl
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def key(cls, old_sdl: str, new_sdl: str, **options) -> str:
+        """Build the cache key of the diff of two schemas computed with the given options"""
+        return cls.key_from_fingerprints(sdl_fingerprint(old_sdl), sdl_fingerprint(new_sdl), **options)
+
+    @staticmethod
+    def key_from_fingerprints(old_fingerprint: str, new_fingerprint: str, **options) -> str:
+        """Build the cache key from the `sdl_fingerprint` of both schemas"""
+        options_part = json.dumps(options, sort_keys=True)
+        return sdl_fingerprint(f'{old_fingerprint}:{new_fingerprint}:{engine_version()}:{options_part}')
+
+    def get(self, key: str) -> Optional[ChangeSet]:
+        """Read a cached result. Expired and corrupt entries are discarded"""
+        path = self._path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.ttl:
+                self._discard(path)
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+            changes = self._decode(data)
+        except FileNotFoundError:
+            return None
+        except (InvalidDiffBuffer, ValueError, struct.error):
+            self._discard(path)
+            return None
+
+        return changes
+
+    def get_or_compute(self, key: str, compute: Callable[[], Iterable[Change]]) -> ChangeSet:
+        """Read a cached result or compute it and store it"""
+        changes = self.get(key)
+        if changes is None:
+            changes = ChangeSet.from_changes(compute())
+            self.put(key, changes)
+        return changes
+
+    def put(self, key: str, changes: Iterable[Change]) -> None:
+        """Store a result and evict old entries if the cache grew over its size"""
+        data = self._encode(list(changes))
+        with self._lock():
+            descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'wb') as f:
+                    f.write(data)
+                os.replace(temporary_path, self._path(key))
+            except BaseException:
+                self._discard(temporary_path)
+                raise
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock():
+            for entry in self._entries():
+                self._discard(entry.path)
+
+    def _encode(self, changes) -> bytes:
+        return dumps_with_violations(changes)
+
+    def _decode(self, data: bytes) -> ChangeSet:
+        return loads_with_violations(data)
+
+    def _evict(self) -> None:
+        now = time.time()
+        entries = []
+        for entry in self._entries():
+            stat = entry.stat()
+            if now - stat.st_mtime > self.ttl:
+                self._discard(entry.path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            self._discard(path)
+            size -= entry_size
+
+    def _entries(self):
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(ENTRY_SUFFIX) and entry.is_file()]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    @contextmanager
+    def _lock(self):
+        with open(os.path.join(self.directory, LOCK_FILE), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -2,11 +2,14 @@ import hashlib
 import json
 from abc import abstractmethod, ABC
 from enum import Enum
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from attr import dataclass
 from graphql import is_wrapping_type, is_non_null_type, is_list_type
 
+if TYPE_CHECKING:
+    from schemadiff.locations import Location
+
 
 class CriticalityLevel(Enum):
     NonBreaking = 'NON_BREAKING'
@@ -98,6 +101,27 @@ class Change(ABC):
     restricted: Optional[str] = None
     """Descriptive message only present when a change was restricted"""
 
+    affected_operations: Optional[List[str]] = None
+    """Ids of the client operations affected by the change. Only present when operations were analyzed"""
+
+    subgraph: Optional[str] = None
+    """Name of the federated subgraph the change was found on. Only present when subgraphs were compared"""
+
+    reachable: Optional[bool] = None
+    """Whether the change is on a type reachable from the root types. Only present when reachability was checked"""
+
+    affected_roots: Optional[int] = None
+    """Amount of root fields leading to the changed type. Only present when the impact was analyzed"""
+
+    impact_paths: Optional[List[str]] = None
+    """Sample of paths from root fields to the changed member. Only present when the impact was analyzed"""
+
+    old_location: Optional['Location'] = None
+    """Where the member (or its closest parent) is defined in the old schema files. Only present when located"""
+
+    new_location: Optional['Location'] = None
+    """Where the member (or its closest parent) is defined in the new schema files. Only present when located"""
+
     @property
     def breaking(self) -> bool:
         """Is this change a breaking change?"""
@@ -123,6 +147,20 @@ class Change(ABC):
     def path(self) -> str:
         """Path to the affected schema member"""
 
+    @property
+    def kind(self) -> str:
+        """Name of the kind of change"""
+        return self.__class__.__name__
+
+    @property
+    def coordinate(self) -> str:
+        """Schema coordinate of the affected member, like `Type.field` or `Type.field(arg:)`.
+
+        It matches the path except for changes on arguments and enum values, which point to
+        the argument or value itself instead of its parent.
+        """
+        return self.path
+
     def __repr__(self) -> str:
         return f"Change(criticality={self.criticality!r}, message={self.message!r}, path={self.path!r})"
 
@@ -131,7 +169,7 @@ class Change(ABC):
 
     def to_dict(self) -> dict:
         """Get detailed representation of a change"""
-        return {
+        representation = {
             'message': self.message,
             'path': self.path,
             'is_safe_change': self.safe,
@@ -141,6 +179,20 @@ class Change(ABC):
             },
             'checksum': self.checksum(),
         }
+        if self.affected_operations is not None:
+            representation['affected_operations'] = self.affected_operations
+        if self.subgraph is not None:
+            representation['subgraph'] = self.subgraph
+        if self.reachable is not None:
+            representation['reachable'] = self.reachable
+        if self.affected_roots is not None:
+            representation['affected_roots'] = self.affected_roots
+            representation['impact_paths'] = self.impact_paths
+        if self.old_location is not None:
+            representation['old_location'] = self.old_location.to_dict()
+        if self.new_location is not None:
+            representation['new_location'] = self.new_location.to_dict()
+        return representation
 
     def to_json(self) -> str:
         """Get detailed representation of a change as a json string"""
@@ -0,0 +1,130 @@
+from typing import Dict, Optional
+
+from schemadiff.changes import Change, Criticality
+
+
+def format_application(directive: str, arguments: Dict[str, str]) -> str:
+    if not arguments:
+        return f"@{directive}"
+    printed_arguments = ', '.join(f"{name}: {value}" for name, value in arguments.items())
+    return f"@{directive}({printed_arguments})"
+
+
+class AppliedDirectiveChange(Change):
+    """Change of the directives applied on a type, field, argument, enum value or input field.
+
+    `path` follows the path of the other changes of the element, and `coordinate` points to the element itself
+    """
+
+    def __init__(self, path: str, directive: str, coordinate: Optional[str] = None):
+        self._path = path
+        self.directive = directive
+        self._coordinate = coordinate or path
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def coordinate(self):
+        return self._coordinate
+
+
+class AppliedDirectiveAdded(AppliedDirectiveChange):
+    criticality = Criticality.dangerous(
+        "Applied directives may change how the server resolves or authorizes an element. "
+        "Clients can't see them through introspection"
+    )
+
+    def __init__(self, path, directive, arguments, coordinate=None):
+        super().__init__(path, directive, coordinate)
+        self.arguments = arguments
+
+    @property
+    def message(self):
+        return f"Directive `{format_application(self.directive, self.arguments)}` was applied to `{self.coordinate}`"
+
+
+class AppliedDirectiveRemoved(AppliedDirectiveChange):
+    criticality = Criticality.dangerous(
+        "Removing an applied directive may change how the server resolves or authorizes an element"
+    )
+
+    def __init__(self, path, directive, arguments, coordinate=None):
+        super().__init__(path, directive, coordinate)
+        self.arguments = arguments
+
+    @property
+    def message(self):
+        return (
+            f"Directive `{format_application(self.directive, self.arguments)}` "
+            f"was removed from `{self.coordinate}`"
+        )
+
+
+class AppliedDirectiveArgumentChanged(AppliedDirectiveChange):
+    criticality = Criticality.dangerous(
+        "Changing the arguments of an applied directive may change how the server resolves "
+        "or authorizes an element"
+    )
+
+    def __init__(self, path, directive, argument, old_value, new_value, coordinate=None):
+        super().__init__(path, directive, coordinate)
+        self.argument = argument
+        self.old_value = old_value
+        self.new_value = new_value
+
+    @property
+    def message(self):
+        prefix = f"Argument `{self.argument}` of directive `@{self.directive}` on `{self.coordinate}`"
+        if self.old_value is None:
+            return f"{prefix} was set to `{self.new_value}`"
+        if self.new_value is None:
+            return f"{prefix} was unset (it was `{self.old_value}`)"
+        return f"{prefix} changed from `{self.old_value}` to `{self.new_value}`"
+
+
+class CacheControlChanged(AppliedDirectiveChange):
+    """Change of the `@cacheControl` hints of an element. Missing hints are represented by None"""
+
+    def __init__(self, path, old_arguments, new_arguments, coordinate=None):
+        super().__init__(path, 'cacheControl', coordinate)
+        self.old_arguments = old_arguments
+        self.new_arguments = new_arguments
+        if self.max_age_reduced() or self.scope_restricted():
+            self.criticality = Criticality.dangerous(
+                "Reducing the cache lifetime or making the cache private lowers cache hits and "
+                "increases the load on the origin servers"
+            )
+        else:
+            self.criticality = Criticality.safe()
+
+    @property
+    def old_max_age(self) -> int:
+        return self._max_age(self.old_arguments)
+
+    @property
+    def new_max_age(self) -> int:
+        return self._max_age(self.new_arguments)
+
+    def max_age_reduced(self) -> bool:
+        return self.new_max_age < self.old_max_age
+
+    def scope_restricted(self) -> bool:
+        old_scope = (self.old_arguments or {}).get('scope', 'PUBLIC')
+        new_scope = (self.new_arguments or {}).get('scope', 'PUBLIC')
+        return old_scope == 'PUBLIC' and new_scope == 'PRIVATE'
+
+    @property
+    def message(self):
+        old = format_application(self.directive, self.old_arguments) if self.old_arguments is not None else 'none'
+        new = format_application(self.directive, self.new_arguments) if self.new_arguments is not None else 'none'
+        return f"Cache control of `{self.coordinate}` changed from `{old}` to `{new}`"
+
+    @staticmethod
+    def _max_age(arguments: Optional[Dict[str, str]]) -> int:
+        # Elements without a max age hint are not cached by default
+        try:
+            return int((arguments or {}).get('maxAge', 0))
+        except ValueError:
+            return 0
@@ -13,6 +13,10 @@ class FieldAbstractArgumentChange(Change):
     def path(self):
         return f"{self.parent.name}.{self.field_name}"
 
+    @property
+    def coordinate(self):
+        return f"{self.parent.name}.{self.field_name}({self.arg_name}:)"
+
 
 class FieldArgumentDescriptionChanged(FieldAbstractArgumentChange):
 
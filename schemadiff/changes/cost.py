@@ -0,0 +1,27 @@
+from schemadiff.changes import Change, Criticality
+
+
+class QueryCostIncreased(Change):
+    """The worst-case cost of the queries starting at a root field grew beyond the tolerated ratio"""
+
+    criticality = Criticality.dangerous(
+        "Queries selecting this field may resolve many more objects than before, "
+        "increasing the load on the server and possibly exceeding query cost limits"
+    )
+
+    def __init__(self, root_field: str, old_cost: int, new_cost: int):
+        self.root_field = root_field
+        self.old_cost = old_cost
+        self.new_cost = new_cost
+
+    @property
+    def message(self):
+        ratio = f" (x{self.new_cost / self.old_cost:.1f})" if self.old_cost else ''
+        return (
+            f"Worst-case cost of queries on `{self.root_field}` increased "
+            f"from `{self.old_cost}` to `{self.new_cost}`{ratio}"
+        )
+
+    @property
+    def path(self):
+        return self.root_field
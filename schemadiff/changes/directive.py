@@ -10,6 +10,13 @@ class DirectiveChange(Change):
         return f"{self.directive}"
 
 
+class DirectiveArgumentChange(DirectiveChange):
+
+    @property
+    def coordinate(self):
+        return f"{self.directive}({self.arg_name}:)"
+
+
 class AddedDirective(DirectiveChange):
 
     criticality = Criticality.safe()
@@ -80,7 +87,7 @@ class DirectiveLocationsChanged(DirectiveChange):
         )
 
 
-class DirectiveArgumentAdded(DirectiveChange):
+class DirectiveArgumentAdded(DirectiveArgumentChange):
     def __init__(self, directive, arg_name, arg_type):
         self.criticality = Criticality.safe() if not is_non_null_type(arg_type.type) else Criticality.breaking(
             "Adding a non nullable directive argument will break existing usages of the directive"
@@ -94,7 +101,7 @@ class DirectiveArgumentAdded(DirectiveChange):
         return f"Added argument `{self.arg_name}: {self.arg_type.type}` to `{self.directive!s}` directive"
 
 
-class DirectiveArgumentRemoved(DirectiveChange):
+class DirectiveArgumentRemoved(DirectiveArgumentChange):
 
     criticality = Criticality.breaking("Removing a directive argument will break existing usages of the argument")
 
@@ -108,7 +115,7 @@ class DirectiveArgumentRemoved(DirectiveChange):
         return f"Removed argument `{self.arg_name}: {self.arg_type.type}` from `{self.directive!s}` directive"
 
 
-class DirectiveArgumentTypeChanged(DirectiveChange):
+class DirectiveArgumentTypeChanged(DirectiveArgumentChange):
     def __init__(self, directive, arg_name, old_type, new_type):
         self.criticality = (
             Criticality.breaking("Changing the argument type is a breaking change")
@@ -128,7 +135,7 @@ class DirectiveArgumentTypeChanged(DirectiveChange):
         )
 
 
-class DirectiveArgumentDefaultChanged(DirectiveChange):
+class DirectiveArgumentDefaultChanged(DirectiveArgumentChange):
     def __init__(self, directive, arg_name, old_default, new_default):
         self.criticality = Criticality.dangerous(
             "Changing the default value for an argument may change the runtime "
@@ -147,7 +154,7 @@ class DirectiveArgumentDefaultChanged(DirectiveChange):
         )
 
 
-class DirectiveArgumentDescriptionChanged(DirectiveChange):
+class DirectiveArgumentDescriptionChanged(DirectiveArgumentChange):
     criticality = Criticality.safe()
 
     def __init__(self, directive, arg_name, old_desc, new_desc):
@@ -36,6 +36,10 @@ class EnumValueRemoved(Change):
     def path(self):
         return f"{self.enum.name}"
 
+    @property
+    def coordinate(self):
+        return f"{self.enum.name}.{self.value}"
+
 
 class EnumValueDescriptionChanged(Change):
 
@@ -93,6 +93,10 @@ class FieldArgumentAdded(Change):
     def path(self):
         return f"{self.parent}.{self.field_name}"
 
+    @property
+    def coordinate(self):
+        return f"{self.parent}.{self.field_name}({self.argument_name}:)"
+
 
 class FieldArgumentRemoved(Change):
 
@@ -114,3 +118,27 @@ class FieldArgumentRemoved(Change):
     @property
     def path(self):
         return f"{self.parent}.{self.field_name}"
+
+    @property
+    def coordinate(self):
+        return f"{self.parent}.{self.field_name}({self.argument_name}:)"
+
+
+class FieldRenamed(Change):
+
+    criticality = Criticality.breaking(
+        "Renaming a field is a breaking change because queries that select it by its old name will stop working."
+    )
+
+    def __init__(self, parent, old_name, new_name):
+        self.parent = parent
+        self.old_name = old_name
+        self.new_name = new_name
+
+    @property
+    def message(self):
+        return f"Field `{self.parent.name}.{self.old_name}` was renamed to `{self.parent.name}.{self.new_name}`"
+
+    @property
+    def path(self):
+        return f"{self.parent.name}.{self.new_name}"
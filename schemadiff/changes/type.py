@@ -77,3 +77,22 @@ class TypeKindChanged(Change):
     @property
     def path(self):
         return f"{self.type_}"
+
+
+class TypeRenamed(Change):
+    criticality = Criticality.breaking(
+        "Renaming a type is a breaking change because queries that reference it by name "
+        "(i.e. in fragments or variables) will stop working."
+    )
+
+    def __init__(self, old_type, new_type):
+        self.old_type = old_type
+        self.new_type = new_type
+
+    @property
+    def message(self):
+        return f"Type `{self.old_type.name}` was renamed to `{self.new_type.name}`"
+
+    @property
+    def path(self):
+        return f"{self.new_type.name}"
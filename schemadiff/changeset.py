@@ -0,0 +1,283 @@
+import re
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from itertools import compress
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from schemadiff.changes import Change, Criticality, CriticalityLevel
+
+CRITICALITY_LEVELS = list(CriticalityLevel)
+CHECKSUM_SIZE = 16
+COLUMNS = ('level', 'kind', 'path', 'type')
+_TYPE_NAME = re.compile(r'[_A-Za-z][_0-9A-Za-z]*')
+
+
+def path_type(path: Optional[str]) -> str:
+    """Get the name of the type a change path points to, like `Type` for `Type.field`"""
+    match = _TYPE_NAME.match(path or '')
+    return match.group() if match else ''
+
+
+class MaterializedChange(Change):
+    """Change rebuilt from the columns of a `ChangeSet`.
+
+    It has the same representation as the change it was built from,
+    but not the references to the graphql types involved. Validation rules can't inspect it,
+    so the messages of the rules it violated may be recorded in `violations` instead.
+    """
+    def __init__(self, kind: str, message: str, path: Optional[str], coordinate: Optional[str],
+                 criticality: Criticality, checksum: str):
+        self.violations: Dict[str, str] = {}
+        self._kind = kind
+        self._message = message
+        self._path = path
+        self._coordinate = coordinate
+        self.criticality = criticality
+        self._checksum = checksum
+
+    @property
+    def kind(self):
+        return self._kind
+
+    @property
+    def message(self):
+        return self._message
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def coordinate(self):
+        return self._coordinate
+
+    def checksum(self):
+        return self._checksum
+
+
+class ChangeSet(Sequence):
+    """Immutable collection of changes stored column-wise.
+
+    Every change is stored as a row of small integers (kind, criticality level and ids of
+    its interned path, coordinate and reason), an offset into a shared message buffer
+    and its 16 bytes checksum. Filtering, grouping and counting only touch those columns,
+    and `Change` objects are only built when a change is accessed.
+
+    It still behaves as a list of changes, so it can be iterated, indexed and compared with lists.
+    """
+
+    def __init__(self):
+        self.kinds: List[str] = []
+        self.strings: List[Optional[str]] = []
+        self.kind_column = array('H')
+        self.level_column = array('B')
+        self.path_column = array('I')
+        self.coordinate_column = array('I')
+        self.reason_column = array('I')
+        self.message_offsets = array('Q', [0])
+        self.messages = ''
+        self.checksums = bytearray()
+        self._changes: List[Optional[Change]] = []
+        self._kind_ids: Dict[str, int] = {}
+        self._string_ids: Dict[Optional[str], int] = {}
+
+    @classmethod
+    def from_changes(cls, changes: Iterable[Change]) -> 'ChangeSet':
+        """Store a list of changes. Their message and checksum are computed only once here"""
+        if isinstance(changes, ChangeSet):
+            return changes
+
+        return cls.from_rows(
+            (
+                change.kind,
+                CRITICALITY_LEVELS.index(change.criticality.level),
+                change.path,
+                change.coordinate,
+                change.criticality.reason,
+                change.message,
+                bytes.fromhex(change.checksum()),
+                change,
+            )
+            for change in changes
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> 'ChangeSet':
+        """Store changes described by `(kind, level index, path, coordinate, reason, message, checksum bytes,
+        change)` rows. The change may be None to build it only when it is accessed.
+        """
+        changeset = cls()
+        messages = []
+        offset = 0
+        for kind, level_id, path, coordinate, reason, message, checksum, change in rows:
+            messages.append(message)
+            offset += len(message)
+            changeset.kind_column.append(changeset._intern_kind(kind))
+            changeset.level_column.append(level_id)
+            changeset.path_column.append(changeset._intern(path))
+            changeset.coordinate_column.append(changeset._intern(coordinate))
+            changeset.reason_column.append(changeset._intern(reason))
+            changeset.message_offsets.append(offset)
+            changeset.checksums += checksum
+            changeset._changes.append(change)
+
+        changeset.messages = ''.join(messages)
+        return changeset
+
+    def __len__(self):
+        return len(self.level_column)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('ChangeSet index out of range')
+
+        change = self._changes[index]
+        if change is None:
+            change = self._changes[index] = self._materialize(index)
+        return change
+
+    def __eq__(self, other):
+        if isinstance(other, (ChangeSet, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ChangeSet({list(self)!r})"
+
+    def message(self, index: int) -> str:
+        return self.messages[self.message_offsets[index]:self.message_offsets[index + 1]]
+
+    def checksum(self, index: int) -> str:
+        return self.checksums[index * CHECKSUM_SIZE:(index + 1) * CHECKSUM_SIZE].hex()
+
+    def take(self, indexes: Iterable[int]) -> 'ChangeSet':
+        """Build a new change set with the rows at the given indexes. Interned values are shared"""
+        subset = ChangeSet()
+        subset.kinds, subset._kind_ids = self.kinds, self._kind_ids
+        subset.strings, subset._string_ids = self.strings, self._string_ids
+        messages = []
+        offset = 0
+        for index in indexes:
+            message = self.message(index)
+            messages.append(message)
+            offset += len(message)
+            subset.kind_column.append(self.kind_column[index])
+            subset.level_column.append(self.level_column[index])
+            subset.path_column.append(self.path_column[index])
+            subset.coordinate_column.append(self.coordinate_column[index])
+            subset.reason_column.append(self.reason_column[index])
+            subset.message_offsets.append(offset)
+            subset.checksums += self.checksums[index * CHECKSUM_SIZE:(index + 1) * CHECKSUM_SIZE]
+            subset._changes.append(self._changes[index])
+
+        subset.messages = ''.join(messages)
+        return subset
+
+    def filter(self, levels: Iterable[CriticalityLevel] = None, kinds: Iterable[Union[str, Type[Change]]] = None,
+               path_prefix: str = None, exclude_checksums: Iterable[str] = None,
+               path_filter: Callable[[Optional[str]], bool] = None) -> 'ChangeSet':
+        """Select the changes that match all the given conditions.
+
+        Args:
+            levels: Criticality levels to keep
+            kinds: Change classes (or their names) to keep
+            path_prefix: Keep only changes whose path starts with this prefix
+            exclude_checksums: Checksums of changes to leave out, like the ones of an allowlist
+            path_filter: Keep only changes whose path passes this function. It's called once per distinct path
+        """
+        conditions = []
+        if levels is not None:
+            level_ids = {CRITICALITY_LEVELS.index(level) for level in levels}
+            conditions.append(map(level_ids.__contains__, self.level_column))
+        if kinds is not None:
+            kind_names = {kind if isinstance(kind, str) else kind.__name__ for kind in kinds}
+            kind_ids = {kind_id for kind_id, kind in enumerate(self.kinds) if kind in kind_names}
+            conditions.append(map(kind_ids.__contains__, self.kind_column))
+        if path_prefix is not None:
+            # Prefixes are matched once per distinct path instead of once per change
+            path_ids = self._matching_string_ids(path_prefix)
+            conditions.append(map(path_ids.__contains__, self.path_column))
+        if path_filter is not None:
+            path_ids = {path_id for path_id in set(self.path_column) if path_filter(self.strings[path_id])}
+            conditions.append(map(path_ids.__contains__, self.path_column))
+        if exclude_checksums is not None:
+            excluded = {bytes.fromhex(checksum) for checksum in exclude_checksums}
+            conditions.append(
+                bytes(self.checksums[start:start + CHECKSUM_SIZE]) not in excluded
+                for start in range(0, len(self.checksums), CHECKSUM_SIZE)
+            )
+
+        if not conditions:
+            return self
+        return self.take(compress(range(len(self)), map(all, zip(*conditions))))
+
+    def counts(self, by: str = 'level') -> Dict[Union[CriticalityLevel, str], int]:
+        """Count changes per criticality `level`, `kind`, `path` or `type` (the type of their path)"""
+        column, names = self._column(by)
+        return {names(value_id): amount for value_id, amount in Counter(column).items()}
+
+    def group_by(self, by: str = 'kind') -> Dict[Union[CriticalityLevel, str], 'ChangeSet']:
+        """Split the changes per criticality `level`, `kind`, `path` or `type` keeping their order"""
+        column, names = self._column(by)
+        groups: Dict[int, List[int]] = {}
+        for index, value_id in enumerate(column):
+            groups.setdefault(value_id, []).append(index)
+        return {names(value_id): self.take(indexes) for value_id, indexes in groups.items()}
+
+    @property
+    def breaking(self) -> 'ChangeSet':
+        return self.filter(levels=[CriticalityLevel.Breaking])
+
+    @property
+    def dangerous(self) -> 'ChangeSet':
+        return self.filter(levels=[CriticalityLevel.Dangerous])
+
+    def _column(self, by: str):
+        if by == 'level':
+            return self.level_column, CRITICALITY_LEVELS.__getitem__
+        if by == 'kind':
+            return self.kind_column, self.kinds.__getitem__
+        if by == 'path':
+            return self.path_column, self.strings.__getitem__
+        if by == 'type':
+            # Types are taken once per distinct path
+            type_names = {path_id: path_type(self.strings[path_id]) for path_id in set(self.path_column)}
+            return map(type_names.__getitem__, self.path_column), str
+        raise ValueError(f"Unknown column `{by}`. Expected one of {', '.join(COLUMNS)}")
+
+    def _matching_string_ids(self, prefix: str) -> Set[int]:
+        return {
+            string_id for string_id, string in enumerate(self.strings)
+            if string is not None and string.startswith(prefix)
+        }
+
+    def _materialize(self, index: int) -> Change:
+        return MaterializedChange(
+            kind=self.kinds[self.kind_column[index]],
+            message=self.message(index),
+            path=self.strings[self.path_column[index]],
+            coordinate=self.strings[self.coordinate_column[index]],
+            criticality=Criticality(
+                level=CRITICALITY_LEVELS[self.level_column[index]],
+                reason=self.strings[self.reason_column[index]],
+            ),
+            checksum=self.checksum(index),
+        )
+
+    def _intern_kind(self, kind: str) -> int:
+        if kind not in self._kind_ids:
+            self._kind_ids[kind] = len(self.kinds)
+            self.kinds.append(kind)
+        return self._kind_ids[kind]
+
+    def _intern(self, string: Optional[str]) -> int:
+        if string not in self._string_ids:
+            self._string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        return self._string_ids[string]
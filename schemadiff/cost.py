@@ -0,0 +1,184 @@
+"""Static worst-case cost of the queries a schema accepts.
+
+Turning `field: Foo` into `field: [Foo]` is a safe change for clients, but it may
+multiply the objects the server resolves. Each root field gets the cost of the
+most expensive query starting at it, i.e. selecting every field down to `max_depth`
+levels, where lists multiply the cost of their items by their expected size.
+
+Weights and sizes come from `@cost(weight:)` and `@listSize(assumedSize:, slicingArguments:)`
+directives when the schema applies them, and from the model defaults otherwise.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from graphql import (
+    GraphQLError,
+    GraphQLField,
+    GraphQLSchema,
+    get_named_type,
+    is_abstract_type,
+    is_leaf_type,
+    is_list_type,
+    is_non_null_type,
+    parse_value,
+    value_from_ast_untyped,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changes.cost import QueryCostIncreased
+from schemadiff.diff.applied_directive import applied_directives
+
+COST_DIRECTIVE = 'cost'
+LIST_SIZE_DIRECTIVE = 'listSize'
+
+
+class CostModel:
+    """Estimates of the cost of resolving fields when the schema doesn't declare them.
+
+    Args:
+        object_cost: Cost of resolving a field of an object, interface or union type
+        leaf_cost: Cost of resolving a field of a scalar or enum type
+        list_size: Expected amount of items of lists without a `@listSize`
+        max_depth: Depth of the selections considered. Recursive types would have an infinite cost otherwise
+        tolerance: Ratio a root field cost may grow by before being reported
+    """
+
+    def __init__(self, object_cost: float = 1, leaf_cost: float = 0, list_size: int = 10, max_depth: int = 5,
+                 tolerance: float = 0.1):
+        self.object_cost = object_cost
+        self.leaf_cost = leaf_cost
+        self.list_size = list_size
+        self.max_depth = max_depth
+        self.tolerance = tolerance
+
+    def root_costs(self, schema: GraphQLSchema) -> Dict[str, float]:
+        """Map each root field coordinate (like `Query.users`) to its worst-case query cost"""
+        return SchemaCost(schema, self).root_costs()
+
+
+class SchemaCost:
+    """Memoized traversal of the selections of a schema.
+
+    Types may reference each other in cycles, but the traversal goes over (type, remaining depth)
+    pairs which form a DAG, so the cost of each pair is computed once.
+    """
+
+    def __init__(self, schema: GraphQLSchema, model: CostModel):
+        self.schema = schema
+        self.model = model
+        self._type_costs: Dict[Tuple[str, int], float] = {}
+        self._weights: Dict[str, float] = {}
+        self._field_factors: Dict[int, Tuple[float, float]] = {}
+
+    def root_costs(self) -> Dict[str, float]:
+        costs = {}
+        roots = (self.schema.query_type, self.schema.mutation_type, self.schema.subscription_type)
+        for root in roots:
+            if root is None:
+                continue
+            for name, field in root.fields.items():
+                costs[f'{root.name}.{name}'] = self.field_cost(field, self.model.max_depth)
+        return costs
+
+    def field_cost(self, field: GraphQLField, depth: int) -> float:
+        multiplier, weight = self.field_factors(field)
+        return multiplier * (weight + self.type_cost(get_named_type(field.type), depth - 1))
+
+    def field_factors(self, field: GraphQLField) -> Tuple[float, float]:
+        """Get the expected amount of items and the weight of each item of a field"""
+        # Fields are visited once per depth, so their directives are only read the first time
+        key = id(field)
+        if key not in self._field_factors:
+            weight = directive_number(field, COST_DIRECTIVE, 'weight')
+            if weight is None:
+                weight = self.type_weight(get_named_type(field.type))
+            self._field_factors[key] = (self.multiplier(field), weight)
+        return self._field_factors[key]
+
+    def type_cost(self, type_, depth: int) -> float:
+        """Cost of selecting every field of a type down to `depth` levels"""
+        if depth <= 0 or is_leaf_type(type_):
+            return 0
+
+        key = (type_.name, depth)
+        if key not in self._type_costs:
+            if is_abstract_type(type_):
+                # Any of the possible types may be returned, so take the most expensive one
+                cost = max((self.type_cost(possible, depth) for possible in self.schema.get_possible_types(type_)),
+                           default=0)
+            else:
+                cost = sum(self.field_cost(field, depth) for field in type_.fields.values())
+            self._type_costs[key] = cost
+        return self._type_costs[key]
+
+    def type_weight(self, type_) -> float:
+        if type_.name not in self._weights:
+            weight = directive_number(type_, COST_DIRECTIVE, 'weight')
+            if weight is None:
+                weight = self.model.leaf_cost if is_leaf_type(type_) else self.model.object_cost
+            self._weights[type_.name] = weight
+        return self._weights[type_.name]
+
+    def multiplier(self, field: GraphQLField) -> float:
+        """Expected amount of items resolved by a field. Nested lists multiply their sizes"""
+        size = self.list_size(field)
+        multiplier = 1
+        type_ = field.type
+        while is_list_type(type_) or is_non_null_type(type_):
+            if is_list_type(type_):
+                multiplier *= size
+            type_ = type_.of_type
+        return multiplier
+
+    def list_size(self, field: GraphQLField) -> float:
+        list_size = directive_arguments(field, LIST_SIZE_DIRECTIVE)
+        # Paginated fields return as many items as their slicing arguments ask for
+        slicing_defaults = [
+            field.args[name].default_value
+            for name in list_size.get('slicingArguments') or ()
+            if name in field.args and isinstance(field.args[name].default_value, (int, float))
+        ]
+        if slicing_defaults:
+            return max(slicing_defaults)
+        assumed_size = list_size.get('assumedSize')
+        if isinstance(assumed_size, (int, float)):
+            return assumed_size
+        return self.model.list_size
+
+
+def directive_arguments(element, directive: str) -> dict:
+    """Get the values of the arguments of the first application of a directive on an element"""
+    applications = applied_directives(element).get(directive)
+    if not applications:
+        return {}
+    values = {}
+    for name, printed_value in applications[0].items():
+        try:
+            values[name] = value_from_ast_untyped(parse_value(printed_value))
+        except GraphQLError:
+            continue
+    return values
+
+
+def directive_number(element, directive: str, argument: str) -> Optional[float]:
+    # Weights are strings in the IBM cost spec and numbers elsewhere
+    value = directive_arguments(element, directive).get(argument)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def cost_changes(old_schema: GraphQLSchema, new_schema: GraphQLSchema, model: CostModel = None) -> List[Change]:
+    """Report the root fields of both schemas whose worst-case query cost grew beyond the model tolerance"""
+    model = model or CostModel()
+    old_costs = model.root_costs(old_schema)
+    new_costs = model.root_costs(new_schema)
+
+    changes = []
+    for root_field, new_cost in new_costs.items():
+        old_cost = old_costs.get(root_field)
+        if old_cost is None:
+            continue
+        if new_cost > old_cost * (1 + model.tolerance):
+            changes.append(QueryCostIncreased(root_field, round(old_cost), round(new_cost)))
+    return changes
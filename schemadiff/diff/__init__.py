@@ -0,0 +1,9 @@
+from schemadiff.changes import Change
+
+
+def change_order(change: Change):
+    """Sort key of changes: by path and then by kind.
+
+    Differs visit members by name, so they only sort the few changes of each member by kind.
+    """
+    return change.path or '', change.kind
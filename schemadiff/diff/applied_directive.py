@@ -0,0 +1,83 @@
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from graphql import print_ast
+
+from schemadiff.changes.applied_directive import (
+    AppliedDirectiveAdded,
+    AppliedDirectiveRemoved,
+    AppliedDirectiveArgumentChanged,
+    CacheControlChanged,
+)
+
+# Their changes are already reported as deprecation reason changes
+IGNORED_DIRECTIVES = {'deprecated', 'specifiedBy'}
+CACHE_CONTROL = 'cacheControl'
+
+
+def applied_directives(element) -> Dict[str, List[Dict[str, str]]]:
+    """Map the directives applied on an element to the printed arguments of each of its applications.
+
+    Applied directives are only known for elements built from SDL, through their AST nodes.
+    """
+    applications = {}
+    nodes = [getattr(element, 'ast_node', None)] + list(getattr(element, 'extension_ast_nodes', None) or ())
+    for node in nodes:
+        for directive in getattr(node, 'directives', None) or ():
+            arguments = {argument.name.value: print_ast(argument.value) for argument in directive.arguments or ()}
+            applications.setdefault(directive.name.value, []).append(arguments)
+    return applications
+
+
+class AppliedDirectives:
+
+    def __init__(self, old, new, path, coordinate=None):
+        self.old = applied_directives(old)
+        self.new = applied_directives(new)
+        self.path = path
+        self.coordinate = coordinate
+
+    def diff(self):
+        changes = []
+        if not self.old and not self.new:
+            return changes
+
+        for name in sorted((self.old.keys() | self.new.keys()) - IGNORED_DIRECTIVES):
+            old_applications = self.old.get(name, [])
+            new_applications = self.new.get(name, [])
+            if old_applications == new_applications:
+                continue
+
+            if name == CACHE_CONTROL:
+                old_arguments = old_applications[0] if old_applications else None
+                new_arguments = new_applications[0] if new_applications else None
+                changes.append(CacheControlChanged(self.path, old_arguments, new_arguments, self.coordinate))
+            elif len(old_applications) == 1 and len(new_applications) == 1:
+                changes += self.argument_changes(name, old_applications[0], new_applications[0])
+            else:
+                # Repeatable directives are compared as a multiset of applications
+                old_counter = Counter(map(self._key, old_applications))
+                new_counter = Counter(map(self._key, new_applications))
+                changes.extend(
+                    AppliedDirectiveRemoved(self.path, name, dict(key), self.coordinate)
+                    for key in (old_counter - new_counter).elements()
+                )
+                changes.extend(
+                    AppliedDirectiveAdded(self.path, name, dict(key), self.coordinate)
+                    for key in (new_counter - old_counter).elements()
+                )
+
+        return changes
+
+    def argument_changes(self, name, old_arguments, new_arguments):
+        return [
+            AppliedDirectiveArgumentChanged(
+                self.path, name, argument, old_arguments.get(argument), new_arguments.get(argument), self.coordinate
+            )
+            for argument in sorted(old_arguments.keys() | new_arguments.keys())
+            if old_arguments.get(argument) != new_arguments.get(argument)
+        ]
+
+    @staticmethod
+    def _key(arguments: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(arguments.items())
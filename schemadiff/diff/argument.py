@@ -3,6 +3,7 @@ from schemadiff.changes.argument import (
     FieldArgumentTypeChanged,
     FieldArgumentDefaultValueChanged,
 )
+from schemadiff.diff.applied_directive import AppliedDirectives
 
 
 class Argument:
@@ -29,4 +30,8 @@ class Argument:
                 self.type_, self.field_name, self.argument_name, self.old_arg, self.new_arg
             ))
 
+        changes += AppliedDirectives(
+            self.old_arg, self.new_arg,
+            f"{self.type_}.{self.field_name}", f"{self.type_}.{self.field_name}({self.argument_name}:)",
+        ).diff()
         return changes
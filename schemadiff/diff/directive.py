@@ -7,6 +7,7 @@ from schemadiff.changes.directive import (
     DirectiveArgumentDefaultChanged,
     DirectiveArgumentDescriptionChanged,
 )
+from schemadiff.diff import change_order
 
 
 class Directive:
@@ -17,6 +18,7 @@ class Directive:
         self.new_arguments = set(new_directive.args)
 
     def diff(self):
+        """Changes on the directive and its arguments, which all have the path of the directive, by kind"""
         changes = []
         if self.old_directive.description != self.new_directive.description:
             changes.append(DirectiveDescriptionChanged(self.old_directive, self.new_directive))
@@ -28,16 +30,16 @@ class Directive:
         removed = self.old_arguments - self.new_arguments
         added = self.new_arguments - self.old_arguments
         changes.extend(DirectiveArgumentAdded(self.new_directive, argument_name, self.new_directive.args[argument_name])
-                       for argument_name in added)
+                       for argument_name in sorted(added))
         changes.extend(DirectiveArgumentRemoved(self.new_directive, argument_name, self.old_directive.args[argument_name])
-                       for argument_name in removed)
+                       for argument_name in sorted(removed))
 
-        for arg_name in self.old_arguments & self.new_arguments:
+        for arg_name in sorted(self.old_arguments & self.new_arguments):
             old_arg = self.old_directive.args[arg_name]
             new_arg = self.new_directive.args[arg_name]
             changes += DirectiveArgument(self.new_directive, arg_name, old_arg, new_arg).diff()
 
-        return changes
+        return sorted(changes, key=change_order)
 
 
 class DirectiveArgument:
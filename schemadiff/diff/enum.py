@@ -4,32 +4,40 @@ from schemadiff.changes.enum import (
     EnumValueDescriptionChanged,
     EnumValueDeprecationReasonChanged,
 )
+from schemadiff.diff import change_order
+from schemadiff.diff.applied_directive import AppliedDirectives
 
 
 class EnumDiff:
 
     def __init__(self, old_enum, new_enum):
+        self.old_enum = old_enum
         self.enum = new_enum
         self.old_values = old_enum.values
         self.new_values = new_enum.values
 
     def diff(self):
-        changes = []
-        old_values = set(self.old_values)
-        new_values = set(self.new_values)
-
-        added = new_values - old_values
-        removed = old_values - new_values
-        changes.extend(EnumValueAdded(self.enum, value) for value in added)
-        changes.extend(EnumValueRemoved(self.enum, value) for value in removed)
+        """Changes on the enum itself, which include its removed values, and then on each value, by name"""
+        removed = sorted(self.old_values.keys() - self.new_values.keys())
+        changes = [EnumValueRemoved(self.enum, value) for value in removed]
+        changes += AppliedDirectives(self.old_enum, self.enum, self.enum.name).diff()
+        changes.sort(key=change_order)
 
-        common = old_values & new_values
-        for enum_name in common:
-            old_value = self.old_values[enum_name]
-            new_value = self.new_values[enum_name]
-            if old_value.description != new_value.description:
-                changes.append(EnumValueDescriptionChanged(self.enum, enum_name, old_value, new_value))
-            if old_value.deprecation_reason != new_value.deprecation_reason:
-                changes.append(EnumValueDeprecationReasonChanged(self.enum, enum_name, old_value, new_value))
+        for value in sorted(self.new_values):
+            if value not in self.old_values:
+                changes.append(EnumValueAdded(self.enum, value))
+            else:
+                changes += self.value_changes(value)
 
         return changes
+
+    def value_changes(self, enum_name):
+        changes = []
+        old_value = self.old_values[enum_name]
+        new_value = self.new_values[enum_name]
+        if old_value.description != new_value.description:
+            changes.append(EnumValueDescriptionChanged(self.enum, enum_name, old_value, new_value))
+        if old_value.deprecation_reason != new_value.deprecation_reason:
+            changes.append(EnumValueDeprecationReasonChanged(self.enum, enum_name, old_value, new_value))
+        changes += AppliedDirectives(old_value, new_value, f"{self.enum.name}.{enum_name}").diff()
+        return sorted(changes, key=change_order)
@@ -5,6 +5,8 @@ from schemadiff.changes.field import (
     FieldArgumentAdded,
     FieldArgumentRemoved
 )
+from schemadiff.diff import change_order
+from schemadiff.diff.applied_directive import AppliedDirectives
 from schemadiff.diff.argument import Argument
 
 
@@ -19,6 +21,7 @@ class Field:
         self.new_args = set(new_field.args)
 
     def diff(self):
+        """Changes on the field and its arguments, which all have the path of the field, by kind"""
         changes = []
 
         if self.old_field.description != self.new_field.description:
@@ -35,11 +38,11 @@ class Field:
 
         changes.extend(
             FieldArgumentAdded(self.parent, self.field_name, self.new_field, arg_name, self.new_field.args[arg_name])
-            for arg_name in added
+            for arg_name in sorted(added)
         )
         changes.extend(
             FieldArgumentRemoved(self.parent, self.field_name, arg_name)
-            for arg_name in removed
+            for arg_name in sorted(removed)
         )
 
         common_arguments = self.common_arguments()
@@ -48,7 +51,8 @@ class Field:
             new_arg = self.new_field.args[arg_name]
             changes += Argument(self.parent, self.field_name, arg_name, old_arg, new_arg).diff() or []
 
-        return changes
+        changes += AppliedDirectives(self.old_field, self.new_field, f"{self.parent}.{self.field_name}").diff()
+        return sorted(changes, key=change_order)
 
     def common_arguments(self):
-        return self.old_args & self.new_args
+        return sorted(self.old_args & self.new_args)
@@ -5,35 +5,40 @@ from schemadiff.changes.input import (
     InputFieldDefaultChanged,
     InputFieldTypeChanged,
 )
+from schemadiff.diff import change_order
+from schemadiff.diff.applied_directive import AppliedDirectives
 
 
 class InputObjectType:
     def __init__(self, old_type, new_type):
+        self.old_type = old_type
         self.type = new_type
         self.old_fields = old_type.fields
         self.new_fields = new_type.fields
 
     def diff(self):
-        changes = []
-
-        old_field_names = set(self.old_fields)
-        new_field_names = set(self.new_fields)
-
-        added = new_field_names - old_field_names
-        removed = old_field_names - new_field_names
+        """Changes on the input type itself and then on each field, by field name"""
+        changes = sorted(AppliedDirectives(self.old_type, self.type, self.type.name).diff(), key=change_order)
 
-        changes.extend(InputFieldAdded(self.type, field_name, self.new_fields[field_name]) for field_name in added)
-        changes.extend(InputFieldRemoved(self.type, field_name) for field_name in removed)
-
-        common_types = old_field_names & new_field_names
-        for type_name in common_types:
-            old = self.old_fields[type_name]
-            new = self.new_fields[type_name]
-            if str(old.type) != str(new.type):
-                changes.append(InputFieldTypeChanged(self.type, type_name, new, old))
-            if old.description != new.description:
-                changes.append(InputFieldDescriptionChanged(self.type, type_name, new, old))
-            if old.default_value != new.default_value:
-                changes.append(InputFieldDefaultChanged(self.type, type_name, new, old))
+        for field_name in sorted(self.old_fields.keys() | self.new_fields.keys()):
+            if field_name not in self.old_fields:
+                changes.append(InputFieldAdded(self.type, field_name, self.new_fields[field_name]))
+            elif field_name not in self.new_fields:
+                changes.append(InputFieldRemoved(self.type, field_name))
+            else:
+                changes += self.field_changes(field_name)
 
         return changes
+
+    def field_changes(self, field_name):
+        changes = []
+        old = self.old_fields[field_name]
+        new = self.new_fields[field_name]
+        if str(old.type) != str(new.type):
+            changes.append(InputFieldTypeChanged(self.type, field_name, new, old))
+        if old.description != new.description:
+            changes.append(InputFieldDescriptionChanged(self.type, field_name, new, old))
+        if old.default_value != new.default_value:
+            changes.append(InputFieldDefaultChanged(self.type, field_name, new, old))
+        changes += AppliedDirectives(old, new, f"{self.type.name}.{field_name}").diff()
+        return sorted(changes, key=change_order)
@@ -1,29 +1,53 @@
+from schemadiff.changes.field import FieldRenamed
 from schemadiff.changes.interface import InterfaceFieldAdded, InterfaceFieldRemoved
+from schemadiff.diff import change_order
+from schemadiff.diff.applied_directive import AppliedDirectives
 from schemadiff.diff.field import Field
+from schemadiff.renames import match_renamed_fields
 
 
 class InterfaceType:
 
-    def __init__(self, old_interface, new_interface):
+    def __init__(self, old_interface, new_interface, detect_renames=False):
         self.old_face = old_interface
         self.new_face = new_interface
+        self.detect_renames = detect_renames
 
         self.old_fields = set(old_interface.fields)
         self.new_fields = set(new_interface.fields)
 
     def diff(self):
-        changes = []
+        """Changes on the interface itself and then on each field, by field name"""
+        changes = sorted(AppliedDirectives(self.old_face, self.new_face, self.new_face.name).diff(), key=change_order)
+
+        renames = self.renamed_fields()
+        renamed_old_names = set(renames.values())
+        for field_name in sorted(self.old_fields | self.new_fields):
+            if field_name in renames:
+                old_name = renames[field_name]
+                field_changes = Field(
+                    self.new_face, field_name, self.old_face.fields[old_name], self.new_face.fields[field_name]
+                ).diff()
+                changes += sorted([FieldRenamed(self.new_face, old_name, field_name)] + field_changes, key=change_order)
+            elif field_name not in self.old_fields:
+                changes.append(InterfaceFieldAdded(self.new_face, field_name, self.new_face.fields[field_name]))
+            elif field_name not in self.new_fields:
+                if field_name not in renamed_old_names:
+                    changes.append(InterfaceFieldRemoved(self.new_face, field_name))
+            else:
+                old_field = self.old_face.fields[field_name]
+                new_field = self.new_face.fields[field_name]
+                changes += Field(self.new_face, field_name, old_field, new_field).diff()
 
+        return changes
+
+    def renamed_fields(self):
+        """Old names of the fields that look renamed, by their new name"""
+        if not self.detect_renames:
+            return {}
         added = self.new_fields - self.old_fields
         removed = self.old_fields - self.new_fields
-        changes.extend(InterfaceFieldAdded(self.new_face, name, self.new_face.fields[name]) for name in added)
-        changes.extend(InterfaceFieldRemoved(self.new_face, field_name) for field_name in removed)
-
-        common = self.old_fields & self.new_fields
-        for field_name in common:
-            old_field = self.old_face.fields[field_name]
-            new_field = self.new_face.fields[field_name]
-
-            changes += Field(self.new_face, field_name, old_field, new_field).diff() or []
-
-        return changes
+        return {
+            new_name: old_name
+            for old_name, new_name in match_renamed_fields(self.old_face.fields, self.new_face.fields, removed, added)
+        }
@@ -1,13 +1,18 @@
+from schemadiff.changes.field import FieldRenamed
 from schemadiff.changes.object import ObjectTypeFieldAdded, ObjectTypeFieldRemoved
 from schemadiff.changes.interface import NewInterfaceImplemented, DroppedInterfaceImplementation
+from schemadiff.diff import change_order
+from schemadiff.diff.applied_directive import AppliedDirectives
 from schemadiff.diff.field import Field
+from schemadiff.renames import match_renamed_fields
 
 
 class ObjectType:
 
-    def __init__(self, old, new):
+    def __init__(self, old, new, detect_renames=False):
         self.old = old
         self.new = new
+        self.detect_renames = detect_renames
 
         self.old_field_names = set(old.fields)
         self.new_field_names = set(new.fields)
@@ -16,39 +21,53 @@ class ObjectType:
         self.new_interfaces = set(new.interfaces)
 
     def diff(self):
+        """Changes on the type itself and then on each field, by field name"""
         changes = []
+        changes.extend(NewInterfaceImplemented(interface, self.new) for interface in self.added_interfaces())
+        changes.extend(DroppedInterfaceImplementation(interface, self.new) for interface in self.removed_interfaces())
+        changes += AppliedDirectives(self.old, self.new, self.new.name).diff()
+        changes.sort(key=change_order)
 
-        # Added and removed fields
-        added = self.new_field_names - self.old_field_names
-        removed = self.old_field_names - self.new_field_names
-        changes.extend(ObjectTypeFieldAdded(self.new, field_name, self.new.fields[field_name]) for field_name in added)
-        changes.extend(ObjectTypeFieldRemoved(self.new, field_name, self.old.fields[field_name])
-                       for field_name in removed)
-
-        # Added and removed interfaces
-        added = self.added_interfaces()
-        removed = self.removed_interfaces()
-        changes.extend(NewInterfaceImplemented(interface, self.new) for interface in added)
-        changes.extend(DroppedInterfaceImplementation(interface, self.new) for interface in removed)
-
-        for field_name in self.common_fields():
-            old_field = self.old.fields[field_name]
-            new_field = self.new.fields[field_name]
-            changes += Field(self.new, field_name, old_field, new_field).diff() or []
+        renames = self.renamed_fields()
+        renamed_old_names = set(renames.values())
+        for field_name in sorted(self.old_field_names | self.new_field_names):
+            if field_name in renames:
+                old_name = renames[field_name]
+                old_field = self.old.fields[old_name]
+                field_changes = Field(self.new, field_name, old_field, self.new.fields[field_name]).diff()
+                changes += sorted([FieldRenamed(self.new, old_name, field_name)] + field_changes, key=change_order)
+            elif field_name not in self.old_field_names:
+                changes.append(ObjectTypeFieldAdded(self.new, field_name, self.new.fields[field_name]))
+            elif field_name not in self.new_field_names:
+                if field_name not in renamed_old_names:
+                    changes.append(ObjectTypeFieldRemoved(self.new, field_name, self.old.fields[field_name]))
+            else:
+                changes += Field(self.new, field_name, self.old.fields[field_name], self.new.fields[field_name]).diff()
 
         return changes
 
+    def renamed_fields(self):
+        """Old names of the fields that look renamed, by their new name"""
+        if not self.detect_renames:
+            return {}
+        added = self.new_field_names - self.old_field_names
+        removed = self.old_field_names - self.new_field_names
+        return {
+            new_name: old_name
+            for old_name, new_name in match_renamed_fields(self.old.fields, self.new.fields, removed, added)
+        }
+
     def common_fields(self):
-        return self.old_field_names & self.new_field_names
+        return sorted(self.old_field_names & self.new_field_names)
 
     def added_interfaces(self):
         """Compare interfaces equality by name. Internal diffs are solved later"""
         old_interface_names = {str(x) for x in self.old_interfaces}
-        return [interface for interface in self.new_interfaces
+        return [interface for interface in sorted(self.new_interfaces, key=str)
                 if str(interface) not in old_interface_names]
 
     def removed_interfaces(self):
         """Compare interfaces equality by name. Internal diffs are solved later"""
         new_interface_names = {str(x) for x in self.new_interfaces}
-        return [interface for interface in self.old_interfaces
-                if str(interface) not in new_interface_names]
\ No newline at end of file
+        return [interface for interface in sorted(self.old_interfaces, key=str)
+                if str(interface) not in new_interface_names]
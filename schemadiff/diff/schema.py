@@ -1,6 +1,9 @@
+import heapq
 from functools import partial
+from typing import Dict, Iterator
 
 from graphql import (
+    GraphQLNamedType,
     is_enum_type,
     is_union_type,
     is_input_object_type,
@@ -8,6 +11,7 @@ from graphql import (
     is_interface_type,
 )
 
+from schemadiff.changes import Change
 from schemadiff.changes.directive import RemovedDirective, AddedDirective
 from schemadiff.changes.schema import (
     SchemaQueryTypeChanged,
@@ -19,13 +23,16 @@ from schemadiff.changes.type import (
     RemovedType,
     TypeDescriptionChanged,
     TypeKindChanged,
+    TypeRenamed,
 )
+from schemadiff.diff import change_order
 from schemadiff.diff.directive import Directive
 from schemadiff.diff.enum import EnumDiff
 from schemadiff.diff.interface import InterfaceType
 from schemadiff.diff.object_type import ObjectType
 from schemadiff.diff.union_type import UnionType
 from schemadiff.diff.input_object_type import InputObjectType
+from schemadiff.renames import match_renamed_types
 
 
 def _get_type_resolvers():
@@ -65,9 +72,12 @@ class Schema:
     internal_types = {'__Schema', '__Type', '__TypeKind', '__Field', '__InputValue', '__EnumValue',
                       '__Directive', '__DirectiveLocation'}
 
-    def __init__(self, old_schema, new_schema):
+    def __init__(self, old_schema, new_schema, detect_renames=False, scope=None):
         self.old_schema = old_schema
         self.new_schema = new_schema
+        self.detect_renames = detect_renames
+        # A `DiffScope`. Types and directives out of it are never compared
+        self.scope = scope
 
         self.old_types = old_schema.type_map
         self.new_types = new_schema.type_map
@@ -76,11 +86,24 @@ class Schema:
         self.new_directives = new_schema.directives
 
     def diff(self):
-        changes = []
-        changes += self.type_changes()
-        changes += self.directive_changes()
-        changes += self.schema_changes()
-        return changes
+        return list(self.iter_changes())
+
+    def iter_changes(self) -> Iterator[Change]:
+        """Yield the changes type by type, so consumers that only aggregate them never hold them all.
+
+        Directives and types are visited by name and so are their members, so changes come out by path
+        and then kind without sorting them. Root type changes have the path of the new root type and are
+        merged in there.
+        """
+        scope = self.scope
+        steps = [self.iter_type_changes()]
+        if scope is None or scope.compares_directives():
+            steps.append(self.directive_changes())
+        if scope is None or scope.compares_schema_types():
+            steps.append(sorted(self.schema_changes(), key=change_order))
+        for change in heapq.merge(*steps, key=change_order):
+            if scope is None or scope.includes(change):
+                yield change
 
     def schema_changes(self):
         changes = []
@@ -95,64 +118,111 @@ class Schema:
         return changes
 
     def type_changes(self):
-        changes = []
-        changes += self.removed_types()
-        changes += self.added_types()
-        changes += self.common_type_changes()
-        return changes
+        return list(self.iter_type_changes())
+
+    def iter_type_changes(self) -> Iterator[Change]:
+        """Yield the changes of the types added, removed, renamed or changed, one type at a time in name order"""
+        scope = self.scope
+        lists_types = scope is None or scope.lists_types()
+        compares_types = scope is None or scope.compares_types()
+        if not lists_types and not compares_types:
+            return
+
+        old_names = self.old_types.keys() - self.primitives - self.internal_types
+        new_names = self.new_types.keys() - self.primitives - self.internal_types
+        renames = self.renamed_types() if lists_types else {}
+        renamed_old_names = {old_type.name for old_type in renames.values()}
+        for type_name in sorted(old_names | new_names if lists_types else old_names & new_names):
+            if type_name in renamed_old_names or not self.in_scope(type_name):
+                continue
+            old_type = self.old_types.get(type_name)
+            new_type = self.new_types.get(type_name)
+            if type_name in renames:
+                old_type = renames[type_name]
+                yield from heapq.merge(
+                    [TypeRenamed(old_type, new_type)], self.compare_types(old_type, new_type, self.detect_renames),
+                    key=change_order,
+                )
+            elif old_type is None:
+                yield AddedType(new_type)
+            elif new_type is None:
+                yield RemovedType(old_type)
+            elif compares_types:
+                yield from self.compare_types(old_type, new_type, self.detect_renames)
+
+    def renamed_types(self) -> Dict[str, GraphQLNamedType]:
+        """Old types of the added types that look renamed, by the name of the new type"""
+        if not self.detect_renames:
+            return {}
+        renames = match_renamed_types([change.type_ for change in self.removed_types()],
+                                      [change.type for change in self.added_types()])
+        return {new_type.name: old_type for old_type, new_type in renames}
 
     def removed_types(self):
         return [
             RemovedType(self.old_types[field_name])
             for field_name in self.old_types
-            if field_name not in self.new_types and not self.is_primitive(field_name)
+            if field_name not in self.new_types and not self.is_primitive(field_name) and self.in_scope(field_name)
         ]
 
     def added_types(self):
         return [
             AddedType(self.new_types[field_name])
             for field_name in self.new_types
-            if field_name not in self.old_types and not self.is_primitive(field_name)
+            if field_name not in self.old_types and not self.is_primitive(field_name) and self.in_scope(field_name)
         ]
 
     def common_type_changes(self):
+        common_types = (self.old_types.keys() & self.new_types.keys()) - self.primitives - self.internal_types
         changes = []
-
-        common_types = (set(self.old_types.keys()) & set(self.new_types.keys())) - self.primitives - self.internal_types
-        for type_name in common_types:
-            old_type = self.old_types[type_name]
-            new_type = self.new_types[type_name]
-            changes += self.compare_types(old_type, new_type)
-
+        for type_name in sorted(common_types):
+            if self.in_scope(type_name):
+                changes += self.compare_types(self.old_types[type_name], self.new_types[type_name], self.detect_renames)
         return changes
 
     @staticmethod
-    def compare_types(old_type, new_type):
+    def compare_types(old_type, new_type, detect_renames=False):
+        """Changes of a type, by path and then kind"""
         changes = []
         if old_type.description != new_type.description:
             changes.append(TypeDescriptionChanged(new_type.name, old_type.description, new_type.description))
 
         if type_kind(old_type) != type_kind(new_type):
             changes.append(TypeKindChanged(new_type, type_kind(old_type), type_kind(new_type)))
+            return changes
+
+        if is_enum_type(old_type):
+            member_changes = EnumDiff(old_type, new_type).diff()
+        elif is_union_type(old_type):
+            member_changes = UnionType(old_type, new_type).diff()
+        elif is_input_object_type(old_type):
+            member_changes = InputObjectType(old_type, new_type).diff()
+        elif is_object_type(old_type):
+            member_changes = ObjectType(old_type, new_type, detect_renames).diff()
+        elif is_interface_type(old_type):
+            member_changes = InterfaceType(old_type, new_type, detect_renames).diff()
         else:
-            if is_enum_type(old_type):
-                changes += EnumDiff(old_type, new_type).diff()
-            elif is_union_type(old_type):
-                changes += UnionType(old_type, new_type).diff()
-            elif is_input_object_type(old_type):
-                changes += InputObjectType(old_type, new_type).diff()
-            elif is_object_type(old_type):
-                changes += ObjectType(old_type, new_type).diff()
-            elif is_interface_type(old_type):
-                changes += InterfaceType(old_type, new_type).diff()
-
-        return changes
+            member_changes = []
+        # The description change goes among the changes on the type itself, which come first
+        return list(heapq.merge(changes, member_changes, key=change_order))
 
     def directive_changes(self):
+        """Changes of the directives added, removed or changed, by directive name"""
+        old_directives = {directive.name: directive for directive in self.old_directives}
+        new_directives = {directive.name: directive for directive in self.new_directives}
+
         changes = []
-        changes += self.removed_directives()
-        changes += self.added_directives()
-        changes += self.common_directives_changes()
+        for directive_name in sorted(old_directives.keys() | new_directives.keys()):
+            if not self.in_scope(f'@{directive_name}'):
+                continue
+            old_directive = old_directives.get(directive_name)
+            new_directive = new_directives.get(directive_name)
+            if new_directive is None:
+                changes.append(RemovedDirective(old_directive))
+            elif old_directive is None:
+                changes.append(AddedDirective(new_directive, new_directive.locations))
+            else:
+                changes += Directive(old_directive, new_directive).diff()
         return changes
 
     def removed_directives(self):
@@ -160,7 +230,7 @@ class Schema:
         return [
             RemovedDirective(directive)
             for directive in self.old_directives
-            if directive.name not in new_directive_names
+            if directive.name not in new_directive_names and self.in_scope(f'@{directive.name}')
         ]
 
     def added_directives(self):
@@ -168,26 +238,12 @@ class Schema:
         return [
             AddedDirective(directive, directive.locations)
             for directive in self.new_directives
-            if directive.name not in old_directive_names
+            if directive.name not in old_directive_names and self.in_scope(f'@{directive.name}')
         ]
 
-    def common_directives_changes(self):
-        old_directive_names = {x.name for x in self.old_directives}
-        new_directive_names = {x.name for x in self.new_directives}
-        old_directives = {
-            x.name: x
-            for x in self.old_directives
-        }
-        new_directives = {
-            x.name: x
-            for x in self.new_directives
-        }
-
-        changes = []
-        for directive_name in old_directive_names & new_directive_names:
-            changes += Directive(old_directives[directive_name], new_directives[directive_name]).diff()
-
-        return changes
-
     def is_primitive(self, atype):
         return atype in self.primitives
+
+    def in_scope(self, name):
+        """Whether changes on a type or directive (named like `@directive`) may be in the scope of the diff"""
+        return self.scope is None or self.scope.may_include_name(name)
@@ -1,4 +1,5 @@
 from schemadiff.changes.union import UnionMemberAdded, UnionMemberRemoved
+from schemadiff.diff import change_order
 
 
 class UnionType:
@@ -9,15 +10,16 @@ class UnionType:
         self.new_values = new_type.types
 
     def diff(self):
+        """Changes of the members of the union, which are all on the union itself, by kind and then member name"""
         changes = []
 
         old_values = set(x.name for x in self.old_values)
         new_values = set(x.name for x in self.new_values)
 
-        added = new_values - old_values
-        removed = old_values - new_values
+        for value in sorted(old_values ^ new_values):
+            if value in new_values:
+                changes.append(UnionMemberAdded(self.type, value))
+            else:
+                changes.append(UnionMemberRemoved(self.type, value))
 
-        changes.extend(UnionMemberAdded(self.type, value) for value in added)
-        changes.extend(UnionMemberRemoved(self.type, value) for value in removed)
-
-        return changes
\ No newline at end of file
+        return sorted(changes, key=change_order)
@@ -0,0 +1,325 @@
+"""Diff of federated graphs attributed to the subgraphs that own each change.
+
+A supergraph is split into the schema of each of its subgraphs using the `@join__*` metadata
+written by composition, and subgraphs are then compared one by one. Only the subgraphs whose
+schema changed are compared, in parallel when there are many of them, so a change to a single
+subgraph of a large federated graph only costs the diff of that subgraph.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from graphql import (
+    DirectiveDefinitionNode,
+    DocumentNode,
+    EnumTypeDefinitionNode,
+    EnumValueNode,
+    GraphQLSchema,
+    ObjectTypeExtensionNode,
+    SchemaDefinitionNode,
+    SchemaExtensionNode,
+    StringValueNode,
+    TypeDefinitionNode,
+    TypeExtensionNode,
+    Visitor,
+    parse,
+    print_ast,
+    specified_scalar_types,
+    visit,
+)
+from graphql.language import (
+    EnumTypeExtensionNode,
+    InputObjectTypeDefinitionNode,
+    InputObjectTypeExtensionNode,
+    InterfaceTypeDefinitionNode,
+    InterfaceTypeExtensionNode,
+    ObjectTypeDefinitionNode,
+    ScalarTypeDefinitionNode,
+    ScalarTypeExtensionNode,
+    UnionTypeDefinitionNode,
+    UnionTypeExtensionNode,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changeset import ChangeSet
+from schemadiff.diff.schema import Schema
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.scope import DiffScope
+from schemadiff.serialization import dumps_with_violations, loads_with_violations
+
+GRAPH_ENUM = 'join__Graph'
+# Types and directives that only describe the composition itself
+FEDERATION_PREFIXES = ('join__', 'link__', 'core__')
+FEDERATION_DIRECTIVES = {'link', 'core'}
+# Below this amount of changed subgraphs comparing them in the current process is faster than starting a pool
+PARALLEL_THRESHOLD = 8
+
+# Iterating them gives names on recent graphql-core versions and scalar types on older ones
+SPECIFIED_SCALARS = {str(scalar) for scalar in specified_scalar_types}
+EXTENSION_DEFINITIONS = {
+    EnumTypeExtensionNode: EnumTypeDefinitionNode,
+    InputObjectTypeExtensionNode: InputObjectTypeDefinitionNode,
+    InterfaceTypeExtensionNode: InterfaceTypeDefinitionNode,
+    ObjectTypeExtensionNode: ObjectTypeDefinitionNode,
+    ScalarTypeExtensionNode: ScalarTypeDefinitionNode,
+    UnionTypeExtensionNode: UnionTypeDefinitionNode,
+}
+
+
+class InvalidSupergraph(Exception):
+    """Exception raised when a schema lacks the `@join__*` metadata of a composed supergraph"""
+
+
+def extract_subgraphs(supergraph_sdl: str) -> Dict[str, str]:
+    """Split a supergraph into the SDL of each of its subgraphs, mapped by subgraph name.
+
+    Types belong to the subgraphs listed by their `@join__type` directives and fields to the ones
+    listed by their `@join__field` directives, or to every subgraph of their type when they have none.
+    Enum values, union members and implemented interfaces are filtered the same way.
+    Federation directives and types are left out, so every subgraph can be built as a regular schema.
+    """
+    document = parse(supergraph_sdl, no_location=True)
+    graphs = subgraph_names(document)
+    all_graphs = list(graphs)
+
+    by_graph: Dict[str, List] = {graph: [] for graph in all_graphs}
+    root_operations = []
+    for definition in document.definitions:
+        if _is_federation_definition(definition):
+            continue
+        if isinstance(definition, (SchemaDefinitionNode, SchemaExtensionNode)):
+            root_operations.extend(definition.operation_types or ())
+            continue
+        if not isinstance(definition, (TypeDefinitionNode, TypeExtensionNode)):
+            for graph in all_graphs:
+                by_graph[graph].append(_without_federation_directives(definition))
+            continue
+
+        for graph in _graphs(definition, 'join__type') or all_graphs:
+            by_graph[graph].append(_extract_type(definition, graph, all_graphs))
+
+    definitions_by_name = {
+        definition.name.value: _without_federation_directives(definition)
+        for definition in document.definitions
+        if isinstance(definition, TypeDefinitionNode) and not _is_federation_definition(definition)
+    }
+    subgraphs = {}
+    for graph, definitions in by_graph.items():
+        definitions = _with_referenced_types(definitions, definitions_by_name)
+        defined = {definition.name.value for definition in definitions if hasattr(definition, 'name')}
+        operations = tuple(operation for operation in root_operations if operation.type.name.value in defined)
+        if operations:
+            definitions.insert(0, SchemaDefinitionNode(operation_types=operations, directives=()))
+        subgraphs[graphs[graph]] = print_ast(DocumentNode(definitions=tuple(definitions)))
+
+    return subgraphs
+
+
+def subgraph_names(document: DocumentNode) -> Dict[str, str]:
+    """Map the values of the `join__Graph` enum to the name of the subgraph they represent"""
+    for definition in document.definitions:
+        if isinstance(definition, EnumTypeDefinitionNode) and definition.name.value == GRAPH_ENUM:
+            names = {}
+            for value in definition.values or ():
+                graph_directive = _arguments(value, 'join__graph')
+                name = graph_directive[0].get('name') if graph_directive else None
+                names[value.name.value] = name or value.name.value.lower()
+            return names
+
+    raise InvalidSupergraph(f'Schema is not a supergraph. The `{GRAPH_ENUM}` enum is missing')
+
+
+def normalize_subgraph(sdl: str) -> str:
+    """Make the SDL of a subgraph buildable as a regular schema.
+
+    Directives that the document applies but doesn't define, like `@key` or `@shareable`, and `@link`
+    imports are left out, and extensions of types the subgraph doesn't define become definitions.
+    """
+    document = parse(sdl, no_location=True)
+    defined_directives = {
+        definition.name.value for definition in document.definitions if isinstance(definition, DirectiveDefinitionNode)
+    }
+    defined_types = {
+        definition.name.value for definition in document.definitions if isinstance(definition, TypeDefinitionNode)
+    }
+
+    definitions = []
+    for definition in document.definitions:
+        definition = _without_directives(definition, lambda name: name in defined_directives)
+        if isinstance(definition, SchemaExtensionNode) and not definition.operation_types:
+            continue
+        if type(definition) in EXTENSION_DEFINITIONS and definition.name.value not in defined_types:
+            definition = _as_definition(definition)
+            defined_types.add(definition.name.value)
+        definitions.append(definition)
+
+    return print_ast(DocumentNode(definitions=tuple(definitions)))
+
+
+def diff_subgraphs(old_subgraphs: Dict[str, str], new_subgraphs: Dict[str, str], detect_renames: bool = False,
+                   workers: Optional[int] = None, scope: Optional[DiffScope] = None) -> ChangeSet:
+    """Compare two versions of the subgraphs of a federated graph, given as SDL mapped by subgraph name.
+
+    Every change has the name of the subgraph it was found on in its `subgraph` attribute.
+    A change to a type shared by many subgraphs is reported once for each of them.
+    Added and removed subgraphs are compared with an empty schema.
+    Changes are listed by subgraph name, and by path and kind within each subgraph.
+    With a `scope`, only its types and directives are compared in every subgraph.
+    """
+    changed = [
+        name for name in sorted(old_subgraphs.keys() | new_subgraphs.keys())
+        if old_subgraphs.get(name) != new_subgraphs.get(name)
+    ]
+    tasks = [(old_subgraphs.get(name), new_subgraphs.get(name), detect_renames, scope) for name in changed]
+    changes = []
+    for name, subgraph_changes in zip(changed, _diff_all(tasks, workers)):
+        for change in subgraph_changes:
+            change.subgraph = name
+            changes.append(change)
+
+    return ChangeSet.from_changes(changes)
+
+
+def diff_supergraphs(old_sdl: str, new_sdl: str, detect_renames: bool = False,
+                     workers: Optional[int] = None, scope: Optional[DiffScope] = None) -> ChangeSet:
+    """Compare two supergraphs subgraph by subgraph. See `extract_subgraphs` and `diff_subgraphs`"""
+    return diff_subgraphs(extract_subgraphs(old_sdl), extract_subgraphs(new_sdl), detect_renames, workers, scope)
+
+
+def read_subgraphs(paths: Iterable[str]) -> Dict[str, str]:
+    """Read subgraph schema files, named after the file name without its extension"""
+    return {
+        Path(path).stem: normalize_subgraph(sdl)
+        for path, sdl in SchemaLoader.read_paths(paths).items()
+    }
+
+
+def _diff_all(tasks: List[Tuple], workers: Optional[int]) -> Iterable[Iterable[Change]]:
+    if workers == 1 or len(tasks) < PARALLEL_THRESHOLD:
+        return [_diff_subgraph(*task) for task in tasks]
+
+    # Changes reference graphql types that can't be sent between processes, so they are sent encoded
+    # along the rules they violate, which can't be checked on decoded changes
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [loads_with_violations(encoded) for encoded in executor.map(_diff_encoded, tasks)]
+
+
+def _diff_encoded(task: Tuple) -> bytes:
+    return dumps_with_violations(_diff_subgraph(*task))
+
+
+def _diff_subgraph(old_sdl: Optional[str], new_sdl: Optional[str], detect_renames: bool,
+                   scope: Optional[DiffScope] = None) -> List[Change]:
+    old_schema = SchemaLoader.from_sdl(old_sdl) if old_sdl else GraphQLSchema()
+    new_schema = SchemaLoader.from_sdl(new_sdl) if new_sdl else GraphQLSchema()
+    return Schema(old_schema, new_schema, detect_renames, scope).diff()
+
+
+def _is_federation_definition(definition) -> bool:
+    name = getattr(definition, 'name', None)
+    if name is None:
+        return False
+    if isinstance(definition, DirectiveDefinitionNode) and name.value in FEDERATION_DIRECTIVES:
+        return True
+    return name.value.startswith(FEDERATION_PREFIXES)
+
+
+def _is_federation_directive(name: str) -> bool:
+    return name in FEDERATION_DIRECTIVES or name.startswith(FEDERATION_PREFIXES)
+
+
+def _arguments(node, directive_name: str) -> List[Dict[str, object]]:
+    """Arguments of every application of a directive on a node"""
+    applications = []
+    for directive in getattr(node, 'directives', None) or ():
+        if directive.name.value == directive_name:
+            arguments = {}
+            for argument in directive.arguments or ():
+                if isinstance(argument.value, (EnumValueNode, StringValueNode)):
+                    arguments[argument.name.value] = argument.value.value
+                else:
+                    arguments[argument.name.value] = getattr(argument.value, 'value', None)
+            applications.append(arguments)
+    return applications
+
+
+def _graphs(node, directive_name: str) -> List[str]:
+    applications = _arguments(node, directive_name)
+    if any('graph' not in arguments for arguments in applications):
+        return []
+    return list(dict.fromkeys(arguments['graph'] for arguments in applications))
+
+
+def _extract_type(definition, graph: str, all_graphs: List[str]):
+    type_graphs = _graphs(definition, 'join__type') or all_graphs
+    extracted = _without_federation_directives(definition)
+
+    fields = getattr(definition, 'fields', None)
+    if fields is not None:
+        extracted.fields = tuple(
+            _without_federation_directives(field) for field in fields
+            if graph in (_graphs(field, 'join__field') or type_graphs)
+        )
+    values = getattr(definition, 'values', None)
+    if values is not None:
+        extracted.values = tuple(
+            _without_federation_directives(value) for value in values
+            if graph in (_graphs(value, 'join__enumValue') or all_graphs)
+        )
+    members = _arguments(definition, 'join__unionMember')
+    if getattr(definition, 'types', None) is not None and members:
+        names = {arguments.get('member') for arguments in members if arguments.get('graph') == graph}
+        extracted.types = tuple(member for member in definition.types if member.name.value in names)
+    implementations = _arguments(definition, 'join__implements')
+    if getattr(definition, 'interfaces', None) is not None and implementations:
+        names = {arguments.get('interface') for arguments in implementations if arguments.get('graph') == graph}
+        extracted.interfaces = tuple(interface for interface in definition.interfaces if interface.name.value in names)
+
+    return extracted
+
+
+def _without_federation_directives(node):
+    return _without_directives(node, lambda name: not _is_federation_directive(name))
+
+
+def _without_directives(node, keep):
+    """Copy a definition (and its fields, arguments and values) keeping only some applied directives"""
+    node = copy(node)
+    if getattr(node, 'directives', None):
+        node.directives = tuple(directive for directive in node.directives if keep(directive.name.value))
+    for children in ('fields', 'arguments', 'values'):
+        if getattr(node, children, None):
+            setattr(node, children, tuple(_without_directives(child, keep) for child in getattr(node, children)))
+    return node
+
+
+def _as_definition(extension):
+    definition_class = EXTENSION_DEFINITIONS[type(extension)]
+    return definition_class(**{key: getattr(extension, key) for key in extension.keys}, description=None)
+
+
+class _NamedTypesCollector(Visitor):
+    def __init__(self):
+        super().__init__()
+        self.names: Set[str] = set()
+
+    def enter_named_type(self, node, *_args):
+        self.names.add(node.name.value)
+
+
+def _with_referenced_types(definitions: List, definitions_by_name: Dict) -> List:
+    """Add the types that a subgraph references but isn't listed as owner of"""
+    definitions = list(definitions)
+    defined = {definition.name.value for definition in definitions if hasattr(definition, 'name')}
+    pending = definitions
+    while pending:
+        collector = _NamedTypesCollector()
+        visit(DocumentNode(definitions=tuple(pending)), collector)
+        missing = sorted(collector.names - defined - SPECIFIED_SCALARS)
+        pending = [definitions_by_name[name] for name in missing if name in definitions_by_name]
+        defined.update(missing)
+        definitions.extend(pending)
+    return definitions
@@ -0,0 +1,92 @@
+import hashlib
+from typing import Dict, Iterable
+
+from graphql import (
+    GraphQLSchema,
+    GraphQLNamedType,
+    is_introspection_type,
+    is_specified_directive,
+    is_specified_scalar_type,
+    print_ast,
+    print_type,
+)
+from graphql.utilities.print_schema import print_directive, print_schema_definition
+
+
+def sdl_fingerprint(sdl: str) -> str:
+    """Get the md5 hash of a piece of schema definition language"""
+    return hashlib.md5(sdl.encode('utf-8')).hexdigest()
+
+
+def files_fingerprint(paths: Iterable[str], chunk_size: int = 1024 * 1024) -> str:
+    """Get the `sdl_fingerprint` of the content of many files joined by new lines, reading them by chunks"""
+    md5 = hashlib.md5()
+    for i, path in enumerate(paths):
+        if i:
+            md5.update(b'\n')
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                md5.update(chunk)
+    return md5.hexdigest()
+
+
+def print_member(type_: GraphQLNamedType) -> str:
+    """Print the SDL of a named type including the directives applied on it and its members.
+
+    Types built from SDL are printed from their AST nodes, since `print_type` leaves out applied directives.
+    """
+    if type_.ast_node is None:
+        return print_type(type_)
+    return '\n\n'.join(print_ast(node) for node in [type_.ast_node, *type_.extension_ast_nodes])
+
+
+def type_fingerprint(type_: GraphQLNamedType) -> str:
+    """Get a structural hash of a named type.
+
+    The hash is computed over the SDL `print_type` gives for the type, where default values
+    are coerced, plus the SDL printed from the type's AST nodes, which keeps the directives
+    applied on the type and its members. Two types with the same fingerprint are guaranteed
+    to produce no changes when compared.
+    """
+    sdl = print_type(type_)
+    if type_.ast_node is not None:
+        sdl += '\n\n' + print_member(type_)
+    return sdl_fingerprint(sdl)
+
+
+def schema_fingerprints(schema: GraphQLSchema) -> Dict[str, str]:
+    """Map every user defined type of a schema to its fingerprint"""
+    return {
+        name: type_fingerprint(type_)
+        for name, type_ in schema.type_map.items()
+        if not name.startswith('__')
+    }
+
+
+def schema_members(schema: GraphQLSchema) -> Dict[str, str]:
+    """Map every user defined type and directive of a schema to its canonical SDL.
+
+    Directives are keyed by their name prefixed with `@` so they never clash with type names.
+    Built-in scalars, directives and introspection types are left out.
+    """
+    members = {
+        name: print_member(type_)
+        for name, type_ in schema.type_map.items()
+        if not is_specified_scalar_type(type_) and not is_introspection_type(type_)
+    }
+    members.update(
+        (f'@{directive.name}', print_directive(directive))
+        for directive in schema.directives
+        if not is_specified_directive(directive)
+    )
+    return members
+
+
+def print_schema_sdl(schema: GraphQLSchema) -> str:
+    """Print the SDL of a schema including the directives applied on it and its members.
+
+    Unlike `print_schema`, schemas that only differ in their applied directives are printed differently.
+    """
+    schema_nodes = [node for node in [schema.ast_node, *schema.extension_ast_nodes] if node is not None]
+    definitions = [print_ast(node) for node in schema_nodes] or list(filter(None, [print_schema_definition(schema)]))
+    return '\n\n'.join([*definitions, *schema_members(schema).values()])
@@ -1,8 +1,24 @@
 import json
 import os
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional, TextIO
+from xml.sax.saxutils import escape, quoteattr
 
 from schemadiff.changes import CriticalityLevel, Change
+from schemadiff.changeset import ChangeSet
+
+LEVEL_NAMES = {
+    CriticalityLevel.Breaking: 'breaking',
+    CriticalityLevel.Dangerous: 'dangerous',
+    CriticalityLevel.NonBreaking: 'safe',
+}
+# Changes on directives have no type in their path
+NO_TYPE_GROUP = 'Directives'
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_LEVELS = {
+    CriticalityLevel.Breaking: 'error',
+    CriticalityLevel.Dangerous: 'warning',
+    CriticalityLevel.NonBreaking: 'note',
+}
 
 
 def format_diff(changes: List[Change]) -> str:
@@ -14,6 +30,27 @@ def format_diff(changes: List[Change]) -> str:
     return changes or '🎉 Both schemas are equal!'
 
 
+def format_diff_by_type(changes: List[Change]) -> str:
+    """Format changes grouped by the type of their path, each group headed by its amount of changes per level"""
+    changes = ChangeSet.from_changes(changes)
+    if not changes:
+        return format_diff(changes)
+
+    sections = []
+    for type_name, group in changes.group_by('type').items():
+        summary = ', '.join(f'{amount} {level_name}' for level_name, amount in level_summary(group).items())
+        lines = [f"{type_name or NO_TYPE_GROUP}: {summary}"]
+        lines.extend(f"  {format_change_by_criticality(change)}" for change in group)
+        sections.append('\n'.join(lines))
+    return '\n\n'.join(sections)
+
+
+def level_summary(changes: ChangeSet) -> Dict[str, int]:
+    """Count the `breaking`, `dangerous` and `safe` changes"""
+    levels = changes.counts('level')
+    return {level_name: levels.get(level, 0) for level, level_name in LEVEL_NAMES.items()}
+
+
 def format_change_by_criticality(change: Change) -> str:
     icon_by_criticality = {
         CriticalityLevel.Breaking: os.getenv('SD_BREAKING_CHANGE_ICON', '❌'),
@@ -23,12 +60,28 @@ def format_change_by_criticality(change: Change) -> str:
     icon = icon_by_criticality[change.criticality.level]
     if change.restricted is not None:
         return f"⛔ {change.restricted}"
-    return f"{icon} {change.message}"
 
+    message = change.message if change.subgraph is None else f"[{change.subgraph}] {change.message}"
+    if change.reachable is False:
+        message = f"{message} (unreachable)"
+    if change.affected_roots is not None:
+        message = f"{message} ({change.affected_roots} affected root fields)"
+    if change.affected_operations is not None:
+        return f"{icon} {message} ({len(change.affected_operations)} affected operations)"
+    return f"{icon} {message}"
 
-def print_diff(changes: List[Change]) -> None:
+
+def format_delta(appeared: List[Change], disappeared: List[Change]) -> str:
+    """Format the changes that appeared (+) and disappeared (-) between two results"""
+    return '\n'.join(
+        [f"+ {format_change_by_criticality(change)}" for change in appeared]
+        + [f"- {format_change_by_criticality(change)}" for change in disappeared]
+    )
+
+
+def print_diff(changes: List[Change], group_by_type: bool = False) -> None:
     """Pretty print a list of changes"""
-    print(format_diff(changes))
+    print(format_diff_by_type(changes) if group_by_type else format_diff(changes))
 
 
 def changes_to_dict(changes: List[Change]) -> List[dict]:
@@ -38,9 +91,84 @@ def changes_to_dict(changes: List[Change]) -> List[dict]:
     ]
 
 
-def json_dump_changes(changes: List[Change]) -> str:
-    return json.dumps(changes_to_dict(changes), indent=4)
+def changes_by_type_to_dict(changes: List[Change]) -> List[dict]:
+    """Represent changes grouped by the type of their path, with the amount of changes per level of each group"""
+    return [
+        {'type': type_name, 'summary': level_summary(group), 'changes': changes_to_dict(group)}
+        for type_name, group in ChangeSet.from_changes(changes).group_by('type').items()
+    ]
+
+
+def json_dump_changes(changes: List[Change], group_by_type: bool = False) -> str:
+    representation = changes_by_type_to_dict(changes) if group_by_type else changes_to_dict(changes)
+    return json.dumps(representation, indent=4)
+
+
+def print_json(changes: List[Change], group_by_type: bool = False) -> None:
+    print(json_dump_changes(changes, group_by_type))
+
+
+def write_sarif(changes: Iterable[Change], stream: TextIO, locate: Optional[Callable] = None) -> None:
+    """Write changes as a SARIF log, one result at a time.
+
+    Args:
+        locate: Function that gets the `Location` of the schema member of a change, if known
+    """
+    stream.write(
+        '{"version": "2.1.0", "$schema": ' + json.dumps(SARIF_SCHEMA) + ', "runs": [{'
+        '"tool": {"driver": {"name": "schemadiff", '
+        '"informationUri": "https://github.com/Ambro17/graphql-schema-diff"}}, "results": ['
+    )
+    for position, change in enumerate(changes):
+        result = {
+            'ruleId': change.kind,
+            'level': SARIF_LEVELS[change.criticality.level],
+            'message': {'text': change.message},
+            'partialFingerprints': {'schemadiff/checksum': change.checksum()},
+            'properties': {
+                'path': change.path,
+                'criticality': change.criticality.level.value,
+                'reason': change.criticality.reason,
+            },
+        }
+        location = locate(change) if locate else None
+        if location is not None:
+            result['locations'] = [{'physicalLocation': {
+                'artifactLocation': {'uri': location.file.replace(os.sep, '/')},
+                'region': {'startLine': location.line, 'startColumn': location.column},
+            }}]
+        stream.write((',\n' if position else '\n') + json.dumps(result))
+    stream.write('\n]}]}\n')
+
+
+def write_junit(changes: Iterable[Change], stream: TextIO, locate: Optional[Callable] = None) -> None:
+    """Write changes as a JUnit report, one test case at a time. Breaking and dangerous changes are failures.
+
+    Args:
+        locate: Function that gets the `Location` of the schema member of a change, if known
+    """
+    suite_attributes = ''
+    if isinstance(changes, ChangeSet):
+        # Totals go before the test cases. They are only known up front for change sets, from their columns
+        levels = changes.counts('level')
+        failures = levels.get(CriticalityLevel.Breaking, 0) + levels.get(CriticalityLevel.Dangerous, 0)
+        suite_attributes = f' tests="{len(changes)}" failures="{failures}"'
 
+    stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    stream.write(f'<testsuites name="schemadiff">\n<testsuite name="schemadiff"{suite_attributes}>\n')
+    for change in changes:
+        location = locate(change) if locate else None
+        attributes = f'classname={quoteattr(change.path or change.kind)} name={quoteattr(change.message)}'
+        if location is not None:
+            attributes += f' file={quoteattr(location.file)} line="{location.line}"'
+        if change.safe:
+            stream.write(f'<testcase {attributes}/>\n')
+            continue
 
-def print_json(changes: List[Change]) -> None:
-    print(json_dump_changes(changes))
+        details = change.message if location is None else f'{change.message}\n{location}'
+        stream.write(
+            f'<testcase {attributes}>'
+            f'<failure type={quoteattr(change.criticality.level.value)} message={quoteattr(change.criticality.reason)}>'
+            f'{escape(details)}</failure></testcase>\n'
+        )
+    stream.write('</testsuite>\n</testsuites>\n')
@@ -0,0 +1,155 @@
+import json
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from graphql import GraphQLSchema, is_schema
+
+from schemadiff.changes import Change, CriticalityLevel
+from schemadiff.diff.schema import Schema
+from schemadiff.fingerprint import print_schema_sdl
+from schemadiff.schema_loader import SchemaLoader
+
+INDEX_FORMAT_VERSION = 1
+CRITICALITY_LEVELS = list(CriticalityLevel)
+
+
+class InvalidHistoryIndex(Exception):
+    """Exception raised when a persisted history index can't be read"""
+
+
+@dataclass(frozen=True)
+class HistoryEvent:
+    version: str
+    """Version that introduced the change"""
+    kind: str
+    """Name of the `Change` class"""
+    criticality: CriticalityLevel
+
+
+class HistoryIndex:
+    """Index of the changes every schema coordinate went through along a series of schema versions.
+
+    Each coordinate (`Type`, `Type.field`, `Type.field(arg:)`, `@directive(arg:)`) maps to a list of
+    compact `(version, kind, criticality)` records, with versions and change kinds interned,
+    so answering "when did this change" is a dictionary lookup instead of diffing the history again.
+
+    Usage:
+        >>> index = HistoryIndex.from_versions([('1.0', sdl_v1), ('1.1', sdl_v2)])
+        >>> index.append('1.2', sdl_v3)
+        >>> index.history('Query.orders(status:)')
+        >>> index.save('history.json')
+    """
+
+    def __init__(self):
+        self.versions: List[str] = []
+        self.kinds: List[str] = []
+        self.events: Dict[str, List[Tuple[int, int, int]]] = {}
+        self._kind_ids: Dict[str, int] = {}
+        self._last_schema: Optional[GraphQLSchema] = None
+        self._last_sdl: Optional[str] = None
+        self._sorted_coordinates: Optional[List[str]] = None
+
+    @classmethod
+    def from_versions(cls, versions: Iterable[Tuple[str, Union[str, GraphQLSchema]]]) -> 'HistoryIndex':
+        """Build an index from an ordered series of `(version, schema)` pairs"""
+        index = cls()
+        for version, schema in versions:
+            index.append(version, schema)
+        return index
+
+    def append(self, version: str, schema: Union[str, GraphQLSchema]) -> List[Change]:
+        """Record the changes introduced by a new version, diffing it only against the latest one.
+
+        The first version appended is the baseline and has no changes.
+        """
+        sdl = None if is_schema(schema) else schema
+        schema = schema if is_schema(schema) else SchemaLoader.from_sdl(schema)
+        changes = Schema(self._last_schema, schema).diff() if self._last_schema is not None else []
+
+        version_id = len(self.versions)
+        self.versions.append(version)
+        for change in changes:
+            events = self.events.setdefault(change.coordinate, [])
+            events.append((version_id, self._kind_id(change), CRITICALITY_LEVELS.index(change.criticality.level)))
+
+        self._last_schema = schema
+        self._last_sdl = sdl
+        self._sorted_coordinates = None
+        return changes
+
+    def history(self, coordinate: str, include_nested: bool = False) -> List[HistoryEvent]:
+        """Get the changes of a schema coordinate in version order.
+
+        With `include_nested` the changes of its members are included too,
+        i.e. the history of `Query` would also contain the one of `Query.orders(status:)`
+        """
+        if not include_nested:
+            return [self._event(record) for record in self.events.get(coordinate, ())]
+
+        records = []
+        for nested in self._nested_coordinates(coordinate):
+            records += self.events[nested]
+        return [self._event(record) for record in sorted(records)]
+
+    def save(self, path: str) -> None:
+        last_sdl = self._last_sdl
+        if last_sdl is None and self._last_schema is not None:
+            last_sdl = print_schema_sdl(self._last_schema)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format': INDEX_FORMAT_VERSION,
+                'versions': self.versions,
+                'kinds': self.kinds,
+                'events': self.events,
+                'last_schema': last_sdl,
+            }, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'HistoryIndex':
+        """Read an index written by `save`. New versions can still be appended to it"""
+        with open(path, encoding='utf-8') as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise InvalidHistoryIndex("Invalid json format provided.") from e
+        if not isinstance(data, dict) or data.get('format') != INDEX_FORMAT_VERSION:
+            raise InvalidHistoryIndex(f"Unsupported history index format. Expected version {INDEX_FORMAT_VERSION}")
+
+        index = cls()
+        index.versions = data['versions']
+        index.kinds = data['kinds']
+        index._kind_ids = {kind: kind_id for kind_id, kind in enumerate(index.kinds)}
+        index.events = {
+            coordinate: [tuple(record) for record in records]
+            for coordinate, records in data['events'].items()
+        }
+        if data['last_schema'] is not None:
+            index._last_sdl = data['last_schema']
+            index._last_schema = SchemaLoader.from_sdl(index._last_sdl)
+        return index
+
+    def _kind_id(self, change: Change) -> int:
+        kind = change.kind
+        if kind not in self._kind_ids:
+            self._kind_ids[kind] = len(self.kinds)
+            self.kinds.append(kind)
+        return self._kind_ids[kind]
+
+    def _event(self, record: Tuple[int, int, int]) -> HistoryEvent:
+        version_id, kind_id, level_id = record
+        return HistoryEvent(self.versions[version_id], self.kinds[kind_id], CRITICALITY_LEVELS[level_id])
+
+    def _nested_coordinates(self, coordinate: str) -> List[str]:
+        if self._sorted_coordinates is None:
+            self._sorted_coordinates = sorted(self.events)
+
+        coordinates = self._sorted_coordinates
+        nested = [coordinate] if coordinate in self.events else []
+        for separator in ('.', '('):
+            prefix = coordinate + separator
+            position = bisect_left(coordinates, prefix)
+            while position < len(coordinates) and coordinates[position].startswith(prefix):
+                nested.append(coordinates[position])
+                position += 1
+        return nested
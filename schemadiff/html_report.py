@@ -0,0 +1,206 @@
+"""Self-contained HTML report of a diff, for browsing very large results.
+
+The changes are embedded in the page column-wise, like a `ChangeSet` stores them: small integer
+columns of kinds, levels, types and ids of interned paths and reasons, plus the column of messages.
+The page renders only the rows of the table in view, and filters by criticality, kind of change
+and schema type by scanning those columns, so it opens instantly even for huge diffs.
+"""
+import json
+from typing import Callable, Dict, Iterable, List, Optional, TextIO
+
+from schemadiff.changes import Change
+from schemadiff.changeset import CRITICALITY_LEVELS, ChangeSet, path_type
+
+
+def report_data(changes: Iterable[Change], locate: Optional[Callable] = None) -> dict:
+    """Get the columns of the changes embedded in the report.
+
+    Args:
+        locate: Function that gets the `Location` of the schema member of a change, if known.
+            It is called once per distinct path and coordinate
+    """
+    changes = ChangeSet.from_changes(changes)
+    strings: List[Optional[str]] = []
+    string_ids: Dict[Optional[str], int] = {}
+
+    def intern(string: Optional[str]) -> int:
+        if string not in string_ids:
+            string_ids[string] = len(strings)
+            strings.append(string)
+        return string_ids[string]
+
+    paths = [intern(changes.strings[string_id]) for string_id in changes.path_column]
+    # Types of the changes, found once per distinct path. Changes without a path have no type (-1)
+    types: List[str] = []
+    type_ids: Dict[str, int] = {}
+    path_types: Dict[int, int] = {}
+    for string_id in changes.path_column:
+        if string_id not in path_types:
+            type_name = path_type(changes.strings[string_id])
+            if type_name and type_name not in type_ids:
+                type_ids[type_name] = len(types)
+                types.append(type_name)
+            path_types[string_id] = type_ids.get(type_name, -1)
+    reasons = [intern(changes.strings[string_id]) for string_id in changes.reason_column]
+    locations = []
+    if locate is not None:
+        located: Dict[tuple, int] = {}
+        for index in range(len(changes)):
+            key = (changes.path_column[index], changes.coordinate_column[index])
+            if key not in located:
+                location = locate(changes[index])
+                located[key] = -1 if location is None else intern(str(location))
+            locations.append(located[key])
+
+    return {
+        'levels': [level.value for level in CRITICALITY_LEVELS],
+        'kinds': changes.kinds,
+        'types': types,
+        'strings': strings,
+        'level': list(changes.level_column),
+        'kind': list(changes.kind_column),
+        'path': paths,
+        'type': [path_types[string_id] for string_id in changes.path_column],
+        'reason': reasons,
+        'location': locations,
+        'message': [changes.message(index) for index in range(len(changes))],
+    }
+
+
+def write_html(changes: Iterable[Change], stream: TextIO, locate: Optional[Callable] = None) -> None:
+    """Write changes as a single static HTML page with a filterable table.
+
+    Args:
+        locate: Function that gets the `Location` of the schema member of a change, if known
+    """
+    data = json.dumps(report_data(changes, locate), separators=(',', ':'))
+    # The data lives in a script element, which would end at the first `</`
+    data = data.replace('</', '<\\/')
+    stream.write(PAGE_START)
+    stream.write(data)
+    stream.write(PAGE_END)
+
+
+PAGE_START = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Schema diff</title>
+<style>
+body { font-family: system-ui, sans-serif; margin: 0; display: flex; flex-direction: column; height: 100vh; }
+header { padding: 8px 12px; border-bottom: 1px solid #ddd; display: flex; gap: 12px; align-items: center;
+         flex-wrap: wrap; }
+header h1 { font-size: 16px; margin: 0 8px 0 0; }
+#viewport { flex: 1; overflow-y: auto; position: relative; }
+#spacer { position: relative; }
+.row { position: absolute; left: 0; right: 0; height: 24px; line-height: 24px; display: flex; font-size: 13px;
+       border-bottom: 1px solid #f0f0f0; white-space: nowrap; }
+.row > span { overflow: hidden; text-overflow: ellipsis; padding: 0 6px; }
+.level { width: 80px; flex: none; font-weight: 600; }
+.kind { width: 220px; flex: none; color: #555; }
+.path { width: 260px; flex: none; font-family: monospace; }
+.message { flex: 1; }
+.location { width: 220px; flex: none; color: #777; font-family: monospace; }
+.BREAKING .level { color: #c62828; }
+.DANGEROUS .level { color: #ef6c00; }
+.NON_BREAKING .level { color: #2e7d32; }
+</style>
+</head>
+<body>
+<header>
+<h1>Schema diff</h1>
+<label><input type="checkbox" class="level-filter" value="2" checked> breaking</label>
+<label><input type="checkbox" class="level-filter" value="1" checked> dangerous</label>
+<label><input type="checkbox" class="level-filter" value="0" checked> safe</label>
+<select id="kind-filter"><option value="">All kinds of change</option></select>
+<select id="type-filter"><option value="">All types</option></select>
+<input id="search" type="search" placeholder="Search paths and messages">
+<span id="count"></span>
+</header>
+<div id="viewport"><div id="spacer"></div></div>
+<script id="data" type="application/json">'''
+
+PAGE_END = '''</script>
+<script>
+(function () {
+  var ROW_HEIGHT = 24, OVERSCAN = 20;
+  var data = JSON.parse(document.getElementById('data').textContent);
+  var size = data.level.length;
+  var labels = ['safe', 'dangerous', 'breaking'];
+
+  function message(index) { return data.message[index]; }
+  function fill(select, names) {
+    names.map(function (name, id) { return [name, id]; })
+      .filter(function (entry) { return entry[0]; })
+      .sort(function (a, b) { return a[0] < b[0] ? -1 : 1; })
+      .forEach(function (entry) { select.add(new Option(entry[0], entry[1])); });
+  }
+  fill(document.getElementById('kind-filter'), data.kinds);
+  fill(document.getElementById('type-filter'), data.types);
+
+  var viewport = document.getElementById('viewport'), spacer = document.getElementById('spacer');
+  var visible = new Int32Array(0);
+
+  function applyFilters() {
+    var levels = {};
+    document.querySelectorAll('.level-filter').forEach(function (box) { levels[box.value] = box.checked; });
+    var kind = document.getElementById('kind-filter').value, type = document.getElementById('type-filter').value;
+    var search = document.getElementById('search').value.toLowerCase();
+    var matches = new Int32Array(size), count = 0;
+    for (var index = 0; index < size; index++) {
+      if (!levels[data.level[index]]) continue;
+      if (kind !== '' && data.kind[index] !== +kind) continue;
+      if (type !== '' && data.type[index] !== +type) continue;
+      if (search && (data.strings[data.path[index]] || '').toLowerCase().indexOf(search) < 0 &&
+          message(index).toLowerCase().indexOf(search) < 0) continue;
+      matches[count++] = index;
+    }
+    visible = matches.subarray(0, count);
+    document.getElementById('count').textContent = count + ' of ' + size + ' changes';
+    spacer.style.height = (count * ROW_HEIGHT) + 'px';
+    render(true);
+  }
+
+  function cell(className, text) {
+    var span = document.createElement('span');
+    span.className = className;
+    span.textContent = text;
+    span.title = text;
+    return span;
+  }
+
+  var rendered = [-1, -1];
+  function render(force) {
+    var first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+    var bottom = Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT);
+    var last = Math.min(visible.length, bottom + OVERSCAN);
+    if (!force && first === rendered[0] && last === rendered[1]) return;
+    rendered = [first, last];
+    var rows = document.createDocumentFragment();
+    for (var position = first; position < last; position++) {
+      var index = visible[position], row = document.createElement('div');
+      row.className = 'row ' + data.levels[data.level[index]];
+      row.style.top = (position * ROW_HEIGHT) + 'px';
+      row.appendChild(cell('level', labels[data.level[index]]));
+      row.appendChild(cell('kind', data.kinds[data.kind[index]]));
+      row.appendChild(cell('path', data.strings[data.path[index]] || ''));
+      row.appendChild(cell('message', message(index)));
+      var location = data.location.length ? data.location[index] : -1;
+      row.appendChild(cell('location', location < 0 ? '' : data.strings[location]));
+      row.title = data.strings[data.reason[index]] || '';
+      rows.appendChild(row);
+    }
+    spacer.replaceChildren(rows);
+  }
+
+  document.querySelectorAll('header input, header select').forEach(function (control) {
+    control.addEventListener('input', applyFilters);
+  });
+  viewport.addEventListener('scroll', function () { render(false); });
+  window.addEventListener('resize', function () { render(true); });
+  applyFilters();
+})();
+</script>
+</body>
+</html>
+'''
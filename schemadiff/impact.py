@@ -0,0 +1,214 @@
+"""Root fields a change may affect through the types that reference each other.
+
+A breaking change on `Money.amount` affects every query reaching `Money`, like `Query.order`
+through `Order.total`. The reverse type-reference graph (the fields, arguments and abstract types
+leading to each type) is built once per schema, and the root fields leading to every type are
+computed in a single depth-first pass over its strongly connected components, as bitsets.
+Sample paths are found with a breadth-first search towards the roots which follows a bounded
+amount of referrers per type, so highly connected schemas stay cheap.
+"""
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from graphql import (
+    GraphQLSchema,
+    get_named_type,
+    is_abstract_type,
+    is_input_object_type,
+    is_interface_type,
+    is_object_type,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changeset import path_type
+
+SAMPLE_PATHS = 3
+# Referrers followed per type when looking for sample paths
+MAX_FANOUT = 16
+
+# Referrer of a type: the parent type and the coordinate of its member that leads to the type.
+# Abstract types lead to their possible types without going through a member.
+Referrer = Tuple[str, Optional[str]]
+
+
+class ImpactIndex:
+    """Reverse type-reference graph of a schema"""
+
+    def __init__(self, schema: GraphQLSchema, samples: int = SAMPLE_PATHS, max_fanout: int = MAX_FANOUT):
+        self.schema = schema
+        self.samples = samples
+        self.max_fanout = max_fanout
+        self.root_types = {
+            root.name: root for root in (schema.query_type, schema.mutation_type, schema.subscription_type)
+            if root is not None
+        }
+        self.root_fields: List[str] = [
+            f'{root.name}.{name}' for root in self.root_types.values() for name in root.fields
+        ]
+        self._root_bits = {coordinate: 1 << bit for bit, coordinate in enumerate(self.root_fields)}
+        self.referrers = self._build_referrers()
+        self._masks: Dict[str, int] = {}
+        self._compute_masks()
+        self._sample_paths: Dict[str, List[Tuple[str, ...]]] = {}
+
+    def _build_referrers(self) -> Dict[str, List[Referrer]]:
+        referrers: Dict[str, List[Referrer]] = {}
+        for type_ in self.schema.type_map.values():
+            if type_.name.startswith('__'):
+                continue
+            if is_object_type(type_) or is_interface_type(type_):
+                for name, field in type_.fields.items():
+                    coordinate = f'{type_.name}.{name}'
+                    referrers.setdefault(get_named_type(field.type).name, []).append((type_.name, coordinate))
+                    for arg_name, argument in field.args.items():
+                        referrers.setdefault(get_named_type(argument.type).name, []).append(
+                            (type_.name, f'{coordinate}({arg_name}:)')
+                        )
+            elif is_input_object_type(type_):
+                for name, field in type_.fields.items():
+                    referrers.setdefault(get_named_type(field.type).name, []).append(
+                        (type_.name, f'{type_.name}.{name}')
+                    )
+            if is_abstract_type(type_):
+                for possible in self.schema.get_possible_types(type_):
+                    referrers.setdefault(possible.name, []).append((type_.name, None))
+        return referrers
+
+    def _root_bit(self, coordinate: str) -> int:
+        # Arguments of root fields affect the root field itself
+        return self._root_bits.get(coordinate.split('(')[0], 0)
+
+    def _compute_masks(self) -> None:
+        """Compute the bitset of root fields leading to each type.
+
+        Types referencing each other in cycles share the same root fields, so the masks are
+        computed per strongly connected component of the reverse graph (iterative Tarjan).
+        Components are completed after all the components they depend on, so each one is visited once.
+        """
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        for start in self.schema.type_map:
+            if start in index:
+                continue
+            index[start] = low[start] = len(index)
+            stack.append(start)
+            on_stack.add(start)
+            work = [(start, iter(self.referrers.get(start, ())))]
+            while work:
+                node, parents = work[-1]
+                for parent, _ in parents:
+                    if parent not in index:
+                        index[parent] = low[parent] = len(index)
+                        stack.append(parent)
+                        on_stack.add(parent)
+                        work.append((parent, iter(self.referrers.get(parent, ()))))
+                        break
+                    if parent in on_stack:
+                        low[node] = min(low[node], index[parent])
+                else:
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        low[caller] = min(low[caller], low[node])
+                    if low[node] == index[node]:
+                        self._complete_component(node, stack, on_stack)
+
+    def _complete_component(self, node: str, stack: List[str], on_stack: Set[str]) -> None:
+        members = []
+        while True:
+            member = stack.pop()
+            on_stack.discard(member)
+            members.append(member)
+            if member == node:
+                break
+
+        mask = 0
+        for member in members:
+            for parent, coordinate in self.referrers.get(member, ()):
+                if parent in self.root_types:
+                    mask |= self._root_bit(coordinate)
+                else:
+                    # Parents in the same component don't have a mask yet and add nothing new
+                    mask |= self._masks.get(parent, 0)
+        for member in members:
+            self._masks[member] = mask
+
+    def affected_roots(self, path: str) -> List[str]:
+        """Get the root field coordinates leading to the type of a change path"""
+        type_name = path_type(path)
+        if type_name in self.root_types:
+            if path != type_name:
+                return [path.split('(')[0]]
+            mask = self._masks.get(type_name, 0)
+            mask |= sum(self._root_bits[f'{type_name}.{name}'] for name in self.root_types[type_name].fields)
+        else:
+            mask = self._masks.get(type_name, 0)
+        return [coordinate for coordinate, bit in self._root_bits.items() if mask & bit]
+
+    def affected_roots_count(self, path: str) -> int:
+        type_name = path_type(path)
+        if type_name in self.root_types:
+            return len(self.affected_roots(path))
+        return bin(self._masks.get(type_name, 0)).count('1')
+
+    def sample_paths(self, type_name: str) -> List[Tuple[str, ...]]:
+        """Find up to `samples` of the shortest chains of coordinates from a root field to a type"""
+        if type_name not in self._sample_paths:
+            self._sample_paths[type_name] = self._search_paths(type_name)
+        return self._sample_paths[type_name]
+
+    def _search_paths(self, type_name: str) -> List[Tuple[str, ...]]:
+        paths = []
+        visited = {type_name}
+        queue = deque([(type_name, ())])
+        while queue and len(paths) < self.samples:
+            node, path = queue.popleft()
+            for parent, coordinate in self.referrers.get(node, ())[:self.max_fanout]:
+                step = path if coordinate is None else (coordinate,) + path
+                if parent in self.root_types:
+                    paths.append(step)
+                    if len(paths) == self.samples:
+                        break
+                elif parent not in visited:
+                    visited.add(parent)
+                    queue.append((parent, step))
+        return paths
+
+    def impact(self, change: Change) -> Tuple[int, List[str]]:
+        """Get the amount of root fields affected by a change and some paths from them to the change"""
+        type_name = path_type(change.path)
+        if not type_name or type_name not in self.schema.type_map:
+            return 0, []
+        if type_name in self.root_types:
+            return self.affected_roots_count(change.path), []
+
+        member = change.coordinate if change.coordinate != type_name else None
+        paths = [
+            ' > '.join(path + (member,) if member else path)
+            for path in self.sample_paths(type_name)
+        ]
+        return self.affected_roots_count(change.path), paths
+
+
+def annotate_impact(changes: List[Change], old_schema: GraphQLSchema, new_schema: GraphQLSchema) -> List[Change]:
+    """Set the `affected_roots` and `impact_paths` of changes on types of either schema.
+
+    The new schema is used for the types it has, and the old one for removed types.
+    """
+    new_index = ImpactIndex(new_schema)
+    old_index = None
+    for change in changes:
+        type_name = path_type(change.path)
+        if not type_name:
+            continue
+        if type_name in new_schema.type_map:
+            index = new_index
+        elif type_name in old_schema.type_map:
+            old_index = old_index or ImpactIndex(old_schema)
+            index = old_index
+        else:
+            continue
+        change.affected_roots, change.impact_paths = index.impact(change)
+    return changes
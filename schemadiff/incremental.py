@@ -0,0 +1,177 @@
+import heapq
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from graphql import (
+    GraphQLSchema,
+    DirectiveDefinitionNode,
+    DocumentNode,
+    Undefined,
+    build_ast_schema,
+    get_named_type,
+    is_input_object_type,
+    is_interface_type,
+    is_object_type,
+    is_schema,
+    parse,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changes.type import AddedType, RemovedType
+from schemadiff.diff.schema import Schema, change_order
+from schemadiff.fingerprint import schema_fingerprints, type_fingerprint
+from schemadiff.schema_loader import SchemaLoader, definition_starts
+
+
+def split_definitions(sdl: str) -> List[str]:
+    """Split a schema definition language string into the source text of its top level definitions.
+
+    Descriptions are kept along with the definition they document and any leading comments
+    are kept on the first chunk.
+    """
+    starts = list(definition_starts(sdl))
+    ends = starts[1:] + [len(sdl)]
+    return [sdl[start:end] for start, end in zip(starts, ends)]
+
+
+def _definition_key(definition) -> Optional[str]:
+    """Name of the schema member a definition contributes to. Schema definitions have no name"""
+    if isinstance(definition, DirectiveDefinitionNode):
+        return f'@{definition.name.value}'
+    name = getattr(definition, 'name', None)
+    return name.value if name else None
+
+
+class IncrementalDiff:
+    """Keep the diff between a fixed old schema and an evolving new schema up to date.
+
+    The old schema is built and fingerprinted once. The new schema text is split into
+    its top level definitions, so every `update` only reparses the definitions whose text
+    changed and only recomputes the changes of the types they define. Changes of untouched
+    types are kept from the previous result.
+
+    Usage:
+        >>> incremental = IncrementalDiff(production_sdl, draft_sdl)
+        >>> incremental.changes
+        >>> incremental.update(edited_draft_sdl)
+    """
+
+    def __init__(self, old_schema: Union[str, GraphQLSchema], new_schema: str):
+        self.old_schema = old_schema if is_schema(old_schema) else SchemaLoader.from_sdl(old_schema)
+        self.old_fingerprints = schema_fingerprints(self.old_schema)
+        self.new_schema = None
+
+        self._parsed_chunks: Dict[str, Tuple] = {}
+        self._sources: Dict[Optional[str], Tuple[str, ...]] = {}
+        self._type_changes: Dict[str, List[Change]] = {}
+        self._global_changes: List[Change] = []
+        self.update(new_schema)
+
+    @property
+    def changes(self) -> List[Change]:
+        """Current list of differences between the old schema and the latest new schema, by path and then kind"""
+        type_changes = chain.from_iterable(self._type_changes[type_name] for type_name in sorted(self._type_changes))
+        return list(heapq.merge(type_changes, self._global_changes, key=change_order))
+
+    def update(self, new_schema: str) -> List[Change]:
+        """Diff a new version of the new schema text, reusing everything that did not change.
+
+        If the text can't be parsed or built the error is raised and the previous result is kept.
+        """
+        chunks = split_definitions(new_schema)
+        parsed_chunks = {
+            chunk: self._parsed_chunks[chunk] if chunk in self._parsed_chunks else parse(chunk).definitions
+            for chunk in chunks
+        }
+
+        definitions = []
+        sources = {}
+        for chunk in chunks:
+            for definition in parsed_chunks[chunk]:
+                definitions.append(definition)
+                key = _definition_key(definition)
+                sources[key] = sources.get(key, ()) + (chunk,)
+
+        schema = build_ast_schema(DocumentNode(definitions=tuple(definitions)))
+
+        if self.new_schema is None:
+            dirty_types = set(self.old_schema.type_map) | set(schema.type_map)
+        else:
+            dirty_types = {
+                key for key in set(sources) | set(self._sources)
+                if key is not None and not key.startswith('@') and sources.get(key) != self._sources.get(key)
+            }
+            dirty_types |= self._types_with_defaults_of(schema, dirty_types)
+
+        for type_name in sorted(dirty_types):
+            type_changes = self._type_diff(type_name, schema)
+            if type_changes:
+                self._type_changes[type_name] = type_changes
+            else:
+                self._type_changes.pop(type_name, None)
+
+        schema_diff = Schema(self.old_schema, schema)
+        self._global_changes = sorted(schema_diff.directive_changes() + schema_diff.schema_changes(), key=change_order)
+        self._parsed_chunks = parsed_chunks
+        self._sources = sources
+        self.new_schema = schema
+        return self.changes
+
+    def _type_diff(self, type_name: str, new_schema: GraphQLSchema) -> List[Change]:
+        if type_name in Schema.primitives or type_name in Schema.internal_types:
+            return []
+
+        old_type = self.old_schema.type_map.get(type_name)
+        new_type = new_schema.type_map.get(type_name)
+        if old_type is None and new_type is None:
+            return []
+        if old_type is None:
+            return [AddedType(new_type)]
+        if new_type is None:
+            return [RemovedType(old_type)]
+        if self.old_fingerprints.get(type_name) == type_fingerprint(new_type):
+            return []
+
+        return Schema.compare_types(old_type, new_type)
+
+    @staticmethod
+    def _types_with_defaults_of(schema: GraphQLSchema, type_names: Set[str]) -> Set[str]:
+        """Find types with default values of the given input types or of input types nesting them.
+
+        Default values are coerced with their input type, so editing an input type
+        may change the defaults declared on other types, even through other input types
+        whose fields have the edited type.
+        """
+        inputs = {name for name in type_names if is_input_object_type(schema.type_map.get(name))}
+        if not inputs:
+            return set()
+
+        referencing: Dict[str, Set[str]] = {}
+        for name, type_ in schema.type_map.items():
+            if is_input_object_type(type_):
+                for field in type_.fields.values():
+                    referencing.setdefault(get_named_type(field.type).name, set()).add(name)
+
+        pending = list(inputs)
+        while pending:
+            for name in referencing.get(pending.pop(), ()):
+                if name not in inputs:
+                    inputs.add(name)
+                    pending.append(name)
+
+        dependents = set()
+        for name, type_ in schema.type_map.items():
+            if is_input_object_type(type_):
+                values = type_.fields.values()
+            elif is_object_type(type_) or is_interface_type(type_):
+                values = [arg for field in type_.fields.values() for arg in field.args.values()]
+            else:
+                continue
+
+            if any(
+                value.default_value is not Undefined and get_named_type(value.type).name in inputs
+                for value in values
+            ):
+                dependents.add(name)
+
+        return dependents
@@ -0,0 +1,126 @@
+"""Where the schema members that changed are defined in the schema files.
+
+The index is built in a single pass over the parsed definitions, mapping the coordinate of every
+type, field, argument, enum value, input field and directive to the file, line and column of its
+definition, so locating each change is a dictionary lookup.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Union
+
+from graphql import (
+    DirectiveDefinitionNode,
+    DocumentNode,
+    EnumTypeDefinitionNode,
+    EnumTypeExtensionNode,
+    Node,
+    TypeDefinitionNode,
+    TypeExtensionNode,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changeset import path_type
+from schemadiff.schema_loader import SchemaLoader
+
+
+@dataclass(frozen=True)
+class Location:
+    file: str
+    line: int
+    column: int
+
+    def to_dict(self) -> dict:
+        return {'file': self.file, 'line': self.line, 'column': self.column}
+
+    def __str__(self):
+        return f'{self.file}:{self.line}:{self.column}'
+
+
+class LocationIndex:
+    """Map schema coordinates (like `Type.field(arg:)` or `@directive`) to the location of their definition"""
+
+    def __init__(self, locations: Optional[Dict[str, Location]] = None):
+        self.locations = locations or {}
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[DocumentNode]) -> 'LocationIndex':
+        index = cls()
+        for document in documents:
+            for definition in document.definitions:
+                index._add_definition(definition)
+        return index
+
+    @classmethod
+    def from_paths(cls, patterns: Union[str, Iterable[str]]) -> 'LocationIndex':
+        """Index the schema files of the given patterns. Files parsed before are not parsed again"""
+        return cls.from_documents(SchemaLoader.parse_sources(SchemaLoader.read_paths(patterns)))
+
+    def _add_definition(self, definition: Node) -> None:
+        if isinstance(definition, DirectiveDefinitionNode):
+            name = f'@{definition.name.value}'
+            self._add(name, definition)
+            for argument in definition.arguments or ():
+                self._add(f'{name}({argument.name.value}:)', argument)
+            return
+        if not isinstance(definition, (TypeDefinitionNode, TypeExtensionNode)):
+            return
+
+        type_name = definition.name.value
+        self._add(type_name, definition)
+        if isinstance(definition, (EnumTypeDefinitionNode, EnumTypeExtensionNode)):
+            for value in definition.values or ():
+                self._add(f'{type_name}.{value.name.value}', value)
+            return
+        for field in getattr(definition, 'fields', None) or ():
+            coordinate = f'{type_name}.{field.name.value}'
+            self._add(coordinate, field)
+            for argument in getattr(field, 'arguments', None) or ():
+                self._add(f'{coordinate}({argument.name.value}:)', argument)
+
+    def _add(self, coordinate: str, node: Node) -> None:
+        # The first definition of a coordinate wins, so extensions only add the members they introduce
+        if coordinate in self.locations:
+            return
+        # Point to the name of the member rather than to its description
+        name = getattr(node, 'name', None)
+        loc = name.loc if name is not None and name.loc is not None else node.loc
+        if loc is None:
+            return
+        source = loc.source
+        location = source.get_location(loc.start)
+        self.locations[coordinate] = Location(source.name, location.line, location.column)
+
+    def __len__(self):
+        return len(self.locations)
+
+    def get(self, coordinate: Optional[str]) -> Optional[Location]:
+        return self.locations.get(coordinate) if coordinate else None
+
+    def locate(self, change: Change) -> Optional[Location]:
+        """Get the location of the member a change points to, or of its closest parent"""
+        return self.get(change.coordinate) or self.get(change.path) or self.get(path_type(change.path))
+
+
+class SchemaLocations:
+    """Locate changes in the new schema files, or in the old ones for members that were removed"""
+
+    def __init__(self, old: LocationIndex, new: LocationIndex):
+        self.old = old
+        self.new = new
+
+    def locate(self, change: Change) -> Optional[Location]:
+        for coordinate in (change.coordinate, change.path, path_type(change.path)):
+            location = self.new.get(coordinate) or self.old.get(coordinate)
+            if location is not None:
+                return location
+        return None
+
+
+def annotate_locations(changes: List[Change], old: LocationIndex, new: LocationIndex) -> List[Change]:
+    """Set the `old_location` and `new_location` of changes, looking each distinct coordinate up only once"""
+    located = {}
+    for change in changes:
+        key = (change.coordinate, change.path)
+        if key not in located:
+            located[key] = old.locate(change), new.locate(change)
+        change.old_location, change.new_location = located[key]
+    return changes
@@ -0,0 +1,247 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from graphql import (
+    GraphQLError,
+    GraphQLSchema,
+    TypeInfo,
+    TypeInfoVisitor,
+    Visitor,
+    get_named_type,
+    is_enum_type,
+    is_schema,
+    parse,
+    print_schema,
+    visit,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changeset import path_type
+from schemadiff.fingerprint import sdl_fingerprint
+from schemadiff.schema_loader import SchemaLoader
+
+OPERATION_EXTENSIONS = ('.graphql', '.gql')
+INDEX_FORMAT_VERSION = 1
+# Below this amount of files parsing in the current process is faster than starting a pool
+PARALLEL_THRESHOLD = 256
+
+# Changes that don't affect the member they point to (which no operation uses yet) but its parent.
+# i.e. adding a required argument breaks every operation that selects the field.
+# The parent is taken from the path, so changes decoded from a cache or another process work too
+PARENT_IMPACT_CHANGES = {
+    'FieldArgumentAdded': lambda change: change.path,
+    'InputFieldAdded': lambda change: path_type(change.path),
+    'EnumValueAdded': lambda change: path_type(change.path),
+    'DirectiveArgumentAdded': lambda change: change.path,
+}
+
+
+class CoordinatesCollector(Visitor):
+    """Collect the schema coordinates an operation document uses"""
+
+    def __init__(self, type_info: TypeInfo):
+        super().__init__()
+        self.type_info = type_info
+        self.coordinates: Set[str] = set()
+        self.field_coordinate = None
+
+    def enter_field(self, node, *_args):
+        parent = self.type_info.get_parent_type()
+        field = self.type_info.get_field_def()
+        if parent is None or field is None:
+            return
+        self.field_coordinate = f'{parent.name}.{node.name.value}'
+        self.coordinates.add(self.field_coordinate)
+        self.coordinates.add(get_named_type(field.type).name)
+
+    def enter_argument(self, node, *_args):
+        argument = self.type_info.get_argument()
+        if argument is not None:
+            self.coordinates.add(get_named_type(argument.type).name)
+
+        directive = self.type_info.get_directive()
+        if directive is not None:
+            self.coordinates.add(f'@{directive.name}({node.name.value}:)')
+        elif self.field_coordinate is not None:
+            self.coordinates.add(f'{self.field_coordinate}({node.name.value}:)')
+
+    def enter_directive(self, node, *_args):
+        self.coordinates.add(f'@{node.name.value}')
+
+    def enter_object_field(self, node, *_args):
+        input_type = get_named_type(self.type_info.get_parent_input_type())
+        if input_type is not None:
+            self.coordinates.add(f'{input_type.name}.{node.name.value}')
+
+    def enter_enum_value(self, node, *_args):
+        enum_type = get_named_type(self.type_info.get_input_type())
+        if is_enum_type(enum_type):
+            self.coordinates.add(f'{enum_type.name}.{node.value}')
+
+    def enter_named_type(self, node, *_args):
+        self.coordinates.add(node.name.value)
+
+
+def operation_coordinates(schema: GraphQLSchema, document: str) -> Set[str]:
+    """Get the schema coordinates used by the operations of a graphql document"""
+    type_info = TypeInfo(schema)
+    collector = CoordinatesCollector(type_info)
+    visit(parse(document, no_location=True), TypeInfoVisitor(type_info, collector))
+    return collector.coordinates
+
+
+_worker_schema: Optional[GraphQLSchema] = None
+
+
+def _init_worker(sdl: str) -> None:
+    global _worker_schema
+    _worker_schema = SchemaLoader.from_sdl(sdl)
+
+
+def _collect_file(path: str, schema: Optional[GraphQLSchema] = None) -> Tuple[List[str], Optional[str]]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return sorted(operation_coordinates(schema or _worker_schema, f.read())), None
+    except (GraphQLError, UnicodeDecodeError) as e:
+        return [], str(e)
+
+
+class OperationIndex:
+    """Inverted index from schema coordinates to the ids of the persisted operations that use them.
+
+    Operations are read from a directory of `.graphql` documents and resolved against the schema
+    they were written for, so the index can tell which operations a change of that schema breaks
+    with one lookup per change.
+    The coordinates of every file can be cached on disk, and on later runs only files that were
+    modified since are parsed again.
+
+    Usage:
+        >>> index = OperationIndex.from_directory('operations/', old_schema, cache_path='ops-index.json')
+        >>> annotate_changes(diff(old_schema, new_schema), index)
+    """
+
+    def __init__(self, schema_hash: str):
+        self.schema_hash = schema_hash
+        self.files: Dict[str, Tuple[int, int, List[str]]] = {}
+        """Mapping of operation id to the modification time, size and coordinates of its file"""
+        self.errors: Dict[str, str] = {}
+        """Operations that could not be parsed and the reason why"""
+        self.operations_by_coordinate: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_directory(cls, directory: Union[str, Path], schema: Union[str, GraphQLSchema],
+                       cache_path: Optional[str] = None, workers: Optional[int] = None) -> 'OperationIndex':
+        """Index all the graphql documents found recursively on a directory.
+
+        Documents are parsed in parallel with `workers` processes (all cpus by default).
+        The operation id is the path of the document relative to the directory, without its extension.
+        """
+        sdl = print_schema(schema) if is_schema(schema) else schema
+        schema = schema if is_schema(schema) else None
+        index = cls(sdl_fingerprint(sdl))
+        cached = cls.load(cache_path) if cache_path else None
+        if cached is not None and cached.schema_hash == index.schema_hash:
+            index.files, index.errors = cached.files, cached.errors
+
+        directory = Path(directory)
+        current = {}
+        for path in sorted(directory.rglob('*')):
+            if path.suffix in OPERATION_EXTENSIONS and path.is_file():
+                stat = path.stat()
+                operation_id = path.relative_to(directory).with_suffix('').as_posix()
+                current[operation_id] = (str(path), stat.st_mtime_ns, stat.st_size)
+
+        outdated = [
+            operation_id for operation_id, (_, mtime, size) in current.items()
+            if index.files.get(operation_id, (None, None))[:2] != (mtime, size)
+        ]
+        files = {operation_id: index.files[operation_id] for operation_id in current if operation_id in index.files}
+        errors = {operation_id: error for operation_id, error in index.errors.items() if operation_id in current}
+        paths = [current[operation_id][0] for operation_id in outdated]
+        for operation_id, (coordinates, error) in zip(outdated, cls._collect(sdl, schema, paths, workers)):
+            _, mtime, size = current[operation_id]
+            files[operation_id] = (mtime, size, coordinates)
+            errors.pop(operation_id, None)
+            if error is not None:
+                errors[operation_id] = error
+
+        modified = bool(outdated) or files.keys() != index.files.keys()
+        index.files, index.errors = files, errors
+        index._build_inverted_index()
+        if cache_path and modified:
+            index.save(cache_path)
+        return index
+
+    @staticmethod
+    def _collect(sdl: str, schema: Optional[GraphQLSchema], paths: List[str],
+                 workers: Optional[int]) -> Iterable[Tuple[List[str], Optional[str]]]:
+        if workers == 1 or len(paths) < PARALLEL_THRESHOLD:
+            schema = schema or SchemaLoader.from_sdl(sdl)
+            return [_collect_file(path, schema) for path in paths]
+
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(sdl,)) as executor:
+            return list(executor.map(_collect_file, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+    def _build_inverted_index(self) -> None:
+        operations_by_coordinate = {}
+        for operation_id, (_, _, coordinates) in self.files.items():
+            for coordinate in coordinates:
+                operations_by_coordinate.setdefault(coordinate, []).append(operation_id)
+        self.operations_by_coordinate = operations_by_coordinate
+
+    def operations(self, coordinate: str) -> List[str]:
+        """Ids of the operations that use a schema coordinate"""
+        return self.operations_by_coordinate.get(coordinate, [])
+
+    def affected_operations(self, change: Change) -> List[str]:
+        """Ids of the operations affected by a change"""
+        impact_coordinate = PARENT_IMPACT_CHANGES.get(change.kind)
+        coordinate = impact_coordinate(change) if impact_coordinate else change.coordinate
+        return self.operations(coordinate)
+
+    def save(self, path: str) -> None:
+        """Persist the coordinates of every file, interning the coordinates to keep the file compact"""
+        coordinate_ids = {coordinate: i for i, coordinate in enumerate(self.operations_by_coordinate)}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'format': INDEX_FORMAT_VERSION,
+                'schema_hash': self.schema_hash,
+                'coordinates': list(coordinate_ids),
+                'files': {
+                    operation_id: [mtime, size, [coordinate_ids[coordinate] for coordinate in coordinates]]
+                    for operation_id, (mtime, size, coordinates) in self.files.items()
+                },
+                'errors': self.errors,
+            }, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> Optional['OperationIndex']:
+        """Read an index written by `save`. Unreadable or outdated indexes are ignored"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('format') != INDEX_FORMAT_VERSION:
+            return None
+
+        index = cls(data['schema_hash'])
+        coordinates = data['coordinates']
+        index.files = {
+            operation_id: (mtime, size, [coordinates[i] for i in coordinate_ids])
+            for operation_id, (mtime, size, coordinate_ids) in data['files'].items()
+        }
+        index.errors = data['errors']
+        index._build_inverted_index()
+        return index
+
+
+def annotate_changes(changes: List[Change], index: OperationIndex) -> List[Change]:
+    """Set the operations affected by each change. It takes a lookup per change regardless of the operations count"""
+    for change in changes:
+        change.affected_operations = index.affected_operations(change)
+    return changes
@@ -0,0 +1,85 @@
+"""Types reachable from the root operation types of a schema.
+
+Types no root field leads to, even through arguments, interfaces or unions, can't be used by
+any client, so changes on them can be dropped. The reachable set of each schema is computed
+once with a breadth-first search and reused by every change.
+"""
+from collections import deque
+from typing import FrozenSet, Iterable, List
+from weakref import WeakKeyDictionary
+
+from graphql import (
+    GraphQLSchema,
+    get_named_type,
+    is_abstract_type,
+    is_input_object_type,
+    is_interface_type,
+    is_object_type,
+)
+
+from schemadiff.changes import Change
+from schemadiff.changeset import ChangeSet, path_type
+
+_reachable_types: 'WeakKeyDictionary[GraphQLSchema, FrozenSet[str]]' = WeakKeyDictionary()
+
+
+def reachable_types(schema: GraphQLSchema) -> FrozenSet[str]:
+    """Get the names of the types reachable from the query, mutation and subscription types"""
+    if schema not in _reachable_types:
+        _reachable_types[schema] = _search(schema)
+    return _reachable_types[schema]
+
+
+def _search(schema: GraphQLSchema) -> FrozenSet[str]:
+    roots = [root for root in (schema.query_type, schema.mutation_type, schema.subscription_type) if root is not None]
+    reached = {root.name for root in roots}
+    queue = deque(roots)
+    while queue:
+        type_ = queue.popleft()
+        for referenced in _referenced_types(schema, type_):
+            if referenced.name not in reached:
+                reached.add(referenced.name)
+                queue.append(referenced)
+    return frozenset(reached)
+
+
+def _referenced_types(schema: GraphQLSchema, type_) -> Iterable:
+    if is_object_type(type_) or is_interface_type(type_):
+        for field in type_.fields.values():
+            yield get_named_type(field.type)
+            for argument in field.args.values():
+                yield get_named_type(argument.type)
+        yield from type_.interfaces
+    elif is_input_object_type(type_):
+        for field in type_.fields.values():
+            yield get_named_type(field.type)
+
+    if is_abstract_type(type_):
+        # Fields returning an interface or union may resolve to any of their possible types
+        yield from schema.get_possible_types(type_)
+
+
+class ReachabilityIndex:
+    """Tell whether changes are on types reachable from the roots of any of the compared schemas"""
+
+    def __init__(self, old_schema: GraphQLSchema, new_schema: GraphQLSchema):
+        self.known_types = set(old_schema.type_map) | set(new_schema.type_map)
+        self.reachable = reachable_types(old_schema) | reachable_types(new_schema)
+
+    def is_reachable_path(self, path: str) -> bool:
+        # Directives and schema changes don't belong to a type, so they are always kept
+        name = path_type(path)
+        return name not in self.known_types or name in self.reachable
+
+    def is_reachable(self, change: Change) -> bool:
+        return self.is_reachable_path(change.path)
+
+    def tag(self, changes: List[Change]) -> List[Change]:
+        """Set the `reachable` attribute of every change"""
+        for change in changes:
+            change.reachable = self.is_reachable(change)
+        return changes
+
+    def filter(self, changes: Iterable[Change]) -> ChangeSet:
+        """Keep only the changes on reachable types. Paths are checked once per distinct path"""
+        return ChangeSet.from_changes(changes).filter(path_filter=self.is_reachable_path)
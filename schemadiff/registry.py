@@ -0,0 +1,189 @@
+import heapq
+import sqlite3
+import zlib
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, List, Optional, Set, Union
+
+from graphql import GraphQLSchema, is_schema
+
+from schemadiff.changes import Change
+from schemadiff.diff.schema import Schema, change_order
+from schemadiff.fingerprint import schema_members, sdl_fingerprint
+from schemadiff.schema_loader import SchemaLoader
+
+ROOT_OPERATIONS = ('query', 'mutation', 'subscription')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    hash TEXT PRIMARY KEY,
+    sdl BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    service TEXT NOT NULL,
+    version TEXT NOT NULL,
+    query_type TEXT,
+    mutation_type TEXT,
+    subscription_type TEXT,
+    published_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (service, version)
+);
+CREATE TABLE IF NOT EXISTS version_members (
+    version_id INTEGER NOT NULL REFERENCES versions (id),
+    name TEXT NOT NULL,
+    hash TEXT NOT NULL REFERENCES members (hash),
+    PRIMARY KEY (version_id, name)
+);
+"""
+
+
+class RegistryError(Exception):
+    """Exception raised when the registry can't fulfill a request, like loading an unknown version"""
+
+
+@dataclass
+class MemberChanges:
+    """Names of the types and directives (prefixed with `@`) that differ between two stored versions"""
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+    roots_changed: bool = False
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed or self.roots_changed)
+
+
+class SchemaRegistry:
+    """Local store of published schema versions backed by a SQLite file.
+
+    Every type and directive is stored once, content-addressed by the hash of its canonical SDL,
+    and a version is just the list of hashes of its members. Types that don't change between
+    versions (or services) are therefore shared, and two versions can be compared by their
+    hashes without parsing any SDL.
+
+    Usage:
+        >>> with SchemaRegistry('schemas.db') as registry:
+        ...     registry.publish('users', '1.0.0', sdl)
+        ...     registry.diff('users', '0.9.0', '1.0.0')
+    """
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(str(path))
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def publish(self, service: str, version: str, schema: Union[str, GraphQLSchema]) -> int:
+        """Store a new version of a service schema.
+
+        Returns:
+            int: Amount of types and directives that were not stored yet
+        """
+        schema = schema if is_schema(schema) else SchemaLoader.from_sdl(schema)
+        members = {name: (sdl_fingerprint(sdl), sdl) for name, sdl in schema_members(schema).items()}
+        roots = [getattr(root, 'name', None) for root in (
+            schema.query_type, schema.mutation_type, schema.subscription_type
+        )]
+        with self.connection:
+            try:
+                cursor = self.connection.execute(
+                    'INSERT INTO versions (service, version, query_type, mutation_type, subscription_type) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (service, version, *roots)
+                )
+            except sqlite3.IntegrityError as e:
+                raise RegistryError(f"Version `{version}` of `{service}` was already published") from e
+
+            stored_before = self.connection.total_changes
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO members (hash, sdl) VALUES (?, ?)',
+                ((hash_, zlib.compress(sdl.encode('utf-8'))) for hash_, sdl in members.values())
+            )
+            new_members = self.connection.total_changes - stored_before
+            self.connection.executemany(
+                'INSERT INTO version_members (version_id, name, hash) VALUES (?, ?, ?)',
+                ((cursor.lastrowid, name, hash_) for name, (hash_, _) in members.items())
+            )
+
+        return new_members
+
+    def services(self) -> List[str]:
+        rows = self.connection.execute('SELECT DISTINCT service FROM versions ORDER BY service')
+        return [service for service, in rows]
+
+    def versions(self, service: str) -> List[str]:
+        """Versions of a service in publication order"""
+        rows = self.connection.execute('SELECT version FROM versions WHERE service = ? ORDER BY id', (service,))
+        return [version for version, in rows]
+
+    def load_sdl(self, service: str, version: str) -> str:
+        """Rebuild the schema definition language of a stored version"""
+        version_id, roots = self._version(service, version)
+        rows = self.connection.execute(
+            'SELECT m.sdl FROM version_members vm JOIN members m ON m.hash = vm.hash '
+            'WHERE vm.version_id = ? ORDER BY vm.name',
+            (version_id,)
+        )
+        definitions = [zlib.decompress(sdl).decode('utf-8') for sdl, in rows]
+        operations = [f'  {operation}: {root}' for operation, root in zip(ROOT_OPERATIONS, roots) if root]
+        if operations:
+            definitions.insert(0, 'schema {\n' + '\n'.join(operations) + '\n}')
+        return '\n\n'.join(definitions) + '\n'
+
+    def load(self, service: str, version: str) -> GraphQLSchema:
+        return SchemaLoader.from_sdl(self.load_sdl(service, version))
+
+    def member_hashes(self, service: str, version: str) -> Dict[str, str]:
+        version_id, _ = self._version(service, version)
+        rows = self.connection.execute('SELECT name, hash FROM version_members WHERE version_id = ?', (version_id,))
+        return dict(rows.fetchall())
+
+    def changed_members(self, service: str, old_version: str, new_version: str) -> MemberChanges:
+        """Compare two stored versions by the hashes of their members, without parsing SDL"""
+        old, new = self.member_hashes(service, old_version), self.member_hashes(service, new_version)
+        return MemberChanges(
+            added=new.keys() - old.keys(),
+            removed=old.keys() - new.keys(),
+            changed={name for name in old.keys() & new.keys() if old[name] != new[name]},
+            roots_changed=self._version(service, old_version)[1] != self._version(service, new_version)[1],
+        )
+
+    def diff(self, service: str, old_version: str, new_version: str) -> List[Change]:
+        """Compare two stored versions of a service.
+
+        Members with the same hash in both versions are known to be equal, so only the
+        members that changed are compared and nothing is rebuilt when both versions are equal.
+        """
+        members = self.changed_members(service, old_version, new_version)
+        if not members:
+            return []
+
+        schema = Schema(self.load(service, old_version), self.load(service, new_version))
+        type_changes = {change.path: [change] for change in schema.removed_types() + schema.added_types()}
+        for type_name in members.changed:
+            if not type_name.startswith('@'):
+                type_changes[type_name] = schema.compare_types(schema.old_types[type_name], schema.new_types[type_name])
+
+        # Changes of each type are in order, so listing types by name and merging the rest keeps them by path
+        steps = [chain.from_iterable(type_changes[type_name] for type_name in sorted(type_changes))]
+        if any(name.startswith('@') for name in members.added | members.removed | members.changed):
+            steps.append(schema.directive_changes())
+        steps.append(sorted(schema.schema_changes(), key=change_order))
+        return list(heapq.merge(*steps, key=change_order))
+
+    def _version(self, service: str, version: str):
+        row: Optional[tuple] = self.connection.execute(
+            'SELECT id, query_type, mutation_type, subscription_type FROM versions WHERE service = ? AND version = ?',
+            (service, version)
+        ).fetchone()
+        if row is None:
+            raise RegistryError(f"Version `{version}` of `{service}` was not found in the registry")
+        return row[0], row[1:]
@@ -0,0 +1,147 @@
+"""Detection of renamed types and fields.
+
+Instead of comparing every removed definition with every added one, removed and added
+definitions are bucketed by a signature so only likely pairs are ever compared:
+
+* Types are described by a set of features (their fields with types, enum values, union members...)
+  and bucketed with MinHash locality sensitive hashing. Candidates sharing a bucket are then
+  compared by the exact Jaccard similarity of their features.
+* Fields of a type are bucketed by their exact signature (type and arguments), and a rename is only
+  reported when the bucket pairs exactly one removed and one added field.
+"""
+import zlib
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from graphql import (
+    GraphQLNamedType,
+    is_enum_type,
+    is_input_object_type,
+    is_interface_type,
+    is_object_type,
+    is_union_type,
+)
+
+SIMILARITY_THRESHOLD = 0.5
+# 10 bands of 2 rows make pairs with a similarity above ~0.3 share some bucket with high probability,
+# which leaves margin below the similarity threshold while keeping signatures cheap to compute.
+BANDS = 10
+ROWS = 2
+_PRIME = (1 << 61) - 1
+
+
+def type_features(type_: GraphQLNamedType) -> FrozenSet[str]:
+    """Describe the structure of a type, ignoring its name, as a set of features"""
+    features = set()
+    if is_object_type(type_) or is_interface_type(type_) or is_input_object_type(type_):
+        for name, field in type_.fields.items():
+            features.add(name)
+            features.add(f'{name}: {field.type}')
+            for arg_name, arg in getattr(field, 'args', {}).items():
+                features.add(f'{name}({arg_name}: {arg.type})')
+        features.update(f'implements {interface.name}' for interface in getattr(type_, 'interfaces', ()))
+    elif is_enum_type(type_):
+        features.update(type_.values)
+    elif is_union_type(type_):
+        features.update(member.name for member in type_.types)
+    return frozenset(features)
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    if not first and not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+class MinHasher:
+    """Compute MinHash signatures whose bands collide for similar feature sets"""
+
+    def __init__(self, bands: int = BANDS, rows: int = ROWS, seed: int = 17):
+        self.bands = bands
+        self.rows = rows
+        # Deterministic universal hash functions (a * x + b) mod p
+        self.coefficients = [
+            ((seed * (i + 1) * 0x9E3779B1) % _PRIME | 1, (seed * (i + 7) * 0x85EBCA77) % _PRIME)
+            for i in range(bands * rows)
+        ]
+
+    def signature(self, features: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(feature.encode('utf-8')) for feature in features]
+        return tuple(
+            min((a * value + b) % _PRIME for value in hashes)
+            for a, b in self.coefficients
+        )
+
+    def band_keys(self, features: Iterable[str]) -> List[Tuple]:
+        signature = self.signature(features)
+        return [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+
+def match_renamed_types(removed: List[GraphQLNamedType], added: List[GraphQLNamedType],
+                        threshold: float = SIMILARITY_THRESHOLD) -> List[Tuple[GraphQLNamedType, GraphQLNamedType]]:
+    """Pair removed types with the added types they were most likely renamed to.
+
+    Only types of the same kind whose features are at least `threshold` similar are paired,
+    and every type is paired at most once, preferring the most similar pairs.
+    """
+    if not removed or not added:
+        return []
+
+    hasher = MinHasher()
+    removed_features = {type_.name: type_features(type_) for type_ in removed}
+    buckets: Dict[Tuple, List[GraphQLNamedType]] = {}
+    for type_ in removed:
+        if removed_features[type_.name]:
+            for key in hasher.band_keys(removed_features[type_.name]):
+                buckets.setdefault(key, []).append(type_)
+
+    candidates = []
+    for new_type in added:
+        features = type_features(new_type)
+        if not features:
+            continue
+        seen: Set[str] = set()
+        for key in hasher.band_keys(features):
+            for old_type in buckets.get(key, ()):
+                if old_type.name in seen or type(old_type) is not type(new_type):
+                    continue
+                seen.add(old_type.name)
+                similarity = jaccard(removed_features[old_type.name], features)
+                if similarity >= threshold:
+                    candidates.append((-similarity, old_type.name, new_type.name, old_type, new_type))
+
+    return _greedy_pairs(candidates)
+
+
+def field_signature(field) -> Tuple:
+    args = getattr(field, 'args', {})
+    return str(field.type), tuple(sorted((name, str(arg.type)) for name, arg in args.items()))
+
+
+def match_renamed_fields(old_fields: Dict, new_fields: Dict,
+                         removed: Iterable[str], added: Iterable[str]) -> List[Tuple[str, str]]:
+    """Pair removed field names with added field names that have exactly the same signature.
+
+    Ambiguous signatures (shared by more than one removed or added field) are not paired.
+    """
+    buckets: Dict[Tuple, Tuple[List[str], List[str]]] = {}
+    for name in removed:
+        buckets.setdefault(field_signature(old_fields[name]), ([], []))[0].append(name)
+    for name in added:
+        buckets.setdefault(field_signature(new_fields[name]), ([], []))[1].append(name)
+
+    return sorted(
+        (old_names[0], new_names[0])
+        for old_names, new_names in buckets.values()
+        if len(old_names) == 1 and len(new_names) == 1
+    )
+
+
+def _greedy_pairs(candidates: List[Tuple]) -> List[Tuple]:
+    pairs = []
+    paired_old, paired_new = set(), set()
+    for _, old_name, new_name, old, new in sorted(candidates, key=lambda candidate: candidate[:3]):
+        if old_name not in paired_old and new_name not in paired_new:
+            paired_old.add(old_name)
+            paired_new.add(new_name)
+            pairs.append((old, new))
+    return pairs
@@ -0,0 +1,163 @@
+"""Compare two stored diff results, like the ones of two pushes of a pull request.
+
+Results may be json outputs (`--as-json`, grouped by type or not), NDJSON files with a change
+per line, binary results written by `serialization.dump` or entries of the `DiffCache`. Changes are
+matched by checksum with a hash join: only the checksums of both results are kept in memory, while
+the changes themselves are streamed from the files.
+"""
+import json
+import mmap
+import struct
+from typing import Iterator, Set, Tuple
+
+from schemadiff.changes import Change, Criticality, CriticalityLevel
+from schemadiff.changeset import MaterializedChange
+from schemadiff.serialization import MAGIC, VIOLATIONS_SIZE, DiffReader, InvalidDiffBuffer
+
+CHUNK_SIZE = 64 * 1024
+
+ADDED = 'added'
+REMOVED = 'removed'
+
+
+class InvalidReport(Exception):
+    """A file doesn't hold a diff result in any of the supported formats"""
+
+
+def change_from_dict(representation: dict) -> Change:
+    """Rebuild a change from its `to_dict` representation"""
+    try:
+        criticality = representation['criticality']
+        return MaterializedChange(
+            kind=representation.get('kind', ''),
+            message=representation['message'],
+            path=representation.get('path'),
+            coordinate=representation.get('coordinate', representation.get('path')),
+            criticality=Criticality(level=CriticalityLevel(criticality['level']), reason=criticality['reason']),
+            checksum=representation['checksum'],
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise InvalidReport(f'Invalid change {representation!r}') from e
+
+
+def read_changes(path: str) -> Iterator[Change]:
+    """Stream the changes of a diff result file, whatever its format"""
+    with open(path, 'rb') as f:
+        head = f.read(8)
+        if head[:4] == MAGIC:
+            yield from _read_binary(path, 0)
+            return
+        if _is_cache_entry(f, head):
+            violations_size, = VIOLATIONS_SIZE.unpack_from(head)
+            yield from _read_binary(path, VIOLATIONS_SIZE.size + violations_size)
+            return
+
+    with open(path, encoding='utf-8') as f:
+        first = _first_character(f)
+        if first == '[':
+            for representation in _iter_json_array(f):
+                if _is_group(representation):
+                    yield from map(change_from_dict, representation['changes'])
+                else:
+                    yield change_from_dict(representation)
+        elif first == '{':
+            f.seek(0)
+            for line in f:
+                if line.strip():
+                    yield change_from_dict(_loads(line))
+        elif first:
+            raise InvalidReport(f'{path} is not a json, NDJSON or binary diff result')
+
+
+def _is_group(representation) -> bool:
+    """Outputs grouped by type (`--group-by-type`) list groups with the changes of each type"""
+    return (isinstance(representation, dict) and 'message' not in representation
+            and isinstance(representation.get('changes'), list))
+
+
+def _is_cache_entry(f, head: bytes) -> bool:
+    """Cache entries start with the size of their json violations followed by an encoded result"""
+    if len(head) < VIOLATIONS_SIZE.size:
+        return False
+    violations_size, = VIOLATIONS_SIZE.unpack_from(head)
+    f.seek(VIOLATIONS_SIZE.size + violations_size)
+    return f.read(len(MAGIC)) == MAGIC
+
+
+def _read_binary(path: str, offset: int) -> Iterator[Change]:
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)[offset:]
+        try:
+            reader = DiffReader(view)
+        except (InvalidDiffBuffer, struct.error) as e:
+            view.release()
+            raise InvalidReport(f'{path} is not a valid binary diff result: {e}') from e
+        try:
+            for index in range(len(reader)):
+                yield reader[index]
+        finally:
+            reader.close()
+            view.release()
+
+
+def _first_character(f) -> str:
+    """Read up to the first non whitespace character of a text file"""
+    while True:
+        character = f.read(1)
+        if not character or not character.isspace():
+            return character
+
+
+def _loads(text: str):
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        raise InvalidReport(f'Invalid json: {e}') from e
+
+
+def _iter_json_array(f, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Decode the items of a json array one by one, right after its opening bracket was read"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer.startswith(','):
+            buffer = buffer[1:].lstrip()
+        if buffer.startswith(']'):
+            return
+        try:
+            if not buffer:
+                raise ValueError('Empty buffer')
+            item, end = decoder.raw_decode(buffer)
+        except ValueError as e:
+            # The buffer ends in the middle of an item
+            if eof:
+                raise InvalidReport(f'Unterminated json array: {e}') from e
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield item
+        buffer = buffer[end:]
+
+
+def _checksums(path: str) -> Set[bytes]:
+    return {bytes.fromhex(change.checksum()) for change in read_changes(path)}
+
+
+def diff_reports(previous_path: str, current_path: str) -> Iterator[Tuple[str, Change]]:
+    """Stream the changes of the current result missing from the previous one (`added`),
+    and then the changes of the previous result missing from the current one (`removed`).
+    """
+    previous = _checksums(previous_path)
+    current: Set[bytes] = set()
+    for change in read_changes(current_path):
+        checksum = bytes.fromhex(change.checksum())
+        current.add(checksum)
+        if checksum not in previous:
+            yield ADDED, change
+
+    for change in read_changes(previous_path):
+        if bytes.fromhex(change.checksum()) not in current:
+            yield REMOVED, change
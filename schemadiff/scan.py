@@ -0,0 +1,190 @@
+"""Drift scan of the schemas of a fleet of services.
+
+A manifest lists the services to compare, each with its old (like the last released) and new
+(like the deployed) schema, given as files, directories, globs or introspection urls:
+
+```yaml
+services:
+  - name: accounts
+    old: released/accounts.graphql
+    new: https://accounts.internal/graphql
+```
+
+Services are compared by a bounded pool of worker processes. A service whose schema can't be
+loaded or compared is reported as failed without stopping the scan.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from graphql import GraphQLSchema
+
+from schemadiff.changeset import ChangeSet
+from schemadiff.diff.schema import Schema
+from schemadiff.formatting import LEVEL_NAMES, level_summary
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.serialization import dumps_with_violations, loads_with_violations
+
+# Below this amount of services comparing them in the current process is faster than starting a pool
+PARALLEL_THRESHOLD = 4
+
+
+class InvalidManifest(Exception):
+    """The manifest of a scan can't be read or doesn't list services properly"""
+
+
+@dataclass
+class Service:
+    name: str
+    old: Union[str, List[str]]
+    new: Union[str, List[str]]
+
+
+@dataclass
+class ServiceResult:
+    """Result of comparing the schemas of a service. Failed comparisons have an `error` and no changes"""
+    service: str
+    changes: Optional[ChangeSet] = None
+    error: Optional[str] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def to_dict(self) -> dict:
+        representation = {'service': self.service, **self.counts}
+        if self.failed:
+            representation['error'] = self.error
+        else:
+            representation['changes'] = [change.to_dict() for change in self.changes]
+        return representation
+
+
+def read_manifest(path: Union[str, Path]) -> List[Service]:
+    """Read the services of a YAML (needs the `yaml` extra, which installs PyYAML) or JSON manifest.
+
+    Relative schema paths are resolved from the directory of the manifest.
+    """
+    path = Path(path)
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError as e:
+        raise InvalidManifest(f"Can't read manifest {str(path)!r}: {e}") from e
+
+    if path.suffix == '.json':
+        try:
+            content = json.loads(text)
+        except ValueError as e:
+            raise InvalidManifest(f"Can't parse manifest {str(path)!r}: {e}") from e
+    else:
+        try:
+            import yaml
+        except ImportError:
+            raise InvalidManifest(
+                "Reading YAML manifests needs PyYAML. Install it with `pip install graphql-schema-diff[yaml]` "
+                "or use a .json manifest"
+            )
+        try:
+            content = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise InvalidManifest(f"Can't parse manifest {str(path)!r}: {e}") from e
+
+    entries = content.get('services') if isinstance(content, dict) else None
+    if not isinstance(entries, list):
+        raise InvalidManifest(f'Manifest {str(path)!r} must have a list of `services`')
+
+    services = []
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not {'name', 'old', 'new'} <= entry.keys():
+            raise InvalidManifest(
+                f'Service #{position + 1} of {str(path)!r} needs a `name`, an `old` and a `new` schema'
+            )
+        services.append(Service(
+            name=str(entry['name']),
+            old=_resolve(entry['old'], path.parent),
+            new=_resolve(entry['new'], path.parent),
+        ))
+    return services
+
+
+def _resolve(source: Union[str, List[str]], base: Path) -> Union[str, List[str]]:
+    if isinstance(source, list):
+        return [_resolve(item, base) for item in source]
+    if _is_url(source) or os.path.isabs(source):
+        return source
+    return str(base / source)
+
+
+def _is_url(source) -> bool:
+    return isinstance(source, str) and source.startswith(('http://', 'https://'))
+
+
+def load_source(source: Union[str, List[str]]) -> GraphQLSchema:
+    if _is_url(source):
+        return SchemaLoader.from_url(source)
+    return SchemaLoader.from_paths(source)
+
+
+def scan(services: Iterable[Service], detect_renames: bool = False,
+         workers: Optional[int] = None) -> List[ServiceResult]:
+    """Compare the schemas of every service, in parallel when there are many of them.
+
+    Args:
+        workers: Amount of processes comparing services. All cpus by default
+    """
+    tasks = [(service.name, service.old, service.new, detect_renames) for service in services]
+    if workers == 1 or len(tasks) < PARALLEL_THRESHOLD:
+        return [_result(*_scan_service(task)) for task in tasks]
+
+    # Changes reference graphql types that can't be sent between processes, so they are sent encoded
+    # along the rules they violate, which can't be checked on decoded changes
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return [_result(*outcome) for outcome in executor.map(_scan_service, tasks)]
+
+
+def _scan_service(task: Tuple) -> Tuple[str, Optional[bytes], Optional[str]]:
+    name, old, new, detect_renames = task
+    try:
+        changes = Schema(load_source(old), load_source(new), detect_renames).diff()
+        return name, dumps_with_violations(changes), None
+    except Exception as e:
+        # Any failure only fails its own service, whatever its cause
+        return name, None, f'{e.__class__.__name__}: {e}'
+
+
+def _result(name: str, encoded: Optional[bytes], error: Optional[str]) -> ServiceResult:
+    if error is not None:
+        return ServiceResult(name, error=error)
+
+    changes = loads_with_violations(encoded)
+    return ServiceResult(name, changes=changes, counts=level_summary(changes))
+
+
+def scan_report(results: List[ServiceResult]) -> dict:
+    """Aggregate the results of a scan with the totals of every level of changes and the failed services"""
+    totals = {level_name: sum(result.counts.get(level_name, 0) for result in results)
+              for level_name in LEVEL_NAMES.values()}
+    return {
+        'services': [result.to_dict() for result in results],
+        'totals': totals,
+        'failed': [result.service for result in results if result.failed],
+    }
+
+
+def format_scan(results: List[ServiceResult]) -> str:
+    """Format the counts of changes of every service as a table"""
+    width = max([len('service')] + [len(result.service) for result in results])
+    lines = [f"{'service':<{width}}  breaking  dangerous  safe"]
+    for result in results:
+        if result.failed:
+            lines.append(f"{result.service:<{width}}  failed: {result.error}")
+        else:
+            counts = result.counts
+            lines.append(
+                f"{result.service:<{width}}  {counts['breaking']:>8}  {counts['dangerous']:>9}  {counts['safe']:>4}"
+            )
+    return '\n'.join(lines)
@@ -1,16 +1,310 @@
-from graphql import build_schema, GraphQLSchema
+import glob
+import hashlib
+import json
+import mmap
+import os
+import re
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from graphql import (
+    build_ast_schema,
+    build_client_schema,
+    build_schema,
+    get_introspection_query,
+    parse,
+    DocumentNode,
+    GraphQLSchema,
+    GraphQLSyntaxError,
+    Source,
+)
+
+if TYPE_CHECKING:
+    from schemadiff.locations import LocationIndex
+
+SCHEMA_EXTENSIONS = ('.graphql', '.graphqls', '.gql')
+GLOB_CHARACTERS = '*?['
+# Parsed documents kept in memory, keyed by the hash of their file name and content. Only the ones loaded
+# last are kept, so long running processes don't keep every AST they ever parsed alive
+PARSED_DOCUMENTS_LIMIT = 256
+# Amount of bytes of definitions parsed at once when loading schemas with low memory
+LOW_MEMORY_BATCH_SIZE = 1024 * 1024
+# Seconds to wait for an introspection response
+INTROSPECTION_TIMEOUT = 30
+
+DEFINITION_KEYWORDS = {'schema', 'scalar', 'type', 'interface', 'union', 'enum', 'input', 'directive', 'extend'}
+# A keyword right after these tokens is a type reference or a continuation, not a new definition.
+CONTINUATION_TOKENS = {'=', '|', '&', '@', 'implements', 'extend'}
+
+_TOKEN_PATTERN = r'''
+      (?P<block_string>"""(?:\\"""|[^"]|"(?!""))*""")
+    | (?P<string>"(?:\\.|[^"\\\n\r])*")
+    | (?P<comment>\#[^\n\r]*)
+    | (?P<punctuator>[{}()\[\]=|&@:])
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+'''
+_TOKEN_REGEX = re.compile(_TOKEN_PATTERN, re.VERBOSE)
+_BYTES_TOKEN_REGEX = re.compile(_TOKEN_PATTERN.encode('ascii'), re.VERBOSE)
+
+
+class IntrospectionError(Exception):
+    """The schema of a server couldn't be introspected"""
 
 
 class SchemaLoader:
     """Represents a GraphQL Schema loaded from a string or file."""
 
+    parsed_documents: 'OrderedDict[str, DocumentNode]' = OrderedDict()
+
     @classmethod
     def from_sdl(cls, schema_string: str) -> GraphQLSchema:
         return build_schema(schema_string)
 
     @classmethod
-    def from_file(cls, filepath: str) -> GraphQLSchema:
+    def from_file(cls, filepath: str, low_memory: bool = False) -> GraphQLSchema:
+        """Build the schema defined on a file.
+
+        Args:
+            low_memory: Parse the file by parts without keeping source locations. See `from_paths`
+        """
+        if low_memory:
+            return cls.from_paths(str(filepath), low_memory=True)
+
         with open(filepath, encoding='utf-8') as f:
             schema_string = f.read()
 
         return cls.from_sdl(schema_string)
+
+    @classmethod
+    def from_paths(cls, patterns: Union[str, Iterable[str]], low_memory: bool = False) -> GraphQLSchema:
+        """Build a schema split across many files.
+
+        Args:
+            patterns: Files, directories (searched recursively for .graphql, .graphqls and .gql files) or globs
+            low_memory: For very large schemas. Files are memory mapped and their definitions are decoded
+                and parsed in batches without source locations, so neither the whole text of a file nor its
+                tokens are ever held in memory. Files are parsed sequentially and their documents aren't cached.
+        """
+        if low_memory:
+            definitions = []
+            for path in expand_paths(patterns):
+                definitions.extend(read_definitions(path))
+            return build_ast_schema(DocumentNode(definitions=definitions))
+
+        return cls.from_sources(cls.read_paths(patterns))
+
+    @classmethod
+    def from_sources(cls, sources: Dict[str, str]) -> GraphQLSchema:
+        """Build a schema from the SDL of many files, mapped by their names.
+
+        Files are parsed separately and their definitions are merged before building the schema.
+        Documents recently parsed in this process are reused if their content didn't change.
+        """
+        definitions = []
+        for document in cls.parse_sources(sources):
+            definitions.extend(document.definitions)
+        return build_ast_schema(DocumentNode(definitions=definitions))
+
+    @classmethod
+    def from_paths_with_locations(cls, patterns: Union[str, Iterable[str]]) -> Tuple[GraphQLSchema, 'LocationIndex']:
+        """Build a schema split across many files along with the index of where its members are defined.
+
+        Both come from the same parsed documents, so the files are parsed only once.
+        """
+        from schemadiff.locations import LocationIndex
+
+        documents = cls.parse_sources(cls.read_paths(patterns))
+        definitions = [definition for document in documents for definition in document.definitions]
+        return build_ast_schema(DocumentNode(definitions=definitions)), LocationIndex.from_documents(documents)
+
+    @classmethod
+    def parse_sources(cls, sources: Dict[str, str]) -> List[DocumentNode]:
+        """Parse the SDL of many files, reusing the documents recently parsed for the same file and content"""
+        # Documents keep the name of their file in their locations, so files with the same content aren't shared
+        hashes = {name: hashlib.md5(f'{name}\0{sdl}'.encode('utf-8')).hexdigest() for name, sdl in sources.items()}
+        # They are parsed in this process: sending parsed documents back from other processes costs more than parsing
+        for name, content_hash in hashes.items():
+            if content_hash not in cls.parsed_documents:
+                cls.parsed_documents[content_hash] = parse(Source(sources[name], name))
+
+        documents = []
+        for content_hash in hashes.values():
+            cls.parsed_documents.move_to_end(content_hash)
+            documents.append(cls.parsed_documents[content_hash])
+        while len(cls.parsed_documents) > PARSED_DOCUMENTS_LIMIT:
+            cls.parsed_documents.popitem(last=False)
+        return documents
+
+    @classmethod
+    def from_url(cls, url: str, headers: Optional[Dict[str, str]] = None,
+                 timeout: float = INTROSPECTION_TIMEOUT) -> GraphQLSchema:
+        """Build the schema of a running server with an introspection query.
+
+        Raises:
+            IntrospectionError: If the server can't be reached or its response isn't an introspection result
+        """
+        return build_client_schema(fetch_introspection(url, headers, timeout))
+
+    @staticmethod
+    def read_paths(patterns: Union[str, Iterable[str]]) -> Dict[str, str]:
+        """Read the content of the schema files matched by the given patterns, sorted by path"""
+        return {path: Path(path).read_bytes().decode('utf-8') for path in expand_paths(patterns)}
+
+
+def fetch_introspection(url: str, headers: Optional[Dict[str, str]] = None,
+                        timeout: float = INTROSPECTION_TIMEOUT) -> dict:
+    """Send an introspection query to a graphql endpoint and get the `data` of its response"""
+    request = urllib.request.Request(url, data=introspection_request_body(), method='POST',
+                                     headers=introspection_request_headers(headers))
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return introspection_data(url, response.read())
+    except (urllib.error.URLError, OSError) as e:
+        raise IntrospectionError(f"Can't introspect {url}: {e}") from e
+
+
+def introspection_request_body() -> bytes:
+    return json.dumps({'query': get_introspection_query(descriptions=True)}).encode('utf-8')
+
+
+def introspection_request_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    return {'Content-Type': 'application/json', 'Accept': 'application/json', **(headers or {})}
+
+
+def introspection_data(url: str, content: bytes) -> dict:
+    """Get the `data` of the response to an introspection query.
+
+    Raises:
+        IntrospectionError: If the response isn't an introspection result
+    """
+    try:
+        result = json.loads(content.decode('utf-8'))
+    except ValueError as e:
+        raise IntrospectionError(f"Can't introspect {url}: {e}") from e
+
+    if not isinstance(result, dict) or not isinstance(result.get('data'), dict):
+        errors = result.get('errors') if isinstance(result, dict) else None
+        raise IntrospectionError(f"Can't introspect {url}: {errors or 'the response has no data'}")
+    return result['data']
+
+
+def expand_paths(patterns: Union[str, Iterable[str]]) -> List[str]:
+    """List the files that files, directories or glob patterns point to.
+
+    Raises:
+        FileNotFoundError: If some pattern doesn't match any file
+    """
+    if isinstance(patterns, (str, Path)):
+        patterns = [patterns]
+
+    paths = set()
+    for pattern in map(str, patterns):
+        if os.path.isdir(pattern):
+            matches = [
+                str(path) for path in Path(pattern).rglob('*')
+                if path.suffix in SCHEMA_EXTENSIONS and path.is_file()
+            ]
+        elif any(char in pattern for char in GLOB_CHARACTERS):
+            matches = [path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path)]
+        elif os.path.isfile(pattern):
+            matches = [pattern]
+        else:
+            raise FileNotFoundError(f'No such file or directory: {pattern!r}')
+
+        if not matches:
+            raise FileNotFoundError(f'No schema files match {pattern!r}')
+        paths.update(matches)
+
+    return sorted(paths)
+
+
+def definition_starts(text: Union[str, bytes, mmap.mmap]) -> Iterator[int]:
+    """Yield the offsets where the top level definitions of a schema definition language text start.
+
+    This is a lightweight scan of the document (no AST is built) that only tracks nesting depth
+    and keywords, so it is much cheaper than parsing. It also scans bytes, like a memory mapped file.
+    The first offset is always 0 so leading comments belong to the first definition.
+    """
+    token_regex = _TOKEN_REGEX if isinstance(text, str) else _BYTES_TOKEN_REGEX
+    yield 0
+
+    depth = 0
+    description_start = None
+    previous = None
+    found_first = False
+    for match in token_regex.finditer(text):
+        kind = match.lastgroup
+        if kind == 'comment':
+            continue
+
+        is_description = depth == 0 and kind in ('block_string', 'string')
+        value = None
+        if kind in ('punctuator', 'name'):
+            value = match.group()
+            if not isinstance(value, str):
+                value = value.decode('ascii')
+
+        if kind == 'punctuator':
+            if value in '{([':
+                depth += 1
+            elif value in '})]':
+                depth -= 1
+        elif is_description:
+            if description_start is None:
+                description_start = match.start()
+        elif depth == 0 and kind == 'name' and value in DEFINITION_KEYWORDS and previous not in CONTINUATION_TOKENS:
+            if found_first:
+                yield match.start() if description_start is None else description_start
+            found_first = True
+
+        if not is_description:
+            description_start = None
+        previous = value
+
+
+def read_definitions(filepath: str, batch_size: Optional[int] = None) -> List:
+    """Parse the definitions of a file in batches of about `batch_size` bytes without source locations.
+
+    The file is memory mapped and only the text of the batch being parsed is decoded, and the pages
+    of the batches already parsed are released, so peak memory is dominated by the resulting AST.
+    """
+    batch_size = batch_size or LOW_MEMORY_BATCH_SIZE
+    with open(filepath, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            return list(parse(Source('', str(filepath))).definitions)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            definitions = []
+            batch_start = 0
+            line = 1
+            for start in definition_starts(mapped):
+                if start - batch_start >= batch_size:
+                    definitions.extend(_parse_batch(mapped, filepath, batch_start, start, line))
+                    line += mapped[batch_start:start].count(b'\n')
+                    _release_pages(mapped, start)
+                    batch_start = start
+            definitions.extend(_parse_batch(mapped, filepath, batch_start, len(mapped), line))
+
+    return definitions
+
+
+def _parse_batch(mapped: mmap.mmap, filepath: str, start: int, end: int, line: int) -> List:
+    text = str(mapped[start:end], 'utf-8')
+    try:
+        return list(parse(Source(text, str(filepath)), no_location=True).definitions)
+    except GraphQLSyntaxError:
+        # Parse again as if the batch was at its place in the file so the error points to the right line
+        column = len(str(mapped[mapped.rfind(b'\n', 0, start) + 1:start], 'utf-8')) + 1
+        padding = '\n' * (line - 1) + ' ' * (column - 1)
+        parse(Source(padding + text, str(filepath)), no_location=True)
+        raise
+
+
+def _release_pages(mapped: mmap.mmap, end: int) -> None:
+    # mmap.madvise is only available since python 3.8
+    end -= end % mmap.PAGESIZE
+    if end and hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+        mapped.madvise(mmap.MADV_DONTNEED, 0, end)
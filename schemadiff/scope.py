@@ -0,0 +1,135 @@
+"""Restrict a diff to some paths and kinds of changes before comparing anything.
+
+Path globs are checked against the names of types and directives before they are compared, so
+types out of scope are never compared, and kinds decide which phases of the comparison run at all.
+The changes of the types in scope are then checked one by one, once per distinct path.
+"""
+import re
+from fnmatch import fnmatchcase
+from typing import Dict, Iterable, List, Optional, Type, Union
+
+from schemadiff.changes import Change
+from schemadiff.changes.directive import DirectiveChange
+from schemadiff.changes.schema import SchemaChange
+from schemadiff.changes.type import AddedType, RemovedType, TypeRenamed
+
+GLOB_CHARACTERS = '*?['
+# Characters that end the name of a type or directive in a path, like in `Type.field` or `@directive(arg:)`
+_BOUNDARY = re.compile(r'[.(]')
+# Kinds of changes found without comparing the types both schemas have
+TYPE_LIST_KINDS = {AddedType.__name__, RemovedType.__name__, TypeRenamed.__name__}
+
+
+def change_kinds() -> Dict[str, Type[Change]]:
+    """Get every kind of change mapped by name"""
+    kinds = {}
+    pending = list(Change.__subclasses__())
+    while pending:
+        kind = pending.pop()
+        pending.extend(kind.__subclasses__())
+        kinds[kind.__name__] = kind
+    # Changes rebuilt from stored results have the kind of the change they were built from
+    kinds.pop('MaterializedChange', None)
+    return kinds
+
+
+class DiffScope:
+    """Paths and kinds of changes a diff is restricted to.
+
+    Args:
+        include: Globs of the paths to keep, like `Query.*` or `User`. A glob matching a path also matches
+            the paths inside it, so `User` keeps the changes on every field of `User`. Everything by default
+        exclude: Globs of the paths to leave out, even if they are included
+        kinds: Names (or classes) of the kinds of changes to keep. Every kind by default
+    """
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = (),
+                 kinds: Optional[Iterable[Union[str, Type[Change]]]] = None):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.kinds = None if kinds is None else frozenset(
+            kind if isinstance(kind, str) else kind.__name__ for kind in kinds
+        )
+        self._paths: Dict[Optional[str], bool] = {}
+
+    def key(self) -> dict:
+        """Describe the scope, like for the key of a cached result"""
+        return {
+            'include': sorted(self.include),
+            'exclude': sorted(self.exclude),
+            'kinds': None if self.kinds is None else sorted(self.kinds),
+        }
+
+    def includes_path(self, path: Optional[str]) -> bool:
+        if path not in self._paths:
+            prefixes = _prefixes(path or '')
+            self._paths[path] = (
+                (not self.include or any(_matches(prefixes, pattern) for pattern in self.include))
+                and not any(_matches(prefixes, pattern) for pattern in self.exclude)
+            )
+        return self._paths[path]
+
+    def includes_kind(self, kind: str) -> bool:
+        return self.kinds is None or kind in self.kinds
+
+    def includes(self, change: Change) -> bool:
+        return self.includes_kind(change.kind) and self.includes_path(change.path)
+
+    def filter(self, changes: Iterable[Change]) -> List[Change]:
+        return [change for change in changes if self.includes(change)]
+
+    def may_include_name(self, name: str) -> bool:
+        """Tell whether changes on a type (or on a directive, named like `@directive`) or its members may be kept"""
+        if any(fnmatchcase(name, pattern) for pattern in self.exclude):
+            return False
+        return not self.include or any(_may_match_inside(name, pattern) for pattern in self.include)
+
+    def compares_types(self) -> bool:
+        """Whether types both schemas have must be compared"""
+        return self.kinds is None or any(self._type_kind(kind) and kind not in TYPE_LIST_KINDS for kind in self.kinds)
+
+    def lists_types(self) -> bool:
+        """Whether added, removed and renamed types must be found"""
+        return self.kinds is None or any(self._type_kind(kind) for kind in self.kinds)
+
+    def compares_directives(self) -> bool:
+        return self._has_kinds_of(DirectiveChange)
+
+    def compares_schema_types(self) -> bool:
+        """Whether root operation types must be compared"""
+        return self._has_kinds_of(SchemaChange)
+
+    def _has_kinds_of(self, base: Type[Change]) -> bool:
+        if self.kinds is None:
+            return True
+        kinds = change_kinds()
+        return any(kind in kinds and issubclass(kinds[kind], base) for kind in self.kinds)
+
+    @staticmethod
+    def _type_kind(kind: str) -> bool:
+        kind_class = change_kinds().get(kind)
+        return kind_class is None or not issubclass(kind_class, (DirectiveChange, SchemaChange))
+
+
+def _prefixes(path: str) -> List[str]:
+    """Get a path and the paths of its parents, like `Type.field` and `Type`"""
+    return [path[:match.start()] for match in _BOUNDARY.finditer(path)] + [path]
+
+
+def _matches(prefixes: List[str], pattern: str) -> bool:
+    return any(fnmatchcase(prefix, pattern) for prefix in prefixes)
+
+
+def _may_match_inside(name: str, pattern: str) -> bool:
+    """Tell whether a pattern may match the path of a type or directive or of any of its members"""
+    literal_end = min([pattern.find(character) for character in GLOB_CHARACTERS if character in pattern],
+                      default=len(pattern))
+    literal = pattern[:literal_end]
+    boundary = _BOUNDARY.search(literal)
+    if boundary is not None:
+        # The name is written in full, like in `Query.*`
+        return literal[:boundary.start()] == name
+    if literal == pattern:
+        return name == pattern
+    # The paths matched start with the literal part of the pattern, so names must start with it too
+    return name.startswith(literal)
@@ -0,0 +1,212 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional, Union
+
+from schemadiff.changes import Change, Criticality
+from schemadiff.changeset import ChangeSet, MaterializedChange, CHECKSUM_SIZE, CRITICALITY_LEVELS
+from schemadiff.validation import rule_violation
+from schemadiff.validation_rules import ValidationRule
+
+MAGIC = b'SDIF'
+FORMAT_VERSION = 1
+# magic, format version, reserved, records count, strings count
+HEADER = struct.Struct('<4sHHII')
+# kind, level, padding, path, coordinate, reason, message, checksum
+RECORD = struct.Struct('<IB3xIIII16s')
+NO_STRING = 0xFFFFFFFF
+# Length of the json encoded rule violations that precede the encoded changes in `dumps_with_violations`
+VIOLATIONS_SIZE = struct.Struct('<I')
+
+
+class InvalidDiffBuffer(Exception):
+    """Exception raised when a buffer doesn't hold a diff result encoded by `dumps`"""
+
+
+def dumps(changes: Iterable[Change]) -> bytes:
+    """Encode a diff result into a compact binary buffer.
+
+    Layout (little endian):
+        header: magic `SDIF`, format version, records count and strings count
+        string table: `strings count + 1` uint32 offsets followed by the utf-8 encoded strings.
+            Kinds, paths, coordinates, reasons and messages are interned in it.
+        records: one fixed width record per change with string ids, criticality level and checksum
+    """
+    changeset = ChangeSet.from_changes(changes)
+    string_ids: Dict[str, int] = {}
+    strings: List[bytes] = []
+
+    def intern(string: Optional[str]) -> int:
+        if string is None:
+            return NO_STRING
+        if string not in string_ids:
+            string_ids[string] = len(strings)
+            strings.append(string.encode('utf-8'))
+        return string_ids[string]
+
+    records = bytearray()
+    for index in range(len(changeset)):
+        records += RECORD.pack(
+            intern(changeset.kinds[changeset.kind_column[index]]),
+            changeset.level_column[index],
+            intern(changeset.strings[changeset.path_column[index]]),
+            intern(changeset.strings[changeset.coordinate_column[index]]),
+            intern(changeset.strings[changeset.reason_column[index]]),
+            intern(changeset.message(index)),
+            bytes(changeset.checksums[index * CHECKSUM_SIZE:(index + 1) * CHECKSUM_SIZE]),
+        )
+
+    offsets = array('I', [0])
+    for string in strings:
+        offsets.append(offsets[-1] + len(string))
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(changeset), len(strings))
+    return b''.join((header, offsets.tobytes(), b''.join(strings), bytes(records)))
+
+
+def dump(changes: Iterable[Change], path: str) -> None:
+    with open(path, 'wb') as f:
+        f.write(dumps(changes))
+
+
+class DiffReader(Sequence):
+    """Read a buffer encoded by `dumps` without copying it.
+
+    Records and strings are decoded from a `memoryview` only when a change is accessed,
+    so the buffer can be a memory mapped file shared between processes.
+
+    Usage:
+        >>> with DiffReader.open('diff.bin') as changes:
+        ...     breaking = [change for change in changes if change.breaking]
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        if len(self._view) < HEADER.size:
+            raise InvalidDiffBuffer('Buffer is too short to hold a diff result')
+
+        magic, version, _, self._records_count, strings_count = HEADER.unpack_from(self._view)
+        if magic != MAGIC:
+            raise InvalidDiffBuffer('Buffer does not hold a diff result')
+        if version != FORMAT_VERSION:
+            raise InvalidDiffBuffer(f'Unsupported format version {version}. Expected version {FORMAT_VERSION}')
+        if len(self._view) < HEADER.size + (strings_count + 1) * 4:
+            raise InvalidDiffBuffer('Buffer size does not match its header')
+
+        self._offsets = self._view[HEADER.size:HEADER.size + (strings_count + 1) * 4].cast('I')
+        if sys.byteorder == 'big':
+            self._offsets = array('I', self._offsets)
+            self._offsets.byteswap()
+        self._strings_start = HEADER.size + (strings_count + 1) * 4
+        self._records_start = self._strings_start + self._offsets[strings_count]
+        if self._records_start + self._records_count * RECORD.size != len(self._view):
+            raise InvalidDiffBuffer('Buffer size does not match its header')
+
+    @classmethod
+    def open(cls, path: str) -> 'DiffReader':
+        """Memory map a file written by `dump`"""
+        with open(path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                raise InvalidDiffBuffer('Buffer is too short to hold a diff result')
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __len__(self):
+        return self._records_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('DiffReader index out of range')
+
+        kind, level, path, coordinate, reason, message, checksum = self._row(index)
+        return MaterializedChange(
+            kind=kind,
+            message=message,
+            path=path,
+            coordinate=coordinate,
+            criticality=Criticality(level=CRITICALITY_LEVELS[level], reason=reason),
+            checksum=checksum.hex(),
+        )
+
+    def _row(self, index: int):
+        kind, level, path, coordinate, reason, message, checksum = RECORD.unpack_from(
+            self._view, self._records_start + index * RECORD.size
+        )
+        return (
+            self.string(kind), level, self.string(path), self.string(coordinate),
+            self.string(reason), self.string(message), checksum,
+        )
+
+    def string(self, string_id: int) -> Optional[str]:
+        if string_id == NO_STRING:
+            return None
+        start = self._strings_start + self._offsets[string_id]
+        end = self._strings_start + self._offsets[string_id + 1]
+        return str(self._view[start:end], 'utf-8')
+
+    def to_changeset(self) -> ChangeSet:
+        """Copy the records into a `ChangeSet`. Changes are still built only when accessed"""
+        return ChangeSet.from_rows(self._row(index) + (None,) for index in range(len(self)))
+
+
+def loads(buffer: Union[bytes, bytearray, memoryview]) -> ChangeSet:
+    """Decode a buffer encoded by `dumps` into a `ChangeSet`"""
+    return DiffReader(buffer).to_changeset()
+
+
+def load(path: str) -> ChangeSet:
+    with DiffReader.open(path) as reader:
+        return reader.to_changeset()
+
+
+def dumps_with_violations(changes: Iterable[Change]) -> bytes:
+    """Encode a diff result along the messages of the validation rules each change violates.
+
+    Decoded changes can't be inspected by the rules, so this is how they can still be validated
+    after being cached or sent from another process.
+    """
+    changes = list(changes)
+    rules = ValidationRule.__subclasses__()
+    violations: Dict[int, Dict[str, str]] = {}
+    for index, change in enumerate(changes):
+        for rule in rules:
+            message = rule_violation(rule, change)
+            if message is not None:
+                violations.setdefault(index, {})[rule.name] = message
+
+    encoded_violations = json.dumps(violations).encode('utf-8')
+    return VIOLATIONS_SIZE.pack(len(encoded_violations)) + encoded_violations + dumps(changes)
+
+
+def loads_with_violations(buffer: Union[bytes, bytearray, memoryview]) -> ChangeSet:
+    """Decode a buffer encoded by `dumps_with_violations`, recording the violations of every change"""
+    violations_size, = VIOLATIONS_SIZE.unpack_from(buffer)
+    violations_end = VIOLATIONS_SIZE.size + violations_size
+    violations = json.loads(bytes(buffer[VIOLATIONS_SIZE.size:violations_end]).decode('utf-8'))
+    changes = loads(memoryview(buffer)[violations_end:])
+    for index, rule_messages in violations.items():
+        changes[int(index)].violations = rule_messages
+    return changes
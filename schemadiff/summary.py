@@ -0,0 +1,88 @@
+"""Aggregate counts of a diff, for dashboards that don't need the changes themselves.
+
+Changes are counted as the differs yield them, type by type, and dropped right away. Their
+messages and checksums, which take most of the time of building a `ChangeSet`, are never computed.
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Union
+
+from graphql import GraphQLSchema, is_schema
+
+from schemadiff.changes import Change, CriticalityLevel
+from schemadiff.diff.schema import Schema
+from schemadiff.formatting import LEVEL_NAMES
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.scope import DiffScope
+
+# Amount of paths of breaking changes kept as a sample
+SAMPLE_SIZE = 10
+
+
+@dataclass
+class DiffSummary:
+    levels: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(LEVEL_NAMES.values(), 0))
+    """Amount of `breaking`, `dangerous` and `safe` changes"""
+    kinds: Dict[str, int] = field(default_factory=dict)
+    """Amount of changes of every kind found, by kind name"""
+    breaking_paths: List[str] = field(default_factory=list)
+    """Paths of the first breaking changes found"""
+
+    @property
+    def total(self) -> int:
+        return sum(self.levels.values())
+
+    def to_dict(self) -> dict:
+        return {
+            'total': self.total,
+            'levels': self.levels,
+            'kinds': self.kinds,
+            'breaking_paths': self.breaking_paths,
+        }
+
+
+def summarize(changes: Iterable[Change], sample_size: int = SAMPLE_SIZE) -> DiffSummary:
+    """Count changes per level and kind, keeping the paths of the first breaking ones"""
+    levels: Counter = Counter()
+    kinds: Counter = Counter()
+    breaking_paths: List[str] = []
+    for change in changes:
+        level = change.criticality.level
+        levels[level] += 1
+        kinds[change.kind] += 1
+        if level == CriticalityLevel.Breaking and len(breaking_paths) < sample_size:
+            if change.path not in breaking_paths:
+                breaking_paths.append(change.path)
+
+    return DiffSummary(
+        levels={level_name: levels[level] for level, level_name in LEVEL_NAMES.items()},
+        kinds=dict(sorted(kinds.items())),
+        breaking_paths=breaking_paths,
+    )
+
+
+def diff_summary(old_schema: Union[str, GraphQLSchema], new_schema: Union[str, GraphQLSchema],
+                 detect_renames: bool = False, scope: Optional[DiffScope] = None,
+                 sample_size: int = SAMPLE_SIZE) -> DiffSummary:
+    """Compare two graphql schemas (as SDL or schemas) counting their changes instead of listing them.
+
+    Args:
+        detect_renames: Report removed and added types or fields that look alike as renames
+        scope: Compare only the types and directives of these paths and count only these kinds of changes
+        sample_size: Amount of paths of breaking changes to keep
+    """
+    old_schema = old_schema if is_schema(old_schema) else SchemaLoader.from_sdl(old_schema)
+    new_schema = new_schema if is_schema(new_schema) else SchemaLoader.from_sdl(new_schema)
+    return summarize(Schema(old_schema, new_schema, detect_renames, scope=scope).iter_changes(), sample_size)
+
+
+def format_summary(summary: DiffSummary) -> str:
+    """Format the counts of a summary, one kind of change per line"""
+    levels = ', '.join(f'{amount} {level_name}' for level_name, amount in summary.levels.items())
+    lines = [f'{summary.total} changes: {levels}']
+    if summary.kinds:
+        width = max(len(kind) for kind in summary.kinds)
+        lines.extend(f'  {kind:<{width}}  {amount}' for kind, amount in summary.kinds.items())
+    if summary.breaking_paths:
+        lines.append('Breaking changes on: ' + ', '.join(summary.breaking_paths))
+    return '\n'.join(lines)
@@ -1,8 +1,9 @@
-from schemadiff import Change
-from typing import List, Dict, Any
+from schemadiff.changes import Change
+from typing import List, Dict, Any, Optional, Type
 
 from dataclasses import dataclass
 
+from schemadiff.changeset import MaterializedChange
 from schemadiff.validation_rules import ValidationRule
 
 
@@ -34,16 +35,29 @@ def validate_changes(diff: List[Change], rules: List[str], allowed_changes: Dict
     rules = ValidationRule.get_subclasses_by_names(rules)
     for change in diff:
         for rule in rules:
-            if not rule(change).is_valid():
+            message = rule_violation(rule, change)
+            if message is not None:
                 if change.checksum() in allowed_changes:
                     continue
 
-                change.restricted = rule(change).message
+                change.restricted = message
                 is_valid = False
                 errors.append(ValidationError(rule.name, change.restricted, change))
 
     return ValidationResult(is_valid, errors)
 
 
+def rule_violation(rule: Type[ValidationRule], change: Change) -> Optional[str]:
+    """Get the message of the rule if the change violates it.
+
+    Changes read from a cache can't be inspected, but carry the violations found when they were computed.
+    """
+    if isinstance(change, MaterializedChange):
+        return change.violations.get(rule.name)
+
+    validation = rule(change)
+    return None if validation.is_valid() else validation.message
+
+
 def rules_list():
     return ValidationRule.get_rules_list()
@@ -0,0 +1,229 @@
+"""Re-diff the new schema every time its files are saved.
+
+Files are watched with inotify on Linux and by polling their modification times elsewhere.
+Bursts of writes (like editors saving through temporary files) are debounced into a single update.
+The old schema is parsed once, and the new one is compared with an `IncrementalDiff`, so only
+the edited definitions are parsed again on each update.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from graphql import GraphQLError
+
+from schemadiff.changeset import ChangeSet
+from schemadiff.incremental import IncrementalDiff
+from schemadiff.schema_loader import GLOB_CHARACTERS, SchemaLoader, expand_paths
+
+DEBOUNCE_SECONDS = 0.2
+POLL_INTERVAL = 0.5
+
+# inotify(7) flags
+IN_MODIFY = 0x2
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# Header of the events read from an inotify descriptor, followed by `len` bytes of the file name
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+class PollingWatcher:
+    """Detect changes of files by comparing their modification time and size"""
+
+    def __init__(self, patterns: Iterable[str], interval: float = POLL_INTERVAL):
+        self.patterns = list(patterns)
+        self.interval = interval
+        self._signature = self._current_signature()
+
+    def _current_signature(self) -> Dict[str, Tuple[int, int]]:
+        try:
+            paths = expand_paths(self.patterns)
+        except FileNotFoundError:
+            return {}
+        signature = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature[path] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until some file changes. Returns False if nothing changed before the timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signature = self._current_signature()
+            if signature != self._signature:
+                self._signature = signature
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(remaining, 0))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes of files with inotify, watching their directories to notice files being replaced.
+
+    Directories, and globs matching files in subdirectories (like `schema/**/*.graphql`), are watched
+    recursively, and subdirectories created later are watched as they appear.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(IN_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        # Watched directories and whether their subdirectories are watched too, by watch descriptor
+        self._watches: Dict[int, Tuple[str, bool]] = {}
+        try:
+            for pattern in patterns:
+                directory, recursive = watched_directory(pattern)
+                self._watch(directory, recursive)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, directory: str, recursive: bool) -> None:
+        directories = [root for root, _, _ in os.walk(directory)] if recursive else [directory]
+        for path in directories:
+            descriptor = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+            if descriptor < 0:
+                raise OSError(ctypes.get_errno(), f'Can not watch {path}')
+            # Watching a directory again gives back its descriptor, which stays recursive if it was
+            _, was_recursive = self._watches.get(descriptor, (path, False))
+            self._watches[descriptor] = (path, recursive or was_recursive)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until some file changes. Returns False if nothing changed before the timeout"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        self._drain()
+        return True
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+            self._watch_created_directories(data)
+
+    def _watch_created_directories(self, data: bytes) -> None:
+        offset = 0
+        while offset < len(data):
+            descriptor, mask, _cookie, length = INOTIFY_EVENT.unpack_from(data, offset)
+            name = data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0')
+            offset += INOTIFY_EVENT.size + length
+            directory, recursive = self._watches.get(descriptor, (None, False))
+            if recursive and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                try:
+                    self._watch(os.path.join(directory, os.fsdecode(name)), recursive=True)
+                except OSError:
+                    # Removed right after being created
+                    pass
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def watched_directory(pattern: str) -> Tuple[str, bool]:
+    """Get the directory to watch to notice changes of the files of a pattern, and whether to watch it recursively.
+
+    Globs are watched from the directory their literal part points to, like `schema` for `schema/*.graphql`,
+    and recursively when they match files in subdirectories too, like `schema/**/*.graphql`.
+    """
+    if os.path.isdir(pattern):
+        return pattern, True
+    glob_start = min([pattern.find(character) for character in GLOB_CHARACTERS if character in pattern],
+                     default=None)
+    if glob_start is None:
+        return os.path.dirname(os.path.abspath(pattern)), False
+
+    separator = pattern.rfind(os.sep, 0, glob_start)
+    directory = pattern[:separator] if separator > 0 else (os.sep if separator == 0 else '.')
+    return directory, os.sep in pattern[glob_start:]
+
+
+def file_watcher(patterns: Iterable[str]):
+    """Get an inotify watcher when the platform supports it, and a polling one otherwise"""
+    patterns = list(patterns)
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(patterns)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(patterns)
+
+
+def wait_for_changes(watcher, debounce: float = DEBOUNCE_SECONDS) -> None:
+    """Wait for a change and then until files stay untouched for `debounce` seconds"""
+    watcher.wait()
+    while watcher.wait(debounce):
+        pass
+
+
+def result_delta(previous: ChangeSet, current: ChangeSet) -> Tuple[ChangeSet, ChangeSet]:
+    """Get the changes that appeared and the ones that disappeared from one result to the next"""
+    appeared = current.filter(exclude_checksums=[previous.checksum(index) for index in range(len(previous))])
+    disappeared = previous.filter(exclude_checksums=[current.checksum(index) for index in range(len(current))])
+    return appeared, disappeared
+
+
+def read_sdl(patterns: Iterable[str]) -> str:
+    return '\n'.join(SchemaLoader.read_paths(patterns).values())
+
+
+def watch_diff(old_patterns: List[str], new_patterns: List[str], watcher=None, debounce: float = DEBOUNCE_SECONDS,
+               exclude_checksums: Iterable[str] = ()) -> Iterator[Tuple[ChangeSet, ChangeSet, ChangeSet]]:
+    """Compare the old schema with the new one every time the new schema files change.
+
+    Yields the initial result and then the result of each update, each as
+    `(changes, appeared, disappeared)`, where the last two are the delta with the previous result.
+    Updates that can't be parsed or built raise nothing: the error is printed and the previous result kept.
+    """
+    excluded = list(exclude_checksums)
+    # Watch before the first comparison so edits made meanwhile aren't missed
+    watcher = watcher or file_watcher(new_patterns)
+    try:
+        incremental = IncrementalDiff(SchemaLoader.from_paths(old_patterns), read_sdl(new_patterns))
+        previous = ChangeSet.from_changes(incremental.changes).filter(exclude_checksums=excluded)
+        yield previous, previous, ChangeSet()
+
+        while True:
+            wait_for_changes(watcher, debounce)
+            try:
+                changes = incremental.update(read_sdl(new_patterns))
+            # Schemas that parse but can't be built, like ones using a type not defined yet, raise TypeError
+            except (GraphQLError, TypeError, OSError) as e:
+                print(f"Can't compare the new schema: {e}", file=sys.stderr)
+                continue
+
+            current = ChangeSet.from_changes(changes).filter(exclude_checksums=excluded)
+            appeared, disappeared = result_delta(previous, current)
+            previous = current
+            if appeared or disappeared:
+                yield current, appeared, disappeared
+    finally:
+        watcher.close()
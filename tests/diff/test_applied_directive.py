@@ -0,0 +1,104 @@
+from graphql import build_schema as schema
+
+from schemadiff.changes import CriticalityLevel
+from schemadiff.changes.applied_directive import (
+    AppliedDirectiveAdded,
+    AppliedDirectiveArgumentChanged,
+    AppliedDirectiveRemoved,
+    CacheControlChanged,
+)
+from schemadiff.diff.schema import Schema
+
+DIRECTIVES = """
+enum Role { USER ADMIN }
+enum CacheControlScope { PUBLIC PRIVATE }
+directive @auth(role: Role) on OBJECT | FIELD_DEFINITION | ARGUMENT_DEFINITION | ENUM_VALUE | INPUT_FIELD_DEFINITION
+directive @tag(name: String) repeatable on OBJECT | FIELD_DEFINITION
+directive @cacheControl(maxAge: Int, scope: CacheControlScope) on OBJECT | FIELD_DEFINITION
+"""
+
+
+def diff(old, new):
+    return Schema(schema(DIRECTIVES + old), schema(DIRECTIVES + new)).diff()
+
+
+def test_directive_argument_changed_on_field():
+    changes = diff('type Query { a: Int @auth(role: USER) }', 'type Query { a: Int @auth(role: ADMIN) }')
+    assert len(changes) == 1
+    change = changes[0]
+    assert isinstance(change, AppliedDirectiveArgumentChanged)
+    assert change.message == "Argument `role` of directive `@auth` on `Query.a` changed from `USER` to `ADMIN`"
+    assert change.path == 'Query.a'
+    assert change.criticality.level == CriticalityLevel.Dangerous
+
+
+def test_directive_applied_to_type():
+    changes = diff('type Query { a: Int }', 'type Query @auth(role: ADMIN) { a: Int }')
+    assert [change.message for change in changes] == ["Directive `@auth(role: ADMIN)` was applied to `Query`"]
+    assert isinstance(changes[0], AppliedDirectiveAdded)
+
+
+def test_directive_removed_from_argument():
+    changes = diff('type Query { a(x: Int @auth(role: USER)): Int }', 'type Query { a(x: Int): Int }')
+    assert len(changes) == 1
+    change = changes[0]
+    assert isinstance(change, AppliedDirectiveRemoved)
+    assert change.message == "Directive `@auth(role: USER)` was removed from `Query.a(x:)`"
+    assert change.path == 'Query.a'
+
+
+def test_directives_on_enum_values_and_input_fields():
+    old = 'type Query { a(i: I): E } enum E { A B } input I { x: Int }'
+    new = 'type Query { a(i: I): E } enum E { A @auth(role: ADMIN) B } input I { x: Int @auth(role: ADMIN) }'
+    assert sorted(change.message for change in diff(old, new)) == [
+        "Directive `@auth(role: ADMIN)` was applied to `E.A`",
+        "Directive `@auth(role: ADMIN)` was applied to `I.x`",
+    ]
+
+
+def test_repeatable_directive_applications():
+    changes = diff(
+        'type Query { a: Int @tag(name: "a") @tag(name: "b") }',
+        'type Query { a: Int @tag(name: "b") @tag(name: "c") }',
+    )
+    assert sorted(change.message for change in changes) == [
+        'Directive `@tag(name: "a")` was removed from `Query.a`',
+        'Directive `@tag(name: "c")` was applied to `Query.a`',
+    ]
+
+
+def test_reduced_max_age_is_dangerous():
+    changes = diff('type Query { a: Int @cacheControl(maxAge: 60) }', 'type Query { a: Int @cacheControl(maxAge: 30) }')
+    assert len(changes) == 1
+    change = changes[0]
+    assert isinstance(change, CacheControlChanged)
+    assert change.message == (
+        "Cache control of `Query.a` changed from `@cacheControl(maxAge: 60)` to `@cacheControl(maxAge: 30)`"
+    )
+    assert change.criticality.level == CriticalityLevel.Dangerous
+
+
+def test_increased_max_age_is_safe():
+    changes = diff('type Query { a: Int @cacheControl(maxAge: 30) }', 'type Query { a: Int @cacheControl(maxAge: 60) }')
+    assert [change.criticality.level for change in changes] == [CriticalityLevel.NonBreaking]
+
+
+def test_removed_cache_control_is_dangerous():
+    changes = diff('type Query @cacheControl(maxAge: 60) { a: Int }', 'type Query { a: Int }')
+    assert [change.message for change in changes] == [
+        "Cache control of `Query` changed from `@cacheControl(maxAge: 60)` to `none`"
+    ]
+    assert changes[0].criticality.level == CriticalityLevel.Dangerous
+
+
+def test_private_scope_is_dangerous():
+    changes = diff(
+        'type Query { a: Int @cacheControl(maxAge: 60) }',
+        'type Query { a: Int @cacheControl(maxAge: 60, scope: PRIVATE) }',
+    )
+    assert changes[0].criticality.level == CriticalityLevel.Dangerous
+
+
+def test_deprecated_is_not_reported_as_applied_directive():
+    changes = diff('type Query { a: Int }', 'type Query { a: Int @deprecated(reason: "no") }')
+    assert not any(isinstance(change, AppliedDirectiveAdded) for change in changes)
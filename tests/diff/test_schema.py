@@ -1,3 +1,9 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
 from graphql import build_schema as schema
 
 from schemadiff.changes import Criticality
@@ -232,3 +238,43 @@ def test_schema_suscription_root_changed():
         'Type `ChangedSubscription` was added',
         'Schema subscription root has changed from `Subscription` to `ChangedSubscription`'
     }
+
+
+SORTING_OLD = """
+type Query { b: Int a(x: Int, y: Int): String z: Z }
+type Z { b: Int c: Int }
+type Removed { a: Int }
+enum E { B A C }
+directive @d(a: Int) on FIELD_DEFINITION
+"""
+
+SORTING_NEW = """
+type Query { c: Int a(y: String, w: Int): Int z: Z }
+type Z { a: Int }
+type Added implements I { a: Int }
+interface I { a: Int }
+enum E { D }
+directive @c on FIELD_DEFINITION
+directive @d(b: Int) on FIELD_DEFINITION
+"""
+
+
+@pytest.mark.parametrize('detect_renames', [False, True])
+def test_diff_is_ordered_by_path_and_kind(detect_renames):
+    changes = Schema(schema(SORTING_OLD), schema(SORTING_NEW), detect_renames).diff()
+    keys = [(change.path or '', change.kind) for change in changes]
+    assert keys == sorted(keys)
+    assert changes[0].path.startswith('@')
+
+
+def test_diff_order_does_not_depend_on_hash_seed():
+    script = (
+        'import sys; from schemadiff import diff; from tests.diff.test_schema import SORTING_OLD, SORTING_NEW; '
+        'print([change.message for change in diff(SORTING_OLD, SORTING_NEW)])'
+    )
+    outputs = {
+        subprocess.run([sys.executable, '-c', script], env={**os.environ, 'PYTHONHASHSEED': seed},
+                       capture_output=True, text=True, check=True).stdout
+        for seed in ('1', '2', '3')
+    }
+    assert len(outputs) == 1
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from graphql import build_schema, graphql_sync
+
+from schemadiff import adiff
+from schemadiff.aio import AsyncDiffer, InvalidSchemaError
+from schemadiff.schema_loader import IntrospectionError
+from schemadiff.validation import validate_changes
+
+OLD_SDL = 'type Query { a: Int, b: String }'
+NEW_SDL = 'type Query { a: Float, b: String }'
+
+
+class IntrospectionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    schemas = {'/old': build_schema(OLD_SDL), '/new': build_schema(NEW_SDL)}
+    delay = 0
+    client_ports = []
+
+    def do_POST(self):
+        self.client_ports.append(self.client_address[1])
+        time.sleep(self.delay)
+        query = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['query']
+        schema = self.schemas.get(self.path)
+        if schema is None:
+            body = {'errors': [{'message': 'Not found'}]}
+        else:
+            body = graphql_sync(schema, query).formatted
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        try:
+            self.wfile.write(content)
+        except BrokenPipeError:
+            # The client gave up waiting
+            pass
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), IntrospectionHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+    IntrospectionHandler.delay = 0
+    IntrospectionHandler.client_ports.clear()
+
+
+def messages(changes):
+    return [change.message for change in changes]
+
+
+def test_adiff_sdl_and_files(tmp_path):
+    (tmp_path / 'old.graphql').write_text(OLD_SDL)
+    expected = ['`Query.a` type changed from `Int` to `Float`']
+    assert messages(asyncio.run(adiff(OLD_SDL, NEW_SDL))) == expected
+    assert messages(asyncio.run(adiff(str(tmp_path / 'old.graphql'), NEW_SDL))) == expected
+
+
+def test_adiff_changes_are_validated():
+    changes = asyncio.run(adiff(OLD_SDL, 'type Query { a: Int, b: String, c: Int }'))
+    result = validate_changes(changes, ['add-field-without-description'])
+    assert [error.change.path for error in result.errors] == ['Query.c']
+
+
+def test_adiff_introspection_urls(server):
+    changes = asyncio.run(adiff(f'{server}/old', f'{server}/new'))
+    assert messages(changes) == ['`Query.a` type changed from `Int` to `Float`']
+
+
+def test_shared_differ_limits_concurrency(server):
+    IntrospectionHandler.delay = 0.2
+
+    async def compare_many():
+        async with AsyncDiffer(concurrency=2) as differ:
+            start = time.perf_counter()
+            results = await asyncio.gather(*(differ.diff(f'{server}/old', f'{server}/new') for _ in range(2)))
+            return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(compare_many())
+    assert all(len(changes) == 1 for changes in results)
+    # 4 requests, 2 at a time
+    assert elapsed >= 0.4
+
+
+def test_connections_are_reused(server):
+    async def load_many():
+        async with AsyncDiffer() as differ:
+            return [await differ.load(f'{server}/{path}') for path in ('old', 'new', 'old')]
+
+    schemas = asyncio.run(load_many())
+    assert [set(schema.query_type.fields) for schema in schemas] == [{'a', 'b'}] * 3
+    assert len(IntrospectionHandler.client_ports) == 3
+    assert len(set(IntrospectionHandler.client_ports)) == 1
+
+
+def test_differ_is_shared_between_event_loops(server):
+    differ = AsyncDiffer(concurrency=1)
+
+    async def compare_many():
+        return await asyncio.gather(*(differ.diff(f'{server}/old', f'{server}/new') for _ in range(2)))
+
+    for _ in range(2):
+        assert all(len(changes) == 1 for changes in asyncio.run(compare_many()))
+    differ.close()
+
+
+def test_invalid_sdl_errors_are_raised():
+    with pytest.raises(InvalidSchemaError, match='Syntax Error') as error:
+        asyncio.run(adiff('type Query {', NEW_SDL))
+    assert 'GraphQL request:1:13' in str(error.value)
+    with pytest.raises(InvalidSchemaError, match='Unknown type'):
+        asyncio.run(adiff('type Query { a: NotYetDefined }', NEW_SDL))
+
+
+def test_source_timeout(server):
+    IntrospectionHandler.delay = 1
+    differ = AsyncDiffer(timeout=0.1)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(adiff(f'{server}/old', NEW_SDL, differ=differ))
+    differ.close()
+
+
+def test_introspection_errors(server):
+    with pytest.raises(IntrospectionError, match='Not found'):
+        asyncio.run(adiff(f'{server}/missing', NEW_SDL))
+    with pytest.raises(IntrospectionError, match="Can't introspect"):
+        asyncio.run(adiff('http://127.0.0.1:1/graphql', NEW_SDL))
@@ -0,0 +1,112 @@
+import os
+import time
+from unittest.mock import patch
+
+from schemadiff import diff, diff_from_file, DiffCache
+from schemadiff.__main__ import main, parse_args
+from schemadiff.changeset import MaterializedChange
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.validation import validate_changes
+from tests.test_schema_loading import TESTS_DATA
+
+OLD_SDL = (TESTS_DATA / 'old_schema.gql').read_text()
+NEW_SDL = (TESTS_DATA / 'new_schema.gql').read_text()
+
+
+def as_dicts(changes):
+    return [change.to_dict() for change in changes]
+
+
+def test_cached_result_is_reused(tmp_path):
+    cache = DiffCache(str(tmp_path))
+    computed = diff(OLD_SDL, NEW_SDL, cache=cache)
+    assert len(os.listdir(str(tmp_path))) == 2  # The entry and the lock file
+
+    with patch('schemadiff.Schema') as schema:
+        cached = diff(OLD_SDL, NEW_SDL, cache=cache)
+    schema.assert_not_called()
+    assert all(isinstance(change, MaterializedChange) for change in cached)
+    assert as_dicts(cached) == as_dicts(computed)
+    assert as_dicts(diff_from_file(str(TESTS_DATA / 'old_schema.gql'), str(TESTS_DATA / 'new_schema.gql'),
+                                   cache=cache)) == as_dicts(computed)
+
+
+def test_keys_depend_on_inputs_and_options():
+    assert DiffCache.key(OLD_SDL, NEW_SDL) == DiffCache.key(OLD_SDL, NEW_SDL)
+    assert DiffCache.key(OLD_SDL, NEW_SDL) != DiffCache.key(NEW_SDL, OLD_SDL)
+    assert DiffCache.key(OLD_SDL, NEW_SDL) != DiffCache.key(OLD_SDL, NEW_SDL, detect_renames=True)
+
+
+def test_keys_of_schemas_depend_on_their_applied_directives(tmp_path):
+    cache = DiffCache(str(tmp_path))
+    sdl = 'directive @auth(role: String) on FIELD_DEFINITION\ntype Query {\n    a: Int\n}'
+    old = SchemaLoader.from_sdl(sdl)
+    new = SchemaLoader.from_sdl(sdl.replace('a: Int', 'a: Int @auth(role: "admin")'))
+    assert diff(old, old, cache=cache) == []
+    assert [change.message for change in diff(old, new, cache=cache)] == [
+        'Directive `@auth(role: "admin")` was applied to `Query.a`'
+    ]
+
+
+def test_engine_version_is_part_of_the_key():
+    key = DiffCache.key(OLD_SDL, NEW_SDL)
+    with patch('schemadiff.cache.engine_version', return_value='0.0.0'):
+        assert DiffCache.key(OLD_SDL, NEW_SDL) != key
+
+
+def test_expired_and_corrupt_entries_are_discarded(tmp_path):
+    cache = DiffCache(str(tmp_path), ttl=60)
+    key = DiffCache.key(OLD_SDL, NEW_SDL)
+    cache.put(key, diff(OLD_SDL, NEW_SDL))
+    assert cache.get(key) is not None
+
+    entry = tmp_path / (key + '.diff')
+    old = time.time() - 120
+    os.utime(str(entry), (old, old))
+    assert cache.get(key) is None
+    assert not entry.exists()
+
+    entry.write_bytes(b'garbage')
+    assert cache.get(key) is None
+    assert not entry.exists()
+
+
+def test_oldest_entries_are_evicted_over_max_size(tmp_path):
+    changes = diff(OLD_SDL, NEW_SDL)
+    cache = DiffCache(str(tmp_path))
+    cache.put('first', changes)
+    entry_size = (tmp_path / 'first.diff').stat().st_size
+    old = time.time() - 10
+    os.utime(str(tmp_path / 'first.diff'), (old, old))
+
+    cache.max_size = entry_size * 3 // 2
+    cache.put('second', changes)
+    assert cache.get('first') is None
+    assert cache.get('second') is not None
+
+    cache.clear()
+    assert cache.get('second') is None
+
+
+def test_validation_runs_on_cached_changes(tmp_path):
+    old = 'type Query { a: Int }'
+    new = 'type Query { a: Int }\ntype NoDescription { b: Int }'
+    cache = DiffCache(str(tmp_path))
+    computed = validate_changes(diff(old, new, cache=cache), ['add-type-without-description'])
+    cached_changes = diff(old, new, cache=cache)
+    cached = validate_changes(cached_changes, ['add-type-without-description'])
+
+    assert not computed.ok and not cached.ok
+    assert [error.reason for error in cached.errors] == [error.reason for error in computed.errors]
+    assert validate_changes(cached_changes, ['add-type-without-description'],
+                            {cached_changes[0].checksum(): 'Accepted'}).ok
+
+
+def test_cli_cache(tmp_path, capsys):
+    args = ['-o', str(TESTS_DATA / 'old_schema.gql'), '-n', str(TESTS_DATA / 'new_schema.gql'),
+            '--cache-dir', str(tmp_path / 'cache'), '--tolerant']
+    assert main(parse_args(args)) == 2
+    computed = capsys.readouterr().out
+    assert main(parse_args(args)) == 2
+    assert capsys.readouterr().out == computed
+    assert len(os.listdir(str(tmp_path / 'cache'))) == 2
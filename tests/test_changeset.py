@@ -0,0 +1,95 @@
+import pytest
+
+from schemadiff import diff, ChangeSet
+from schemadiff.changes import CriticalityLevel
+from schemadiff.changes.object import ObjectTypeFieldAdded, ObjectTypeFieldRemoved
+from schemadiff.changeset import MaterializedChange
+from tests.test_schema_loading import TESTS_DATA
+
+OLD_SDL = (TESTS_DATA / 'old_schema.gql').read_text()
+NEW_SDL = (TESTS_DATA / 'new_schema.gql').read_text()
+
+
+@pytest.fixture
+def changes():
+    return diff(OLD_SDL, NEW_SDL)
+
+
+def test_changeset_behaves_like_a_list(changes):
+    assert isinstance(changes, ChangeSet)
+    assert len(changes) == 38
+    as_list = list(changes)
+    assert changes == as_list
+    assert changes[-1] is as_list[-1]
+    assert changes[1:3] == as_list[1:3]
+    assert diff(OLD_SDL, OLD_SDL) == []
+    with pytest.raises(IndexError):
+        changes[38]
+
+
+def test_columns_match_the_changes(changes):
+    for i, change in enumerate(changes):
+        assert changes.message(i) == change.message
+        assert changes.checksum(i) == change.checksum()
+
+
+def test_filter(changes):
+    breaking = changes.filter(levels=[CriticalityLevel.Breaking])
+    assert list(breaking) == [change for change in changes if change.breaking]
+    assert changes.breaking == breaking
+
+    fields = changes.filter(kinds=[ObjectTypeFieldAdded, 'ObjectTypeFieldRemoved'])
+    assert sorted(change.message for change in fields) == [
+        'Field `b` was added to object type `CType`',
+        'Field `c` was removed from object type `CType`',
+    ]
+    assert list(changes.filter(path_prefix='CType.', levels=[CriticalityLevel.Breaking])) == [
+        change for change in changes if change.path.startswith('CType.') and change.breaking
+    ]
+
+    removed_field = next(change for change in changes if isinstance(change, ObjectTypeFieldRemoved))
+    allowed = changes.filter(exclude_checksums=[removed_field.checksum()])
+    assert len(allowed) == 37 and removed_field not in allowed
+
+
+def test_counts_and_groups(changes):
+    assert changes.counts('level') == {
+        level: sum(1 for change in changes if change.criticality.level == level)
+        for level in CriticalityLevel
+    }
+    assert changes.counts('kind')['FieldArgumentDescriptionChanged'] == 1
+
+    groups = changes.group_by('kind')
+    assert sum(len(group) for group in groups.values()) == len(changes)
+    assert all(change.kind == kind for kind, group in groups.items() for change in group)
+
+    with pytest.raises(ValueError, match='Unknown column'):
+        changes.counts('message')
+
+
+def test_groups_by_type(changes):
+    groups = changes.group_by('type')
+    assert sum(len(group) for group in groups.values()) == len(changes)
+    assert all(change.path == type_name or change.path.startswith((f'{type_name}.', f'{type_name}('))
+               for type_name, group in groups.items() if type_name for change in group)
+    assert changes.counts('type') == {type_name: len(group) for type_name, group in groups.items()}
+
+
+def test_changes_are_materialized_lazily(changes):
+    columnar = changes.take(range(len(changes)))
+    columnar._changes = [None] * len(changes)
+
+    materialized = columnar[0]
+    assert isinstance(materialized, MaterializedChange)
+    assert materialized.to_dict() == changes[0].to_dict()
+    assert materialized.kind == changes[0].kind
+    assert materialized.coordinate == changes[0].coordinate
+    assert columnar[0] is materialized
+
+
+def test_materialized_changes_have_their_own_violations(changes):
+    columnar = changes.take(range(len(changes)))
+    columnar._changes = [None] * len(changes)
+
+    columnar[0].violations['some-rule'] = 'Violated'
+    assert columnar[1].violations == {}
@@ -235,3 +235,118 @@ def test_cli_function(capsys):
         exit_code = cli()
         assert exit_code == 0
         assert capsys.readouterr().out == '🎉 Both schemas are equal!\n'
+
+
+def test_cli_accepts_directories_and_globs(tmp_path, capsys):
+    (tmp_path / 'old').mkdir()
+    (tmp_path / 'new').mkdir()
+    (tmp_path / 'old' / 'query.graphql').write_text('type Query { a: A }')
+    (tmp_path / 'old' / 'a.graphql').write_text('type A { b: Int }')
+    (tmp_path / 'new' / 'query.graphql').write_text('type Query { a: A }')
+    (tmp_path / 'new' / 'a.graphql').write_text('type A { b: Int, c: String }')
+
+    args = parse_args(['-o', str(tmp_path / 'old'), '-n', str(tmp_path / 'new' / '*.graphql')])
+    assert main(args) == 0
+    assert capsys.readouterr().out == '✔️ Field `c` was added to object type `A`\n'
+
+    args = parse_args(['-o', str(tmp_path / 'old' / 'query.graphql'), str(tmp_path / 'old' / 'a.graphql'),
+                       '-n', str(tmp_path / 'new')])
+    assert main(args) == 0
+    assert capsys.readouterr().out == '✔️ Field `c` was added to object type `A`\n'
+
+
+def test_glob_without_matches(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(['-o', str(tmp_path / '*.graphql'), '-n', 'tests/data/simple_schema.gql'])
+    assert 'No schema files match' in capsys.readouterr().err
+
+
+def test_low_memory_mode(capsys):
+    args = parse_args(['-o', 'tests/data/simple_schema.gql', '-n', 'tests/data/simple_schema_dangerous_changes.gql'])
+    assert main(args) == 0
+    expected = capsys.readouterr().out
+
+    args = parse_args(['-o', 'tests/data/simple_schema.gql', '-n', 'tests/data/simple_schema_dangerous_changes.gql',
+                       '--low-memory'])
+    assert main(args) == 0
+    assert capsys.readouterr().out == expected
+
+
+def test_cli_sarif_format_points_to_schema_files(capsys):
+    args = parse_args(['-o', 'tests/data/simple_schema.gql', '-n', 'tests/data/simple_schema_breaking_changes.gql',
+                       '--format', 'sarif'])
+    assert main(args) == 0
+    [result] = json.loads(capsys.readouterr().out)['runs'][0]['results']
+    location = result['locations'][0]['physicalLocation']
+    assert location['artifactLocation']['uri'] == 'tests/data/simple_schema.gql'
+
+
+def test_cli_locations_are_added_to_json_output(capsys):
+    args = parse_args(['-o', 'tests/data/simple_schema.gql', '-n', 'tests/data/simple_schema_breaking_changes.gql',
+                       '--as-json', '--locations'])
+    main(args)
+    [change] = json.loads(capsys.readouterr().out)
+    assert change['old_location']['file'] == 'tests/data/simple_schema.gql'
+    assert change['new_location']['file'] == 'tests/data/simple_schema_breaking_changes.gql'
+
+
+def test_cli_locations_need_source_locations():
+    with pytest.raises(SystemExit):
+        parse_args(['-o', 'tests/data/simple_schema.gql', '-n', 'tests/data/simple_schema.gql',
+                    '--locations', '--low-memory'])
+
+
+def test_cli_group_by_type_sorts_and_summarizes(capsys):
+    args = parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql',
+                       '--as-json', '--group-by-type'])
+    main(args)
+    groups = json.loads(capsys.readouterr().out)
+    assert [group['type'] for group in groups] == sorted(group['type'] for group in groups)
+    for group in groups:
+        assert sum(group['summary'].values()) == len(group['changes'])
+        paths = [change['path'] for change in group['changes']]
+        assert paths == sorted(paths)
+
+
+def test_cli_include_and_kinds(capsys):
+    args = parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql', '--as-json',
+                       '--include', 'Query', '--kinds', 'FieldArgumentAdded', 'FieldArgumentRemoved'])
+    main(args)
+    changes = json.loads(capsys.readouterr().out)
+    assert changes
+    assert all(change['path'].startswith('Query.') for change in changes)
+
+
+def test_cli_rejects_unknown_kinds():
+    with pytest.raises(SystemExit):
+        parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql', '--kinds', 'Nope'])
+
+
+def test_cli_summary(capsys):
+    args = parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql', '--summary', '-j',
+                       '--tolerant'])
+    assert main(args) == 2
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['total'] == sum(summary['levels'].values()) == sum(summary['kinds'].values())
+    assert summary['breaking_paths']
+
+
+def test_cli_summary_rejects_options_that_need_the_changes():
+    with pytest.raises(SystemExit):
+        parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql', '--summary',
+                    '--format', 'sarif'])
+
+
+@pytest.mark.parametrize('option', [['-j'], ['--format', 'sarif'], ['-r', 'add-type-without-description'],
+                                    ['--cache-dir', 'cache']])
+def test_cli_watch_rejects_options_it_would_ignore(option, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql', '--watch', *option])
+    assert "can't be combined with --watch" in capsys.readouterr().err
+
+
+def test_cli_summary_rejects_caching(capsys):
+    with pytest.raises(SystemExit):
+        parse_args(['-o', 'tests/data/old_schema.gql', '-n', 'tests/data/new_schema.gql', '--summary',
+                    '--cache-dir', 'cache'])
+    assert "--cache-dir can't be combined with --summary" in capsys.readouterr().err
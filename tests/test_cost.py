@@ -0,0 +1,97 @@
+import time
+
+from schemadiff.__main__ import main, parse_args
+from schemadiff.changes import CriticalityLevel
+from schemadiff.cost import CostModel, cost_changes
+from schemadiff.schema_loader import SchemaLoader
+
+OLD_SCHEMA = """
+type Query {
+    user: User
+    feed: [Post]
+}
+
+type User {
+    name: String
+    bestFriend: User
+}
+
+type Post {
+    title: String
+}
+"""
+
+
+def changes(old_sdl, new_sdl, model=None):
+    return cost_changes(SchemaLoader.from_sdl(old_sdl), SchemaLoader.from_sdl(new_sdl), model)
+
+
+def test_field_becoming_a_list_increases_cost():
+    result = changes(OLD_SCHEMA, OLD_SCHEMA.replace('bestFriend: User', 'bestFriend: [User]'))
+    assert [change.path for change in result] == ['Query.user']
+    change = result[0]
+    assert change.kind == 'QueryCostIncreased'
+    assert change.criticality.level == CriticalityLevel.Dangerous
+    assert change.old_cost == 5
+    assert change.new_cost == 11111
+    assert change.message == "Worst-case cost of queries on `Query.user` increased from `5` to `11111` (x2222.2)"
+
+
+def test_leaf_fields_are_free_by_default():
+    assert changes(OLD_SCHEMA, OLD_SCHEMA.replace('title: String', 'title: String\n    body: String')) == []
+
+
+def test_cost_within_tolerance_is_not_reported():
+    new_sdl = OLD_SCHEMA.replace('title: String', 'title: String\n    author: User')
+    assert [change.path for change in changes(OLD_SCHEMA, new_sdl)] == ['Query.feed']
+    assert changes(OLD_SCHEMA, new_sdl, CostModel(tolerance=10)) == []
+
+
+def test_list_size_directive():
+    directives = """
+    directive @listSize(assumedSize: Int, slicingArguments: [String!]) on FIELD_DEFINITION
+    directive @cost(weight: String!) on FIELD_DEFINITION | OBJECT
+    """
+    old_sdl = directives + OLD_SCHEMA.replace('feed: [Post]', 'feed(first: Int = 20): [Post] @listSize(assumedSize: 5)')
+    new_sdl = directives + OLD_SCHEMA.replace(
+        'feed: [Post]', 'feed(first: Int = 20): [Post] @listSize(slicingArguments: ["first"])'
+    )
+    result = changes(old_sdl, new_sdl)
+    assert [(change.old_cost, change.new_cost) for change in result] == [(5, 20)]
+
+    weighted = new_sdl.replace('type Post', 'type Post @cost(weight: "3")')
+    assert [(change.old_cost, change.new_cost) for change in changes(new_sdl, weighted)] == [(20, 60)]
+
+
+def test_recursive_types_are_bounded_by_depth():
+    model = CostModel(max_depth=3)
+    assert model.root_costs(SchemaLoader.from_sdl(OLD_SCHEMA)) == {'Query.user': 3, 'Query.feed': 10}
+
+
+def test_abstract_types_take_the_most_expensive_possible_type():
+    sdl = """
+    type Query { node: Node }
+    interface Node { id: ID }
+    type Cheap implements Node { id: ID }
+    type Expensive implements Node { id: ID, children: [Cheap] }
+    """
+    assert CostModel().root_costs(SchemaLoader.from_sdl(sdl)) == {'Query.node': 11}
+
+
+def test_large_schema_is_fast():
+    types = 2000
+    sdl = 'type Query {\n' + ''.join(f'  t{i}: T{i}\n' for i in range(types)) + '}\n' + ''.join(
+        f'type T{i} {{ a: Int, next: [T{(i + 1) % types}], other: T{(i * 7) % types} }}\n' for i in range(types)
+    )
+    schema = SchemaLoader.from_sdl(sdl)
+    start = time.perf_counter()
+    CostModel(max_depth=10).root_costs(schema)
+    assert time.perf_counter() - start < 5
+
+
+def test_cli_cost(tmp_path, capsys):
+    (tmp_path / 'old.graphql').write_text(OLD_SCHEMA)
+    (tmp_path / 'new.graphql').write_text(OLD_SCHEMA.replace('user: User', 'user: [User]'))
+    args = parse_args(['-o', str(tmp_path / 'old.graphql'), '-n', str(tmp_path / 'new.graphql'), '--cost'])
+    assert main(args) == 0
+    assert 'Worst-case cost of queries on `Query.user` increased from `5` to `50`' in capsys.readouterr().out
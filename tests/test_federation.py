@@ -0,0 +1,124 @@
+import pytest
+
+from schemadiff import federation
+from schemadiff.__main__ import main, parse_args
+from schemadiff.federation import (
+    InvalidSupergraph,
+    diff_subgraphs,
+    diff_supergraphs,
+    extract_subgraphs,
+    normalize_subgraph,
+)
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.validation import rules_list, validate_changes
+from tests.test_schema_loading import TESTS_DATA
+
+FEDERATION_DATA = TESTS_DATA / 'federation'
+OLD_SUPERGRAPH = (FEDERATION_DATA / 'old_supergraph.graphql').read_text()
+NEW_SUPERGRAPH = (FEDERATION_DATA / 'new_supergraph.graphql').read_text()
+
+
+def attributed(changes):
+    return sorted((change.subgraph, change.message) for change in changes)
+
+
+def test_extract_subgraphs():
+    subgraphs = extract_subgraphs(OLD_SUPERGRAPH)
+    assert set(subgraphs) == {'accounts', 'products', 'reviews'}
+
+    reviews = SchemaLoader.from_sdl(subgraphs['reviews'])
+    assert set(reviews.type_map['User'].fields) == {'id', 'reviews'}
+    assert set(reviews.type_map['Rating'].values) == {'GOOD', 'BAD'}
+    assert 'join__Graph' not in reviews.type_map
+    assert 'join__field' not in subgraphs['reviews']
+
+    accounts = SchemaLoader.from_sdl(subgraphs['accounts'])
+    assert set(accounts.query_type.fields) == {'me'}
+    assert 'Review' not in accounts.type_map
+
+
+def test_diff_supergraphs_attributes_changes_to_subgraphs():
+    changes = diff_supergraphs(OLD_SUPERGRAPH, NEW_SUPERGRAPH)
+    assert attributed(changes) == [
+        ('accounts', 'Field `email` was added to object type `User`'),
+        ('products', '`Product.price` type changed from `Int` to `Float`'),
+        ('reviews', 'Enum value `BAD` was removed from `Rating` enum'),
+    ]
+    assert changes[0].to_dict()['subgraph'] == 'accounts'
+
+
+def test_only_changed_subgraphs_are_compared(monkeypatch):
+    compared = []
+    diff_subgraph = federation._diff_subgraph
+    monkeypatch.setattr(federation, '_diff_subgraph', lambda *task: compared.append(task) or diff_subgraph(*task))
+
+    new_supergraph = OLD_SUPERGRAPH.replace('price: Int', 'price: Float')
+    assert attributed(diff_supergraphs(OLD_SUPERGRAPH, new_supergraph)) == [
+        ('products', '`Product.price` type changed from `Int` to `Float`'),
+    ]
+    assert len(compared) == 1
+
+
+def test_added_and_removed_subgraphs():
+    changes = diff_subgraphs({'a': 'type Query { a: Int }'}, {'b': 'type Query { b: Int }'})
+    assert ('a', 'Type `Query` was removed') in attributed(changes)
+    assert ('b', 'Type `Query` was added') in attributed(changes)
+
+
+def test_subgraphs_are_compared_in_parallel(monkeypatch):
+    monkeypatch.setattr(federation, 'PARALLEL_THRESHOLD', 0)
+    changes = diff_supergraphs(OLD_SUPERGRAPH, NEW_SUPERGRAPH, workers=2)
+    assert attributed(changes) == attributed(diff_supergraphs(OLD_SUPERGRAPH, NEW_SUPERGRAPH, workers=1))
+
+
+def test_changes_compared_in_parallel_are_validated(monkeypatch):
+    monkeypatch.setattr(federation, 'PARALLEL_THRESHOLD', 0)
+    result = validate_changes(diff_supergraphs(OLD_SUPERGRAPH, NEW_SUPERGRAPH, workers=2), list(rules_list()))
+    assert not result.ok
+    assert [(error.rule, error.change.path) for error in result.errors] == [('add-field-without-description',
+                                                                             'User.email')]
+
+
+def test_invalid_supergraph():
+    with pytest.raises(InvalidSupergraph, match='join__Graph'):
+        extract_subgraphs('type Query { a: Int }')
+
+
+def test_normalize_subgraph():
+    sdl = '''
+    extend schema @link(url: "https://specs.apollo.dev/federation/v2.0", import: ["@key", "@shareable"])
+
+    directive @custom on FIELD_DEFINITION
+
+    extend type Query {
+        user: User @custom
+    }
+
+    type User @key(fields: "id") {
+        id: ID! @shareable
+    }
+    '''
+    schema = SchemaLoader.from_sdl(normalize_subgraph(sdl))
+    assert set(schema.query_type.fields) == {'user'}
+    assert '@custom' in normalize_subgraph(sdl)
+    assert '@key' not in normalize_subgraph(sdl)
+
+
+def test_cli_federation(tmp_path, capsys):
+    args = parse_args(['-o', str(FEDERATION_DATA / 'old_supergraph.graphql'),
+                       '-n', str(FEDERATION_DATA / 'new_supergraph.graphql'), '--federation', 'supergraph'])
+    assert main(args) == 0
+    assert '❌ [reviews] Enum value `BAD` was removed from `Rating` enum' in capsys.readouterr().out
+
+    (tmp_path / 'old').mkdir()
+    (tmp_path / 'new').mkdir()
+    (tmp_path / 'old' / 'users.graphql').write_text('type Query { me: User }\ntype User @key(fields: "id") { id: ID! }')
+    (tmp_path / 'new' / 'users.graphql').write_text('type Query { me: User }\ntype User @key(fields: "id") { a: ID }')
+    args = parse_args(['-o', str(tmp_path / 'old'), '-n', str(tmp_path / 'new'), '--federation', 'subgraphs'])
+    assert main(args) == 0
+    assert '[users] Field `id` was removed from object type `User`' in capsys.readouterr().out
+
+    args = parse_args(['-o', 'tests/data/simple_schema.gql', '-n', 'tests/data/simple_schema.gql',
+                       '--federation', 'supergraph'])
+    assert main(args) == 1
+    assert 'not a supergraph' in capsys.readouterr().err
@@ -1,8 +1,19 @@
+import io
 import json
+from xml.etree import ElementTree
 
+from schemadiff import diff
 from schemadiff.diff.schema import Schema
+from schemadiff.locations import Location
 from schemadiff.schema_loader import SchemaLoader
-from schemadiff.formatting import print_diff, print_json
+from schemadiff.formatting import (
+    changes_by_type_to_dict,
+    format_diff_by_type,
+    print_diff,
+    print_json,
+    write_junit,
+    write_sarif,
+)
 from tests.test_schema_loading import TESTS_DATA
 
 
@@ -41,3 +52,76 @@ def test_print_json_shows_difference(capsys):
         },
         "checksum": '5fba3d6ffc43c6769c6959ce5cb9b1c8'
     }]
+
+
+GROUPING_OLD = """
+type Query { a: Int b: String }
+type User { name: String }
+directive @auth on FIELD_DEFINITION
+"""
+
+GROUPING_NEW = """
+type Query { a: Float c: Int }
+type User { name: String age: Int }
+"""
+
+
+def test_format_diff_by_type():
+    changes = diff(GROUPING_OLD, GROUPING_NEW)
+    assert format_diff_by_type(changes) == (
+        'Directives: 1 breaking, 0 dangerous, 0 safe\n'
+        '  ❌ Directive `@auth` was removed\n'
+        '\n'
+        'Query: 2 breaking, 0 dangerous, 1 safe\n'
+        '  ❌ `Query.a` type changed from `Int` to `Float`\n'
+        '  ❌ Field `b` was removed from object type `Query`\n'
+        '  ✔️ Field `c` was added to object type `Query`\n'
+        '\n'
+        'User: 0 breaking, 0 dangerous, 1 safe\n'
+        '  ✔️ Field `age` was added to object type `User`'
+    )
+    assert format_diff_by_type([]) == '🎉 Both schemas are equal!'
+
+
+def test_changes_by_type_to_dict():
+    groups = changes_by_type_to_dict(diff(GROUPING_OLD, GROUPING_NEW))
+    assert [(group['type'], group['summary']) for group in groups] == [
+        ('', {'breaking': 1, 'dangerous': 0, 'safe': 0}),
+        ('Query', {'breaking': 2, 'dangerous': 0, 'safe': 1}),
+        ('User', {'breaking': 0, 'dangerous': 0, 'safe': 1}),
+    ]
+    assert [change['path'] for change in groups[1]['changes']] == ['Query.a', 'Query.b', 'Query.c']
+
+
+def test_write_sarif():
+    changes = diff('type Query { a: Int, b: Int }', 'type Query { a: Int, c: Int }')
+    stream = io.StringIO()
+    write_sarif(changes, stream, lambda change: Location('schema.graphql', 3, 5) if change.path == 'Query.c' else None)
+    log = json.loads(stream.getvalue())
+    assert log['version'] == '2.1.0'
+    results = {result['ruleId']: result for result in log['runs'][0]['results']}
+    removed, added = results['ObjectTypeFieldRemoved'], results['ObjectTypeFieldAdded']
+    assert removed['level'] == 'error'
+    assert 'locations' not in removed
+    assert added['level'] == 'note'
+    assert added['locations'][0]['physicalLocation'] == {
+        'artifactLocation': {'uri': 'schema.graphql'}, 'region': {'startLine': 3, 'startColumn': 5},
+    }
+
+    empty = io.StringIO()
+    write_sarif([], empty)
+    assert json.loads(empty.getvalue())['runs'][0]['results'] == []
+
+
+def test_write_junit():
+    changes = diff('type Query { a: Int, b: Int }', 'type Query { a: Int, c: Int }')
+    stream = io.StringIO()
+    write_junit(changes, stream, lambda change: Location('schema.graphql', 1, 5))
+    suite = ElementTree.fromstring(stream.getvalue()).find('testsuite')
+    assert suite.attrib['tests'] == '2'
+    assert suite.attrib['failures'] == '1'
+    removed, added = sorted(suite.findall('testcase'), key=lambda testcase: testcase.attrib['name'])
+    assert removed.attrib['name'] == 'Field `b` was removed from object type `Query`'
+    assert removed.attrib['file'] == 'schema.graphql'
+    assert removed.find('failure').attrib['type'] == 'BREAKING'
+    assert added.find('failure') is None
@@ -0,0 +1,71 @@
+import pytest
+
+from schemadiff.changes import CriticalityLevel
+from schemadiff.history import HistoryIndex, HistoryEvent, InvalidHistoryIndex
+from schemadiff.schema_loader import SchemaLoader
+
+V1 = """
+type Query {
+    orders(status: String): [Order]
+}
+
+type Order {
+    id: ID
+}
+
+enum Status {
+    OPEN
+    CLOSED
+}
+"""
+V2 = V1.replace('id: ID', 'id: ID!\n    total: Float')
+V3 = V2.replace('status: String', 'status: String!').replace('CLOSED', '')
+
+
+def test_history_of_coordinates():
+    index = HistoryIndex.from_versions([('1.0', V1), ('1.1', V2), ('1.2', V3)])
+
+    assert index.history('Query.orders(status:)') == [
+        HistoryEvent('1.2', 'FieldArgumentTypeChanged', CriticalityLevel.Breaking),
+    ]
+    assert index.history('Order.id') == [HistoryEvent('1.1', 'FieldTypeChanged', CriticalityLevel.NonBreaking)]
+    assert index.history('Status.CLOSED') == [HistoryEvent('1.2', 'EnumValueRemoved', CriticalityLevel.Breaking)]
+    assert index.history('Query.unknown') == []
+
+
+def test_history_including_nested_coordinates():
+    index = HistoryIndex.from_versions([('1.0', V1), ('1.1', V2), ('1.2', V3)])
+
+    assert [event.version for event in index.history('Order', include_nested=True)] == ['1.1', '1.1']
+    assert index.history('Query', include_nested=True) == index.history('Query.orders(status:)')
+    assert index.history('Que', include_nested=True) == []
+
+
+def test_saved_index_can_be_extended(tmp_path):
+    path = str(tmp_path / 'history.json')
+    HistoryIndex.from_versions([('1.0', V1), ('1.1', V2)]).save(path)
+
+    index = HistoryIndex.load(path)
+    assert index.history('Order.id') == [HistoryEvent('1.1', 'FieldTypeChanged', CriticalityLevel.NonBreaking)]
+
+    changes = index.append('1.2', V3)
+    assert len(changes) == 2
+    assert index.versions == ['1.0', '1.1', '1.2']
+    assert [event.kind for event in index.history('Query.orders(status:)')] == ['FieldArgumentTypeChanged']
+
+
+def test_saved_schemas_keep_their_applied_directives(tmp_path):
+    path = str(tmp_path / 'history.json')
+    v1 = 'directive @auth(role: String) on FIELD_DEFINITION\n' + V1.replace('id: ID', 'id: ID @auth(role: "admin")')
+    index = HistoryIndex()
+    index.append('1.0', SchemaLoader.from_sdl(v1))
+    index.save(path)
+
+    assert HistoryIndex.load(path).append('1.1', v1) == []
+
+
+def test_load_invalid_index(tmp_path):
+    path = tmp_path / 'history.json'
+    path.write_text('{"format": 0}')
+    with pytest.raises(InvalidHistoryIndex, match='Unsupported history index format'):
+        HistoryIndex.load(str(path))
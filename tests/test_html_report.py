@@ -0,0 +1,84 @@
+import io
+import json
+import re
+
+from schemadiff import diff
+from schemadiff.changeset import ChangeSet
+from schemadiff.html_report import report_data, write_html
+from schemadiff.locations import Location
+
+OLD_SDL = '''
+type Query { a: Int b: String c: Int }
+enum Color { RED GREEN }
+'''
+
+NEW_SDL = '''
+type Query { a: Float c: Int d: ID }
+enum Color { RED }
+'''
+
+
+def embedded_data(html: str) -> dict:
+    [data] = re.findall(r'<script id="data" type="application/json">(.*?)</script>', html, re.DOTALL)
+    return json.loads(data)
+
+
+def test_data_is_column_wise():
+    changes = diff(OLD_SDL, NEW_SDL)
+    data = report_data(changes)
+    assert len(data['level']) == len(data['kind']) == len(data['path']) == len(data['message']) == len(changes)
+    for index, change in enumerate(changes):
+        assert data['levels'][data['level'][index]] == change.criticality.level.value
+        assert data['kinds'][data['kind'][index]] == change.kind
+        assert data['strings'][data['path'][index]] == change.path
+        assert data['strings'][data['reason'][index]] == change.criticality.reason
+        assert data['message'][index] == change.message
+    assert data['location'] == []
+
+
+def test_paths_are_interned_once():
+    changes = ChangeSet.from_changes(diff(OLD_SDL, NEW_SDL)).filter(path_prefix='Query')
+    data = report_data(changes)
+    assert sorted(data['strings'][path] for path in set(data['path'])) == ['Query.a', 'Query.b', 'Query.d']
+    assert 'Color' not in data['strings']
+
+
+def test_types_are_the_types_of_the_changes():
+    changes = diff(OLD_SDL, NEW_SDL)
+    data = report_data(changes, lambda change: Location('new.graphql', 1, 1))
+    assert sorted(data['types']) == ['Color', 'Query']
+    for index, change in enumerate(changes):
+        assert data['types'][data['type'][index]] == change.path.split('.')[0]
+
+
+def test_locations_are_looked_up_once_per_member():
+    calls = []
+
+    def locate(change):
+        calls.append(change.path)
+        return Location('new.graphql', 2, 14) if change.path == 'Query.a' else None
+
+    changes = diff(OLD_SDL, NEW_SDL)
+    data = report_data(list(changes) * 2, locate)
+    assert sorted(calls) == sorted(change.path for change in changes)
+    located = [data['strings'][location] for location in data['location'] if location >= 0]
+    assert located == ['new.graphql:2:14', 'new.graphql:2:14']
+
+
+def test_html_embeds_the_data():
+    changes = diff(OLD_SDL, NEW_SDL)
+    stream = io.StringIO()
+    write_html(changes, stream)
+    html = stream.getvalue()
+    assert html.startswith('<!DOCTYPE html>')
+    assert embedded_data(html) == report_data(changes)
+
+
+def test_data_can_not_end_its_script_element():
+    old = 'type Query { a: Int }'
+    new = '"""</script><script>alert(1)</script>""" type Query { a: Int }'
+    stream = io.StringIO()
+    write_html(diff(old, new), stream)
+    html = stream.getvalue()
+    assert '</script><script>alert' not in html
+    assert embedded_data(html)['message'] == [change.message for change in diff(old, new)]
@@ -0,0 +1,83 @@
+import json
+
+from schemadiff import diff
+from schemadiff.__main__ import main, parse_args
+from schemadiff.impact import ImpactIndex, annotate_impact
+from schemadiff.schema_loader import SchemaLoader
+
+SCHEMA = """
+type Query {
+    order(id: ID): Order
+    orders(filter: OrderFilter): [Order]
+    node: Node
+    version: String
+}
+
+type Mutation {
+    refund(amount: MoneyInput): Order
+}
+
+interface Node { id: ID }
+type Customer implements Node { id: ID, lastOrder: Order }
+type Order { id: ID, total: Money, customer: Customer }
+type Money { amount: Int, currency: String }
+input MoneyInput { amount: Int }
+input OrderFilter { minTotal: MoneyInput }
+type Orphan { money: Money }
+"""
+
+
+def index():
+    return ImpactIndex(SchemaLoader.from_sdl(SCHEMA))
+
+
+def test_affected_roots_follow_references_and_cycles():
+    impact = index()
+    assert sorted(impact.affected_roots('Money.amount')) == [
+        'Mutation.refund', 'Query.node', 'Query.order', 'Query.orders'
+    ]
+    assert sorted(impact.affected_roots('MoneyInput')) == ['Mutation.refund', 'Query.orders']
+    assert impact.affected_roots('Orphan') == []
+    assert impact.affected_roots('Query.version') == ['Query.version']
+    assert impact.affected_roots_count('Query') == 4
+    assert impact.affected_roots_count('Money') == 4
+
+
+def test_sample_paths_are_the_shortest_and_capped():
+    impact = index()
+    assert impact.sample_paths('Money') == [
+        ('Query.order', 'Order.total'),
+        ('Query.orders', 'Order.total'),
+        ('Mutation.refund', 'Order.total'),
+    ]
+    assert ImpactIndex(SchemaLoader.from_sdl(SCHEMA), samples=1).sample_paths('Customer') == [('Query.node',)]
+    assert ImpactIndex(SchemaLoader.from_sdl(SCHEMA), max_fanout=1).sample_paths('Order') == [('Query.order',)]
+
+
+def test_annotate_impact():
+    new_sdl = SCHEMA.replace('amount: Int, currency', 'amount: Float, currency')
+    old, new = SchemaLoader.from_sdl(SCHEMA), SchemaLoader.from_sdl(new_sdl)
+    changes = annotate_impact(diff(old, new), old, new)
+    assert len(changes) == 1
+    change = changes[0]
+    assert change.affected_roots == 4
+    assert change.impact_paths[0] == 'Query.order > Order.total > Money.amount'
+    assert change.to_dict()['affected_roots'] == 4
+
+
+def test_removed_types_use_the_old_schema():
+    old, new = SchemaLoader.from_sdl(SCHEMA), SchemaLoader.from_sdl(SCHEMA.replace('type Orphan { money: Money }', ''))
+    changes = annotate_impact(diff(old, new), old, new)
+    assert [(change.path, change.affected_roots) for change in changes] == [('Orphan', 0)]
+
+
+def test_cli_impact(tmp_path, capsys):
+    (tmp_path / 'old.graphql').write_text(SCHEMA)
+    (tmp_path / 'new.graphql').write_text(SCHEMA.replace('currency: String', 'currency: Int'))
+    arguments = ['-o', str(tmp_path / 'old.graphql'), '-n', str(tmp_path / 'new.graphql'), '--impact']
+    assert main(parse_args(arguments)) == 0
+    assert '(4 affected root fields)' in capsys.readouterr().out
+
+    assert main(parse_args(arguments + ['--as-json'])) == 0
+    [change] = json.loads(capsys.readouterr().out)
+    assert change['impact_paths'][0] == 'Query.order > Order.total > Money.currency'
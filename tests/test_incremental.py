@@ -0,0 +1,138 @@
+import pytest
+from graphql import GraphQLSyntaxError
+
+from schemadiff import diff, IncrementalDiff
+from schemadiff.incremental import split_definitions
+from tests.test_schema_loading import TESTS_DATA
+
+OLD_SCHEMA = """
+type Query {
+    a: Int
+    b: MyType
+}
+
+type MyType {
+    c: String
+    d(arg: MyInput = {}): Float
+}
+
+input MyInput {
+    x: Int = 1
+}
+
+enum Color {
+    RED
+    GREEN
+}
+"""
+
+
+def messages(changes):
+    return sorted(change.message for change in changes)
+
+
+def ordered_messages(changes):
+    return [change.message for change in changes]
+
+
+def test_split_definitions_keeps_descriptions_and_ignores_nested_keywords():
+    sdl = '''# leading comment
+"""Query root { with braces"""
+type Query {
+    type: String
+    input(enum: Int = 1): Int @deprecated(reason: "type Foo {")
+}
+union U = type | Query
+extend type Query {
+    b: U
+}
+directive @type on FIELD | OBJECT
+'''
+    chunks = split_definitions(sdl)
+    assert len(chunks) == 4
+    assert chunks[0].startswith('# leading comment\n"""Query root')
+    assert chunks[1].startswith('union U = type | Query')
+    assert chunks[2].startswith('extend type Query')
+    assert chunks[3].startswith('directive @type')
+    assert ''.join(chunks) == sdl
+
+
+def test_initial_changes_match_full_diff():
+    old_sdl = (TESTS_DATA / 'old_schema.gql').read_text()
+    new_sdl = (TESTS_DATA / 'new_schema.gql').read_text()
+    incremental = IncrementalDiff(old_sdl, new_sdl)
+    assert ordered_messages(incremental.changes) == ordered_messages(diff(old_sdl, new_sdl))
+
+
+def test_update_only_reparses_edited_definitions():
+    incremental = IncrementalDiff(OLD_SCHEMA, OLD_SCHEMA)
+    assert incremental.changes == []
+    parsed_before = dict(incremental._parsed_chunks)
+
+    new_sdl = OLD_SCHEMA.replace('c: String', 'c: String!')
+    changes = incremental.update(new_sdl)
+    assert messages(changes) == ['`MyType.c` type changed from `String` to `String!`']
+    assert messages(changes) == messages(diff(OLD_SCHEMA, new_sdl))
+
+    reused = [chunk for chunk in incremental._parsed_chunks if chunk in parsed_before]
+    assert len(reused) == 3
+    assert all(incremental._parsed_chunks[chunk] is parsed_before[chunk] for chunk in reused)
+
+
+def test_successive_updates_keep_result_consistent_with_full_diff():
+    incremental = IncrementalDiff(OLD_SCHEMA, OLD_SCHEMA)
+    edits = [
+        OLD_SCHEMA.replace('GREEN', 'GREEN\n    BLUE'),
+        OLD_SCHEMA.replace('GREEN', 'GREEN\n    BLUE').replace('a: Int', 'a: Int\n    e: Color'),
+        OLD_SCHEMA.replace('GREEN', 'BLUE'),
+        OLD_SCHEMA + '\ntype Added {\n    f: Int\n}\n',
+        OLD_SCHEMA.replace('enum Color {\n    RED\n    GREEN\n}\n', ''),
+        OLD_SCHEMA,
+    ]
+    for new_sdl in edits:
+        assert ordered_messages(incremental.update(new_sdl)) == ordered_messages(diff(OLD_SCHEMA, new_sdl))
+
+
+def test_editing_input_type_recomputes_defaults_that_embed_it():
+    incremental = IncrementalDiff(OLD_SCHEMA, OLD_SCHEMA)
+    new_sdl = OLD_SCHEMA.replace('x: Int = 1', 'x: Int = 2')
+    changes = incremental.update(new_sdl)
+    assert messages(changes) == messages(diff(OLD_SCHEMA, new_sdl))
+    assert any(change.path == 'MyType.d' for change in changes)
+
+
+def test_editing_nested_input_type_recomputes_defaults_of_inputs_embedding_it():
+    old = """
+    type Query {
+        f(a: A = {}): Int
+    }
+
+    input A {
+        b: B = {}
+    }
+
+    input B {
+        x: Int = 1
+    }
+    """
+    incremental = IncrementalDiff(old, old)
+    new_sdl = old.replace('x: Int = 1', 'x: Int = 2')
+    changes = incremental.update(new_sdl)
+    assert messages(changes) == messages(diff(old, new_sdl))
+    assert any(change.path == 'Query.f' for change in changes)
+
+
+def test_invalid_update_keeps_previous_result():
+    incremental = IncrementalDiff(OLD_SCHEMA, OLD_SCHEMA.replace('a: Int', 'a: Float'))
+    previous = incremental.changes
+    with pytest.raises(GraphQLSyntaxError):
+        incremental.update(OLD_SCHEMA.replace('a: Int', 'a: '))
+
+    assert incremental.changes == previous
+
+
+def test_applied_directive_only_edit_is_detected():
+    old = 'directive @auth(role: String) on FIELD_DEFINITION\n' + OLD_SCHEMA
+    incremental = IncrementalDiff(old, old)
+    changes = incremental.update(old.replace('c: String', 'c: String @auth(role: "admin")'))
+    assert messages(changes) == ['Directive `@auth(role: "admin")` was applied to `MyType.c`']
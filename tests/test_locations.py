@@ -0,0 +1,87 @@
+from schemadiff import diff
+from schemadiff.locations import Location, LocationIndex, SchemaLocations, annotate_locations
+from schemadiff.schema_loader import SchemaLoader
+
+OLD_SDL = '''"""The root"""
+type Query {
+    a: Int
+    "Removed soon"
+    b(limit: Int): String
+}
+
+enum Color { RED GREEN }
+
+directive @auth(role: String) on FIELD_DEFINITION
+'''
+
+NEW_SDL = '''type Query {
+    a: Float
+}
+
+extend type Query {
+    c: ID
+}
+
+enum Color { RED }
+'''
+
+
+def write_schemas(tmp_path):
+    (tmp_path / 'old.graphql').write_text(OLD_SDL)
+    (tmp_path / 'new.graphql').write_text(NEW_SDL)
+    return str(tmp_path / 'old.graphql'), str(tmp_path / 'new.graphql')
+
+
+def test_index_coordinates(tmp_path):
+    old_path, _ = write_schemas(tmp_path)
+    index = LocationIndex.from_paths(old_path)
+    assert index.get('Query') == Location(old_path, 2, 6)
+    assert index.get('Query.b') == Location(old_path, 5, 5)
+    assert index.get('Query.b(limit:)') == Location(old_path, 5, 7)
+    assert index.get('Color.GREEN') == Location(old_path, 8, 18)
+    assert index.get('@auth(role:)') == Location(old_path, 10, 17)
+    assert index.get('Missing') is None
+
+
+def test_extensions_add_their_members(tmp_path):
+    _, new_path = write_schemas(tmp_path)
+    index = LocationIndex.from_paths(new_path)
+    assert index.get('Query') == Location(new_path, 1, 6)
+    assert index.get('Query.c') == Location(new_path, 6, 5)
+
+
+def test_changes_are_located_in_new_or_old_schema(tmp_path):
+    old_path, new_path = write_schemas(tmp_path)
+    locations = SchemaLocations(LocationIndex.from_paths(old_path), LocationIndex.from_paths(new_path))
+    located = {change.path: locations.locate(change) for change in diff(OLD_SDL, NEW_SDL)}
+    assert located['Query.a'] == Location(new_path, 2, 5)
+    assert located['Query.b'] == Location(old_path, 5, 5)
+    # Removed enum values point to the value in the old schema rather than to the enum
+    assert located['Color'] == Location(old_path, 8, 18)
+    assert located['@auth'] == Location(old_path, 10, 12)
+
+
+def test_loader_builds_schema_and_locations(tmp_path):
+    _, new_path = write_schemas(tmp_path)
+    schema, index = SchemaLoader.from_paths_with_locations(new_path)
+    assert set(schema.query_type.fields) == {'a', 'c'}
+    assert index.get('Query.c') == Location(new_path, 6, 5)
+
+
+def test_annotated_changes_have_old_and_new_locations(tmp_path):
+    old_path, new_path = write_schemas(tmp_path)
+    changes = annotate_locations(diff(OLD_SDL, NEW_SDL), LocationIndex.from_paths(old_path),
+                                 LocationIndex.from_paths(new_path))
+    by_path = {change.path: change.to_dict() for change in changes}
+    assert by_path['Query.a']['old_location'] == {'file': old_path, 'line': 3, 'column': 5}
+    assert by_path['Query.a']['new_location'] == {'file': new_path, 'line': 2, 'column': 5}
+    assert by_path['Query.b']['old_location'] == {'file': old_path, 'line': 5, 'column': 5}
+    # Removed members point to their closest parent in the new schema
+    assert by_path['Query.b']['new_location'] == {'file': new_path, 'line': 1, 'column': 6}
+    assert 'new_location' not in by_path['@auth']
+
+
+def test_changes_without_locations_have_no_location_keys():
+    change = diff(OLD_SDL, NEW_SDL)[0]
+    assert 'old_location' not in change.to_dict()
+    assert 'new_location' not in change.to_dict()
@@ -0,0 +1,146 @@
+import json
+import shutil
+
+from schemadiff import diff
+from schemadiff.__main__ import main, parse_args
+from schemadiff.operations import OperationIndex, annotate_changes, operation_coordinates
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.serialization import dumps, loads
+from tests.test_schema_loading import TESTS_DATA
+
+SCHEMA = """
+type Query {
+    orders(status: Status, filter: OrderFilter): [Order]
+    me: User
+}
+
+type Order {
+    id: ID
+    total: Float
+}
+
+type User {
+    name: String
+}
+
+enum Status {
+    OPEN
+    CLOSED
+}
+
+input OrderFilter {
+    minTotal: Float
+    maxTotal: Float
+}
+"""
+
+
+def test_operation_coordinates():
+    coordinates = operation_coordinates(SchemaLoader.from_sdl(SCHEMA), """
+    query Orders($filter: OrderFilter) {
+        orders(status: OPEN, filter: $filter) {
+            ...OrderFields
+        }
+        literal: orders(filter: {minTotal: 10}) @include(if: true) {
+            id
+        }
+    }
+
+    fragment OrderFields on Order {
+        id
+    }
+    """)
+    assert coordinates == {
+        'Query.orders', 'Query.orders(status:)', 'Query.orders(filter:)', 'Status.OPEN', 'Order', 'Order.id',
+        'Status', 'OrderFilter', 'OrderFilter.minTotal', '@include', '@include(if:)', 'Boolean', 'ID',
+    }
+
+
+def test_changes_are_annotated_with_affected_operations(tmp_path):
+    (tmp_path / 'orders.graphql').write_text('{ orders(status: CLOSED) { id } }')
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'nested' / 'me.gql').write_text('{ me { name } }')
+    (tmp_path / 'invalid.graphql').write_text('{ me { ')
+    index = OperationIndex.from_directory(tmp_path, SCHEMA, workers=1)
+    assert sorted(index.files) == ['invalid', 'nested/me', 'orders']
+    assert list(index.errors) == ['invalid']
+
+    new_schema = (
+        SCHEMA.replace('total: Float', '').replace('CLOSED', 'CANCELLED')
+        .replace('name: String', 'name: String\n    email: String').replace('me: User', 'me(id: ID!): User')
+    )
+    changes = {change.message: change for change in annotate_changes(diff(SCHEMA, new_schema), index)}
+    assert changes['Field `total` was removed from object type `Order`'].affected_operations == []
+    assert changes['Enum value `CLOSED` was removed from `Status` enum'].affected_operations == ['orders']
+    assert changes['Enum value `CANCELLED` was added to `Status` enum'].affected_operations == ['orders']
+    assert changes['Argument `id: ID!` added to `Query.me`'].affected_operations == ['nested/me']
+    assert changes['Field `email` was added to object type `User`'].affected_operations == []
+    assert changes['Field `total` was removed from object type `Order`'].to_dict()['affected_operations'] == []
+
+
+def test_decoded_changes_are_annotated_with_affected_operations(tmp_path):
+    (tmp_path / 'orders.graphql').write_text('query ($f: OrderFilter) { orders(status: OPEN, filter: $f) { id } }')
+    index = OperationIndex.from_directory(tmp_path, SCHEMA, workers=1)
+    new_schema = SCHEMA.replace('CLOSED', 'CLOSED CANCELLED').replace('maxTotal: Float', 'maxTotal: Float eur: Boolean')
+    decoded = loads(dumps(diff(SCHEMA, new_schema)))
+    changes = {change.message: change for change in annotate_changes(decoded, index)}
+    assert changes['Enum value `CANCELLED` was added to `Status` enum'].affected_operations == ['orders']
+    added_field = 'Input Field `eur: Boolean` was added to input type `OrderFilter`'
+    assert changes[added_field].affected_operations == ['orders']
+
+
+def test_index_cache_only_reparses_modified_files(tmp_path):
+    operations = tmp_path / 'operations'
+    operations.mkdir()
+    (operations / 'orders.graphql').write_text('{ orders { id } }')
+    (operations / 'me.graphql').write_text('{ me { name } }')
+    cache = str(tmp_path / 'cache.json')
+
+    OperationIndex.from_directory(operations, SCHEMA, cache_path=cache, workers=1)
+    cached = json.loads(open(cache).read())
+    # Tamper the cache to prove unmodified files are not parsed again
+    cached['files']['me'][2] = []
+    with open(cache, 'w') as f:
+        json.dump(cached, f)
+
+    (operations / 'orders.graphql').write_text('{ orders { total } }')
+    index = OperationIndex.from_directory(operations, SCHEMA, cache_path=cache, workers=1)
+    assert index.operations('Order.total') == ['orders']
+    assert index.operations('Order.id') == []
+    assert index.operations('User.name') == []
+
+    # A different schema invalidates the whole cache
+    index = OperationIndex.from_directory(operations, SCHEMA + '\nscalar Date\n', cache_path=cache, workers=1)
+    assert index.operations('User.name') == ['me']
+
+
+def test_index_parses_in_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr('schemadiff.operations.PARALLEL_THRESHOLD', 0)
+    for i in range(4):
+        (tmp_path / f'op{i}.graphql').write_text('{ me { name } }')
+    index = OperationIndex.from_directory(tmp_path, SCHEMA, workers=2)
+    assert index.operations('User.name') == ['op0', 'op1', 'op2', 'op3']
+
+
+def test_cli_with_operations_ignores_changes_no_operation_uses(tmp_path, capsys):
+    shutil.copytree(TESTS_DATA / 'operations', tmp_path / 'operations')
+    args = parse_args([
+        '-o', str(TESTS_DATA / 'simple_schema.gql'),
+        '-n', str(TESTS_DATA / 'simple_schema_dangerous_changes.gql'),
+        '--operations', str(tmp_path / 'operations'),
+        '--strict',
+    ])
+    assert main(args) == 1
+    stdout = capsys.readouterr().out
+    assert 'changed from `0` to `100` (1 affected operations)' in stdout
+    assert (tmp_path / 'operations' / '.schemadiff-operations.json').exists()
+
+    args = parse_args([
+        '-o', str(TESTS_DATA / 'simple_schema.gql'),
+        '-n', str(TESTS_DATA / 'simple_schema_breaking_changes.gql'),
+        '--operations', str(TESTS_DATA / 'operations'),
+        '--operations-cache', str(tmp_path / 'cache.json'),
+        '--tolerant',
+    ])
+    assert main(args) == 2
+    assert '❌ Field `a` was removed from object type `Query` (1 affected operations)' in capsys.readouterr().out
@@ -0,0 +1,75 @@
+from schemadiff import diff
+from schemadiff.__main__ import main, parse_args
+from schemadiff.formatting import format_change_by_criticality
+from schemadiff.reachability import ReachabilityIndex, path_type, reachable_types
+from schemadiff.schema_loader import SchemaLoader
+
+OLD_SCHEMA = """
+type Query {
+    node(filter: Filter): Node
+    search: Result
+}
+
+interface Node { id: ID }
+type User implements Node { id: ID, profile: Profile }
+type Profile { bio: String }
+union Result = Post
+type Post { title: String }
+input Filter { kind: Kind }
+enum Kind { A B }
+
+type Orphan { a: Int, linked: Lonely }
+type Lonely { b: Int }
+"""
+
+NEW_SCHEMA = OLD_SCHEMA.replace('a: Int', 'a: Float').replace('bio: String', 'bio: Int').replace(
+    'enum Kind { A B }', 'enum Kind { A }'
+) + 'type Unused { c: Int }'
+
+
+def test_reachable_types():
+    schema = SchemaLoader.from_sdl(OLD_SCHEMA)
+    reachable = reachable_types(schema)
+    assert {'Query', 'Node', 'User', 'Profile', 'Result', 'Post', 'Filter', 'Kind', 'ID', 'String'} <= reachable
+    assert 'Orphan' not in reachable
+    assert 'Lonely' not in reachable
+    assert reachable_types(schema) is reachable
+
+
+def test_path_type():
+    assert path_type('User.profile') == 'User'
+    assert path_type('Query.node(filter:)') == 'Query'
+    assert path_type('@deprecated') == ''
+    assert path_type(None) == ''
+
+
+def test_filter_and_tag_unreachable_changes():
+    old, new = SchemaLoader.from_sdl(OLD_SCHEMA), SchemaLoader.from_sdl(NEW_SCHEMA)
+    changes = diff(old, new)
+    index = ReachabilityIndex(old, new)
+
+    assert sorted(change.path for change in index.filter(changes)) == ['Kind', 'Profile.bio']
+
+    index.tag(changes)
+    unreachable = sorted(change.path for change in changes if not change.reachable)
+    assert unreachable == ['Orphan.a', 'Unused']
+    orphan = next(change for change in changes if change.path == 'Orphan.a')
+    assert orphan.to_dict()['reachable'] is False
+    assert format_change_by_criticality(orphan).endswith('(unreachable)')
+
+
+def test_removed_root_reachable_types_are_kept():
+    old = SchemaLoader.from_sdl('type Query { a: A }\ntype A { x: Int }')
+    new = SchemaLoader.from_sdl('type Query { b: Int }')
+    assert sorted(change.path for change in ReachabilityIndex(old, new).filter(diff(old, new))) == [
+        'A', 'Query.a', 'Query.b'
+    ]
+
+
+def test_cli_reachable_only(tmp_path, capsys):
+    (tmp_path / 'old.graphql').write_text(OLD_SCHEMA)
+    (tmp_path / 'new.graphql').write_text(OLD_SCHEMA.replace('a: Int', 'a: Float'))
+    args = parse_args(['-o', str(tmp_path / 'old.graphql'), '-n', str(tmp_path / 'new.graphql'),
+                       '--reachable-only', '--strict'])
+    assert main(args) == 0
+    assert 'Both schemas are equal' in capsys.readouterr().out
@@ -0,0 +1,76 @@
+import pytest
+
+from schemadiff import diff
+from schemadiff.__main__ import registry_cli
+from schemadiff.registry import SchemaRegistry, RegistryError, MemberChanges
+from tests.test_schema_loading import TESTS_DATA
+
+OLD_SDL = (TESTS_DATA / 'old_schema.gql').read_text()
+NEW_SDL = (TESTS_DATA / 'new_schema.gql').read_text()
+
+
+@pytest.fixture
+def registry(tmp_path):
+    with SchemaRegistry(tmp_path / 'schemas.db') as registry:
+        yield registry
+
+
+def test_identical_types_are_stored_once(registry):
+    stored = registry.publish('users', '1.0', OLD_SDL)
+    assert stored > 0
+    assert registry.publish('users', '1.1', OLD_SDL) == 0
+    assert registry.publish('accounts', '1.0', OLD_SDL) == 0
+    assert registry.publish('users', '2.0', NEW_SDL) < stored + 5
+
+    assert registry.services() == ['accounts', 'users']
+    assert registry.versions('users') == ['1.0', '1.1', '2.0']
+
+
+def test_stored_version_is_rebuilt_equal_to_the_original(registry):
+    registry.publish('users', '1.0', OLD_SDL)
+    assert diff(registry.load('users', '1.0'), OLD_SDL) == []
+
+
+def test_diff_between_stored_versions(registry):
+    registry.publish('users', '1.0', OLD_SDL)
+    registry.publish('users', '1.1', OLD_SDL)
+    registry.publish('users', '2.0', NEW_SDL)
+
+    assert registry.changed_members('users', '1.0', '1.1') == MemberChanges()
+    assert registry.diff('users', '1.0', '1.1') == []
+
+    members = registry.changed_members('users', '1.0', '2.0')
+    assert members.added == {'DType', '@yolo2'}
+    assert members.removed == {'WillBeRemoved', '@willBeRemoved'}
+    assert 'Query' in members.changed and 'AnInterface' not in members.changed
+    changes = registry.diff('users', '1.0', '2.0')
+    assert [change.message for change in changes] == [change.message for change in diff(OLD_SDL, NEW_SDL)]
+
+
+def test_publishing_an_existing_version_fails(registry):
+    registry.publish('users', '1.0', OLD_SDL)
+    with pytest.raises(RegistryError, match='already published'):
+        registry.publish('users', '1.0', NEW_SDL)
+
+
+def test_loading_unknown_version_fails(registry):
+    with pytest.raises(RegistryError, match='was not found'):
+        registry.load_sdl('users', '1.0')
+
+
+def test_registry_cli(tmp_path, capsys):
+    database = str(tmp_path / 'schemas.db')
+    assert registry_cli(['-d', database, 'publish', 'users', '1.0', str(TESTS_DATA / 'simple_schema.gql')]) == 0
+    assert registry_cli([
+        '-d', database, 'publish', 'users', '2.0', str(TESTS_DATA / 'simple_schema_breaking_changes.gql')
+    ]) == 0
+    capsys.readouterr()
+
+    assert registry_cli(['-d', database, 'list', 'users']) == 0
+    assert capsys.readouterr().out == '1.0\n2.0\n'
+
+    assert registry_cli(['-d', database, 'diff', 'users', '1.0', '2.0']) == 0
+    assert capsys.readouterr().out == '❌ Field `a` was removed from object type `Query`\n'
+
+    assert registry_cli(['-d', database, 'show', 'users', '3.0']) == 1
+    assert 'Version `3.0` of `users` was not found' in capsys.readouterr().err
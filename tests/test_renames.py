@@ -0,0 +1,130 @@
+from graphql import build_schema as schema
+
+from schemadiff import diff
+from schemadiff.__main__ import main, parse_args
+from schemadiff.changes import Criticality
+from schemadiff.diff.schema import Schema
+from schemadiff.renames import match_renamed_types, match_renamed_fields, type_features, jaccard
+
+OLD = """
+type Query {
+    user(id: ID!): User
+    orders: [Order]
+}
+
+type User {
+    id: ID!
+    name: String
+    email: String
+    age: Int
+}
+
+type Order {
+    id: ID!
+    total: Float
+}
+
+enum Color {
+    RED
+    GREEN
+    BLUE
+}
+"""
+NEW = """
+type Query {
+    user(id: ID!): Customer
+    purchases: [Order]
+}
+
+type Customer {
+    id: ID!
+    name: String
+    email: String
+    age: Int
+    phone: String
+}
+
+type Order {
+    id: ID!
+    total: Float
+}
+
+enum Colour {
+    RED
+    GREEN
+    BLUE
+}
+"""
+
+
+def messages(changes):
+    return sorted(change.message for change in changes)
+
+
+def test_renames_are_not_detected_by_default():
+    assert 'Type `User` was removed' in messages(diff(OLD, NEW))
+
+
+def test_detect_type_and_field_renames():
+    changes = diff(OLD, NEW, detect_renames=True)
+    assert messages(changes) == [
+        'Field `Query.orders` was renamed to `Query.purchases`',
+        'Field `phone` was added to object type `Customer`',
+        'Type `Color` was renamed to `Colour`',
+        'Type `User` was renamed to `Customer`',
+        '`Query.user` type changed from `User` to `Customer`',
+    ]
+    renamed = next(change for change in changes if change.message == 'Type `User` was renamed to `Customer`')
+    assert renamed.path == 'Customer'
+    assert renamed.criticality.level == Criticality.breaking('').level
+
+
+def test_dissimilar_types_are_not_renames():
+    old = schema('type Query { a: Int }\ntype A { x: Int, y: Int, z: Int }')
+    new = schema('type Query { a: Int }\ntype B { u: String, v: String, x: Int }')
+    assert match_renamed_types([old.type_map['A']], [new.type_map['B']]) == []
+    assert messages(Schema(old, new, detect_renames=True).diff()) == ['Type `A` was removed', 'Type `B` was added']
+
+
+def test_ambiguous_field_renames_are_not_paired():
+    old = schema('type Query { a: Int, b: Int, c: String }')
+    new = schema('type Query { x: Int, y: Int, z: String }')
+    pairs = match_renamed_fields(old.query_type.fields, new.query_type.fields, {'a', 'b', 'c'}, {'x', 'y', 'z'})
+    assert pairs == [('c', 'z')]
+
+
+def test_rename_detection_pairs_thousands_of_types():
+    types = 1000
+    old = ['type Query { a: Int }'] + [
+        f'type Old{i} {{ field{i}: Int, other{i}: String, shared: ID, extra{i}: Float }}' for i in range(types)
+    ]
+    new = ['type Query { a: Int }'] + [
+        f'type New{i} {{ field{i}: Int, other{i}: String, shared: ID, extra{i}: Float, added: Int }}'
+        for i in range(types)
+    ]
+    old_schema, new_schema = schema('\n'.join(old)), schema('\n'.join(new))
+
+    pairs = match_renamed_types(
+        [old_schema.type_map[f'Old{i}'] for i in range(types)],
+        [new_schema.type_map[f'New{i}'] for i in range(types)],
+    )
+    assert sorted((old.name, new.name) for old, new in pairs) == sorted(
+        (f'Old{i}', f'New{i}') for i in range(types)
+    )
+
+
+def test_type_features_ignore_the_type_name():
+    old = schema('type Query { a: Int }\ntype A { x(arg: Int): Int }')
+    new = schema('type Query { a: Int }\ntype B { x(arg: Int): Int }')
+    assert type_features(old.type_map['A']) == type_features(new.type_map['B']) == {
+        'x', 'x: Int', 'x(arg: Int)'
+    }
+    assert jaccard(type_features(old.type_map['A']), type_features(new.type_map['B'])) == 1
+
+
+def test_cli_detect_renames(tmp_path, capsys):
+    old, new = tmp_path / 'old.gql', tmp_path / 'new.gql'
+    old.write_text(OLD)
+    new.write_text(NEW)
+    assert main(parse_args(['-o', str(old), '-n', str(new), '--detect-renames'])) == 0
+    assert '❌ Type `User` was renamed to `Customer`' in capsys.readouterr().out
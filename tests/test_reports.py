@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from schemadiff import DiffCache, diff
+from schemadiff.__main__ import delta_cli
+from schemadiff.formatting import json_dump_changes
+from schemadiff.reports import ADDED, REMOVED, InvalidReport, _iter_json_array, diff_reports, read_changes
+from schemadiff.serialization import dump
+
+OLD_SDL = 'type Query { a: Int, b: String, c: ID }'
+FIRST_PUSH = 'type Query { a: Float, b: String }'
+SECOND_PUSH = 'type Query { a: Float, b: Int }'
+
+
+@pytest.fixture
+def results(tmp_path):
+    first, second = diff(OLD_SDL, FIRST_PUSH), diff(OLD_SDL, SECOND_PUSH)
+    (tmp_path / 'first.json').write_text(json_dump_changes(first))
+    (tmp_path / 'second.ndjson').write_text(''.join(change.to_json() + '\n' for change in second))
+    dump(second, str(tmp_path / 'second.bin'))
+    (tmp_path / 'second-by-type.json').write_text(json_dump_changes(second, group_by_type=True))
+    return tmp_path
+
+
+def statuses(previous, current):
+    return [(status, change.message) for status, change in diff_reports(str(previous), str(current))]
+
+
+def test_read_changes_of_every_format(results):
+    expected = [change.to_dict() for change in diff(OLD_SDL, SECOND_PUSH)]
+    assert [change.to_dict() for change in read_changes(str(results / 'second.ndjson'))] == expected
+    assert [change.to_dict() for change in read_changes(str(results / 'second.bin'))] == expected
+    assert len(list(read_changes(str(results / 'first.json')))) == 2
+    assert [change.to_dict() for change in read_changes(str(results / 'second-by-type.json'))] == expected
+
+
+def test_diff_reports(results):
+    assert statuses(results / 'first.json', results / 'second.ndjson') == [
+        (ADDED, '`Query.b` type changed from `String` to `Int`'),
+    ]
+    assert statuses(results / 'second.bin', results / 'first.json') == [
+        (REMOVED, '`Query.b` type changed from `String` to `Int`'),
+    ]
+    assert statuses(results / 'second.bin', results / 'second.ndjson') == []
+
+
+def test_cache_entries(tmp_path):
+    cache = DiffCache(str(tmp_path / 'cache'))
+    key = DiffCache.key(OLD_SDL, SECOND_PUSH)
+    cache.put(key, diff(OLD_SDL, SECOND_PUSH))
+    entry = cache._path(key)
+    assert [change.message for change in read_changes(entry)] == [
+        change.message for change in diff(OLD_SDL, SECOND_PUSH)
+    ]
+
+
+def text_reader(text):
+    class Reader:
+        def __init__(self):
+            self.text = text
+
+        def read(self, size):
+            chunk, self.text = self.text[:size], self.text[size:]
+            return chunk
+    return Reader()
+
+
+def test_json_array_is_decoded_in_chunks():
+    items = [{'message': 'x' * 50, 'n': n} for n in range(100)]
+    text = json.dumps(items, indent=4)
+    assert list(_iter_json_array(text_reader(text[1:]), chunk_size=7)) == items
+
+    with pytest.raises(InvalidReport):
+        list(_iter_json_array(text_reader('{"message": "a"}, {"mess')))
+
+
+def test_invalid_report(tmp_path):
+    (tmp_path / 'report.txt').write_text('❌ Field removed')
+    with pytest.raises(InvalidReport):
+        list(read_changes(str(tmp_path / 'report.txt')))
+
+
+def test_delta_cli(results, capsys):
+    assert delta_cli([str(results / 'first.json'), str(results / 'second.bin')]) == 0
+    assert capsys.readouterr().out == '+ ❌ `Query.b` type changed from `String` to `Int`\n'
+
+    assert delta_cli([str(results / 'second.bin'), str(results / 'first.json'), '--as-json']) == 0
+    [line] = capsys.readouterr().out.splitlines()
+    assert json.loads(line)['status'] == 'removed'
+
+    assert delta_cli([str(results / 'missing.json'), str(results / 'first.json')]) == 1
@@ -0,0 +1,84 @@
+import json
+import sys
+
+import pytest
+
+from schemadiff import scan as scan_module
+from schemadiff.__main__ import SUBCOMMANDS, scan_cli
+from schemadiff.scan import InvalidManifest, Service, read_manifest, scan, scan_report
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    (tmp_path / 'released').mkdir()
+    (tmp_path / 'deployed').mkdir()
+    schemas = {
+        'accounts': ('type Query { me: String, id: ID }', 'type Query { me: String }'),
+        'products': ('type Query { a: Int }', 'type Query { a: Int, b: Int }'),
+        'reviews': ('type Query { a: Int }', 'type Query { a: Int'),
+    }
+    for name, (old, new) in schemas.items():
+        (tmp_path / 'released' / f'{name}.graphql').write_text(old)
+        (tmp_path / 'deployed' / f'{name}.graphql').write_text(new)
+
+    (tmp_path / 'fleet.yaml').write_text('services:\n' + ''.join(
+        f'  - name: {name}\n    old: released/{name}.graphql\n    new: deployed/{name}.graphql\n'
+        for name in schemas
+    ))
+    return tmp_path
+
+
+def test_read_manifest(fleet):
+    services = read_manifest(fleet / 'fleet.yaml')
+    assert [service.name for service in services] == ['accounts', 'products', 'reviews']
+    assert services[0].old == str(fleet / 'released' / 'accounts.graphql')
+
+    (fleet / 'fleet.json').write_text(json.dumps({'services': [{'name': 'a', 'old': '/a', 'new': 'http://a/graphql'}]}))
+    assert read_manifest(fleet / 'fleet.json') == [Service('a', '/a', 'http://a/graphql')]
+
+
+@pytest.mark.parametrize('content', [
+    'services: [',
+    'services: 1',
+    'services:\n  - name: a\n    old: a.graphql',
+    'other: []',
+])
+def test_invalid_manifest(tmp_path, content):
+    (tmp_path / 'fleet.yaml').write_text(content)
+    with pytest.raises(InvalidManifest):
+        read_manifest(tmp_path / 'fleet.yaml')
+
+
+def test_yaml_manifest_without_pyyaml(fleet, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'yaml', None)
+    with pytest.raises(InvalidManifest, match=r'graphql-schema-diff\[yaml\]'):
+        read_manifest(fleet / 'fleet.yaml')
+
+
+def test_scan_tolerates_failures(fleet):
+    results = scan(read_manifest(fleet / 'fleet.yaml'))
+    accounts, products, reviews = results
+    assert accounts.counts == {'breaking': 1, 'dangerous': 0, 'safe': 0}
+    assert products.counts == {'breaking': 0, 'dangerous': 0, 'safe': 1}
+    assert reviews.failed
+    assert reviews.error.startswith('GraphQLSyntaxError')
+
+    report = scan_report(results)
+    assert report['totals'] == {'breaking': 1, 'dangerous': 0, 'safe': 1}
+    assert report['failed'] == ['reviews']
+    assert report['services'][0]['changes'][0]['message'] == 'Field `id` was removed from object type `Query`'
+
+
+def test_scan_in_parallel(fleet, monkeypatch):
+    monkeypatch.setattr(scan_module, 'PARALLEL_THRESHOLD', 0)
+    services = read_manifest(fleet / 'fleet.yaml')
+    assert scan_report(scan(services, workers=2)) == scan_report(scan(services, workers=1))
+
+
+def test_cli_scan(fleet, capsys):
+    assert SUBCOMMANDS['scan'] is scan_cli
+    assert scan_cli([str(fleet / 'fleet.yaml'), '--report', str(fleet / 'report.json')]) == 1
+    output = capsys.readouterr().out
+    assert 'accounts         1          0     0' in output
+    assert 'reviews   failed: GraphQLSyntaxError' in output
+    assert json.loads((fleet / 'report.json').read_text())['failed'] == ['reviews']
@@ -1,9 +1,12 @@
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
-from graphql import is_schema, GraphQLSyntaxError
+from graphql import is_schema, print_schema, GraphQLSyntaxError
+from graphql.language import SourceLocation
 
 from schemadiff import diff, diff_from_file
+from schemadiff import schema_loader
 from schemadiff.schema_loader import SchemaLoader
 
 TESTS_DATA = Path(__file__).parent / 'data'
@@ -80,3 +83,96 @@ def test_load_invalid_schema():
 def test_load_empty_schema(schema):
     with pytest.raises(GraphQLSyntaxError):
         SchemaLoader.from_sdl(schema)
+
+
+@pytest.fixture
+def split_schema(tmp_path):
+    (tmp_path / 'types').mkdir()
+    (tmp_path / 'schema.graphql').write_text('type Query { user: User }')
+    (tmp_path / 'types' / 'user.graphql').write_text('type User { id: ID! }')
+    (tmp_path / 'types' / 'extensions.gql').write_text('extend type User { name: String }')
+    (tmp_path / 'types' / 'notes.txt').write_text('Not a schema')
+    return tmp_path
+
+
+def test_load_from_directory(split_schema):
+    schema = SchemaLoader.from_paths(str(split_schema))
+    assert set(schema.type_map['User'].fields) == {'id', 'name'}
+
+
+def test_load_from_globs(split_schema):
+    schema = SchemaLoader.from_paths([str(split_schema / '*.graphql'), str(split_schema / 'types' / '*.graphql')])
+    assert set(schema.type_map['User'].fields) == {'id'}
+
+
+def test_load_from_paths_errors(split_schema):
+    with pytest.raises(FileNotFoundError, match='No such file or directory'):
+        SchemaLoader.from_paths(str(split_schema / 'missing.graphql'))
+    with pytest.raises(FileNotFoundError, match='No schema files match'):
+        SchemaLoader.from_paths(str(split_schema / '*.gqls'))
+
+    (split_schema / 'types' / 'broken.graphql').write_text('type {')
+    with pytest.raises(GraphQLSyntaxError) as error:
+        SchemaLoader.from_paths(str(split_schema))
+    assert 'broken.graphql' in str(error.value)
+
+
+def test_unchanged_files_are_not_parsed_again(split_schema, monkeypatch):
+    SchemaLoader.from_paths(str(split_schema))
+    (split_schema / 'types' / 'user.graphql').write_text('type User { id: ID!, email: String }')
+
+    parsed = []
+    parse = schema_loader.parse
+    monkeypatch.setattr(schema_loader, 'parse', lambda source: parsed.append(source.name) or parse(source))
+    schema = SchemaLoader.from_paths(str(split_schema))
+    assert parsed == [str(split_schema / 'types' / 'user.graphql')]
+    assert set(schema.type_map['User'].fields) == {'id', 'email', 'name'}
+
+
+def test_parsed_documents_kept_are_bounded(split_schema, monkeypatch):
+    monkeypatch.setattr(schema_loader, 'PARSED_DOCUMENTS_LIMIT', 2)
+    monkeypatch.setattr(SchemaLoader, 'parsed_documents', OrderedDict())
+    schema = SchemaLoader.from_paths(str(split_schema))
+    assert len(SchemaLoader.parsed_documents) == 2
+    assert set(schema.type_map['User'].fields) == {'id', 'name'}
+
+
+def test_low_memory_loading_builds_the_same_schema():
+    old_schema = TESTS_DATA / 'old_schema.gql'
+    assert print_schema(SchemaLoader.from_file(old_schema, low_memory=True)) == print_schema(
+        SchemaLoader.from_file(old_schema)
+    )
+
+
+def test_low_memory_loading_in_batches(tmp_path):
+    path = tmp_path / 'schema.graphql'
+    path.write_text('# Leading comment\ntype Query { a: A0 }\n' + ''.join(
+        f'"""Type ñ {i}"""\ntype A{i} {{ next: A{i + 1} }}\n' for i in range(50)
+    ) + 'type A50 { value: Int }\n')
+
+    definitions = schema_loader.read_definitions(str(path), batch_size=64)
+    assert len(definitions) == 52
+    assert all(definition.loc is None for definition in definitions)
+    assert definitions[1].description.value == 'Type ñ 0'
+    assert print_schema(SchemaLoader.from_paths(str(path), low_memory=True)) == print_schema(
+        SchemaLoader.from_file(path)
+    )
+
+
+def test_low_memory_errors_point_to_the_file_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(schema_loader, 'LOW_MEMORY_BATCH_SIZE', 16)
+    path = tmp_path / 'schema.graphql'
+    path.write_text('type Query { a: Int }\n' * 10 + '  type Broken {\n  a: \n}\n')
+    with pytest.raises(GraphQLSyntaxError) as expected:
+        SchemaLoader.from_file(path)
+    with pytest.raises(GraphQLSyntaxError) as error:
+        SchemaLoader.from_file(path, low_memory=True)
+    assert error.value.locations == expected.value.locations == [SourceLocation(12, 6)]
+    assert 'schema.graphql' in str(error.value)
+
+
+def test_definition_starts_scan_bytes():
+    sdl = '"""Doc ü"""\ntype A { b: Int }\nextend type A { c: String }\nunion U = A | B\n'
+    assert list(schema_loader.definition_starts(sdl.encode('utf-8'))) == [
+        len(sdl[:start].encode('utf-8')) for start in schema_loader.definition_starts(sdl)
+    ]
@@ -0,0 +1,101 @@
+import pytest
+
+from schemadiff import DiffScope, diff
+from schemadiff.changes.object import ObjectTypeFieldAdded
+from schemadiff.diff.schema import Schema
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.scope import change_kinds
+
+OLD_SDL = '''
+type Query { user: User posts: [Post] }
+type Mutation { login: Boolean }
+type User { name: String email: String }
+type Post { title: String }
+enum Role { ADMIN USER }
+directive @auth on FIELD_DEFINITION
+'''
+
+NEW_SDL = '''
+type Query { user: User posts: [Post] me: User }
+type Mutation { login: String }
+type User { name: String age: Int }
+type Post { title: Int }
+enum Role { ADMIN }
+type Comment { text: String }
+'''
+
+
+def paths(changes):
+    return sorted(change.path for change in changes)
+
+
+def test_include_keeps_the_members_of_matching_paths():
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=DiffScope(include=['User']))) == ['User.age', 'User.email']
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=DiffScope(include=['Query.*', 'Mutation']))) == [
+        'Mutation.login', 'Query.me',
+    ]
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=DiffScope(include=['*.title']))) == ['Post.title']
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=DiffScope(include=['@*']))) == ['@auth']
+
+
+def test_exclude_wins_over_include():
+    scope = DiffScope(include=['Query', 'User'], exclude=['User.email'])
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=scope)) == ['Query.me', 'User.age']
+    everything = {change.path for change in diff(OLD_SDL, NEW_SDL)}
+    assert set(paths(diff(OLD_SDL, NEW_SDL, scope=DiffScope(exclude=['Comment', 'Role'])))) == (
+        everything - {'Comment', 'Role'}
+    )
+
+
+def test_kinds():
+    scope = DiffScope(kinds=[ObjectTypeFieldAdded])
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=scope)) == ['Query.me', 'User.age']
+    scope = DiffScope(include=['Query'], kinds=['ObjectTypeFieldAdded', 'FieldTypeChanged'])
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=scope)) == ['Query.me']
+
+
+def test_types_out_of_scope_are_never_compared(monkeypatch):
+    compared = []
+    compare_types = Schema.compare_types
+
+    def spy(old_type, new_type, detect_renames=False):
+        compared.append(new_type.name)
+        return compare_types(old_type, new_type, detect_renames)
+
+    monkeypatch.setattr(Schema, 'compare_types', staticmethod(spy))
+    old, new = SchemaLoader.from_sdl(OLD_SDL), SchemaLoader.from_sdl(NEW_SDL)
+    Schema(old, new, scope=DiffScope(include=['Query.*', 'Post'])).diff()
+    assert sorted(compared) == ['Post', 'Query']
+
+    compared.clear()
+    Schema(old, new, scope=DiffScope(kinds=['AddedType', 'RemovedType'])).diff()
+    assert compared == []
+
+
+def test_phases_without_requested_kinds_are_skipped():
+    scope = DiffScope(kinds=['RemovedDirective'])
+    assert scope.compares_directives()
+    assert not scope.lists_types()
+    assert not scope.compares_types()
+    assert not scope.compares_schema_types()
+    assert paths(diff(OLD_SDL, NEW_SDL, scope=scope)) == ['@auth']
+
+
+@pytest.mark.parametrize('pattern, name, expected', [
+    ('Query.*', 'Query', True),
+    ('Query.*', 'QueryRoot', False),
+    ('Query', 'QueryRoot', False),
+    ('Us*', 'User', True),
+    ('Us*', 'Post', False),
+    ('*.id', 'Post', True),
+    ('@a*', '@auth', True),
+    ('@a*', 'User', False),
+])
+def test_names_that_may_be_in_scope(pattern, name, expected):
+    assert DiffScope(include=[pattern]).may_include_name(name) is expected
+
+
+def test_change_kinds():
+    kinds = change_kinds()
+    assert kinds['ObjectTypeFieldAdded'] is ObjectTypeFieldAdded
+    assert 'MaterializedChange' not in kinds
@@ -0,0 +1,86 @@
+import struct
+
+import pytest
+
+from schemadiff import diff, ChangeSet
+from schemadiff.changes import Change, Criticality
+from schemadiff.serialization import dumps, dump, loads, load, DiffReader, InvalidDiffBuffer, HEADER
+from tests.test_schema_loading import TESTS_DATA
+
+OLD_SDL = (TESTS_DATA / 'old_schema.gql').read_text()
+NEW_SDL = (TESTS_DATA / 'new_schema.gql').read_text()
+
+
+class PathlessChange(Change):
+    criticality = Criticality.dangerous('Something ünïcode happened')
+
+    @property
+    def message(self):
+        return 'A change without path 💥'
+
+    @property
+    def path(self):
+        return None
+
+
+@pytest.fixture
+def changes():
+    return diff(OLD_SDL, NEW_SDL)
+
+
+def test_round_trip(changes):
+    decoded = loads(dumps(changes))
+    assert isinstance(decoded, ChangeSet)
+    assert [change.to_dict() for change in decoded] == [change.to_dict() for change in changes]
+    assert [change.kind for change in decoded] == [change.kind for change in changes]
+    assert [change.coordinate for change in decoded] == [change.coordinate for change in changes]
+    assert decoded.counts('kind') == changes.counts('kind')
+
+
+def test_empty_diff_round_trip():
+    assert len(loads(dumps([]))) == 0
+
+
+def test_strings_are_interned(changes):
+    duplicated = list(changes) * 10
+    assert len(dumps(duplicated)) < len(dumps(changes)) + len(changes) * 10 * 40
+
+
+def test_reader_over_memory_mapped_file(tmp_path, changes):
+    path = tmp_path / 'diff.bin'
+    dump(changes, str(path))
+
+    with DiffReader.open(str(path)) as reader:
+        assert len(reader) == len(changes)
+        assert reader[-1].to_dict() == changes[-1].to_dict()
+        assert [change.message for change in reader[:3]] == [change.message for change in changes[:3]]
+        with pytest.raises(IndexError):
+            reader[len(changes)]
+
+    assert [change.to_dict() for change in load(str(path))] == [change.to_dict() for change in changes]
+
+
+def test_none_path_and_unicode_survive():
+    change = PathlessChange()
+    decoded = loads(dumps([change]))[0]
+    assert decoded.path is None
+    assert decoded.to_dict() == change.to_dict()
+
+
+def test_invalid_buffers(changes, tmp_path):
+    buffer = dumps(changes)
+    with pytest.raises(InvalidDiffBuffer, match='too short'):
+        DiffReader(b'SD')
+    with pytest.raises(InvalidDiffBuffer, match='does not hold'):
+        DiffReader(b'NOPE' + buffer[4:])
+    with pytest.raises(InvalidDiffBuffer, match='Unsupported format version 9'):
+        DiffReader(buffer[:4] + struct.pack('<H', 9) + buffer[6:])
+    with pytest.raises(InvalidDiffBuffer, match='size does not match'):
+        DiffReader(buffer[:-1])
+    with pytest.raises(InvalidDiffBuffer, match='size does not match'):
+        DiffReader(buffer[:HEADER.size + 2])
+
+    empty = tmp_path / 'empty.bin'
+    empty.write_bytes(b'')
+    with pytest.raises(InvalidDiffBuffer):
+        DiffReader.open(str(empty))
@@ -0,0 +1,56 @@
+from schemadiff import DiffScope, diff, diff_summary
+from schemadiff.changes import CriticalityLevel
+from schemadiff.changes.object import ObjectTypeFieldAdded
+from schemadiff.summary import format_summary
+from tests.test_schema_loading import TESTS_DATA
+
+OLD_SDL = (TESTS_DATA / 'old_schema.gql').read_text()
+NEW_SDL = (TESTS_DATA / 'new_schema.gql').read_text()
+
+
+def test_summary_matches_the_changes():
+    changes = diff(OLD_SDL, NEW_SDL)
+    summary = diff_summary(OLD_SDL, NEW_SDL)
+    levels = changes.counts('level')
+    assert summary.levels == {
+        'breaking': levels[CriticalityLevel.Breaking],
+        'dangerous': levels[CriticalityLevel.Dangerous],
+        'safe': levels[CriticalityLevel.NonBreaking],
+    }
+    assert summary.kinds == changes.counts('kind')
+    assert summary.total == len(changes)
+    breaking_paths = list(dict.fromkeys(change.path for change in changes if change.breaking))
+    assert summary.breaking_paths == breaking_paths[:10]
+
+
+def test_sample_of_breaking_paths_is_short():
+    summary = diff_summary(OLD_SDL, NEW_SDL, sample_size=2)
+    assert len(summary.breaking_paths) == 2
+    assert summary.levels['breaking'] > 2
+
+
+def test_messages_are_never_built(monkeypatch):
+    def fail(self):
+        raise AssertionError('Message built')
+
+    monkeypatch.setattr(ObjectTypeFieldAdded, 'message', property(fail))
+    assert diff_summary(OLD_SDL, NEW_SDL).kinds['ObjectTypeFieldAdded'] == 1
+
+
+def test_summary_with_scope():
+    summary = diff_summary(OLD_SDL, NEW_SDL, scope=DiffScope(kinds=['ObjectTypeFieldAdded']))
+    assert summary.kinds == {'ObjectTypeFieldAdded': 1}
+    assert summary.levels == {'breaking': 0, 'dangerous': 0, 'safe': 1}
+    assert summary.breaking_paths == []
+
+
+def test_format_summary():
+    summary = diff_summary('type Query { a: Int b: Int }', 'type Query { a: String c: Int }')
+    assert format_summary(summary) == (
+        '3 changes: 2 breaking, 0 dangerous, 1 safe\n'
+        '  FieldTypeChanged        1\n'
+        '  ObjectTypeFieldAdded    1\n'
+        '  ObjectTypeFieldRemoved  1\n'
+        'Breaking changes on: Query.a, Query.b'
+    )
+    assert summary.to_dict()['total'] == 3
@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+
+from schemadiff import diff
+from schemadiff.changeset import ChangeSet
+from schemadiff.formatting import format_delta
+from schemadiff.schema_loader import SchemaLoader
+from schemadiff.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    result_delta,
+    wait_for_changes,
+    watch_diff,
+    watched_directory,
+)
+
+OLD_SDL = 'type Query { a: Int, b: String }'
+
+
+@pytest.fixture
+def schemas(tmp_path):
+    (tmp_path / 'old.graphql').write_text(OLD_SDL)
+    (tmp_path / 'new.graphql').write_text(OLD_SDL)
+    return tmp_path
+
+
+def write_later(path, text, delay=0.05):
+    def write():
+        time.sleep(delay)
+        path.write_text(text)
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+
+@pytest.mark.parametrize('watcher_class', [PollingWatcher, InotifyWatcher])
+def test_watchers_notice_changes(schemas, watcher_class):
+    kwargs = {'interval': 0.01} if watcher_class is PollingWatcher else {}
+    watcher = watcher_class([str(schemas / 'new.graphql')], **kwargs)
+    assert not watcher.wait(0.05)
+    write_later(schemas / 'new.graphql', 'type Query { a: Int }').join()
+    assert watcher.wait(1)
+    watcher.close()
+
+
+def test_inotify_watches_the_directories_of_globs(tmp_path):
+    (tmp_path / 'schema').mkdir()
+    watcher = InotifyWatcher([str(tmp_path / 'schema' / '*.graphql')])
+    write_later(tmp_path / 'schema' / 'a.graphql', 'type Query { a: Int }').join()
+    assert watcher.wait(1)
+    watcher.close()
+
+
+def test_inotify_watches_recursive_globs_and_new_subdirectories(tmp_path):
+    (tmp_path / 'schema' / 'types').mkdir(parents=True)
+    watcher = InotifyWatcher([str(tmp_path / 'schema' / '**' / '*.graphql')])
+    write_later(tmp_path / 'schema' / 'types' / 'a.graphql', 'type A { a: Int }').join()
+    assert watcher.wait(1)
+    assert not watcher.wait(0.05)
+
+    (tmp_path / 'schema' / 'types' / 'nested').mkdir()
+    assert watcher.wait(1)
+    write_later(tmp_path / 'schema' / 'types' / 'nested' / 'b.graphql', 'type B { b: Int }').join()
+    assert watcher.wait(1)
+    watcher.close()
+
+
+@pytest.mark.parametrize('pattern, expected', [
+    ('schema/*.graphql', ('schema', False)),
+    ('schema/**/*.graphql', ('schema', True)),
+    ('schema/v*/types.graphql', ('schema', True)),
+    ('*.graphql', ('.', False)),
+    ('/*.graphql', ('/', False)),
+])
+def test_watched_directory(pattern, expected):
+    assert watched_directory(pattern) == expected
+
+
+def test_bursts_of_writes_are_debounced(schemas):
+    watcher = PollingWatcher([str(schemas / 'new.graphql')], interval=0.01)
+
+    def burst():
+        for i in range(5):
+            (schemas / 'new.graphql').write_text(f'type Query {{ a{i}: Int }}')
+            time.sleep(0.03)
+    thread = threading.Thread(target=burst)
+    thread.start()
+    wait_for_changes(watcher, debounce=0.1)
+    thread.join()
+    assert not watcher.wait(0.05)
+
+
+def test_result_delta():
+    old = SchemaLoader.from_sdl(OLD_SDL)
+    first = diff(old, SchemaLoader.from_sdl('type Query { a: Float, b: String }'))
+    second = diff(old, SchemaLoader.from_sdl('type Query { a: Float }'))
+    appeared, disappeared = result_delta(first, second)
+    assert [change.message for change in appeared] == ['Field `b` was removed from object type `Query`']
+    assert disappeared == ChangeSet()
+    assert format_delta(appeared, disappeared) == '+ ❌ Field `b` was removed from object type `Query`'
+
+
+def test_watch_diff_yields_deltas(schemas, capsys):
+    watcher = PollingWatcher([str(schemas / 'new.graphql')], interval=0.01)
+    updates = watch_diff([str(schemas / 'old.graphql')], [str(schemas / 'new.graphql')], watcher, debounce=0.05)
+    changes, _, _ = next(updates)
+    assert changes == ChangeSet()
+
+    write_later(schemas / 'new.graphql', 'type Query { a: Int, b: String, c: ID }')
+    _, appeared, disappeared = next(updates)
+    assert [change.message for change in appeared] == ['Field `c` was added to object type `Query`']
+
+    # Invalid edits keep the previous result until the schema is valid again
+    write_later(schemas / 'new.graphql', 'type Query { a: Int, b: ')
+    write_later(schemas / 'new.graphql', 'type Query { a: Int, b: String }', delay=0.3)
+    _, appeared, disappeared = next(updates)
+    assert appeared == ChangeSet()
+    assert [change.message for change in disappeared] == ['Field `c` was added to object type `Query`']
+    assert "Can't compare the new schema" in capsys.readouterr().err
+    updates.close()
+
+
+def test_watch_diff_keeps_going_after_edits_that_cant_be_built(schemas, capsys):
+    watcher = PollingWatcher([str(schemas / 'new.graphql')], interval=0.01)
+    updates = watch_diff([str(schemas / 'old.graphql')], [str(schemas / 'new.graphql')], watcher, debounce=0.05)
+    next(updates)
+
+    write_later(schemas / 'new.graphql', 'type Query { a: Int, b: String, c: NotYetDefined }')
+    write_later(schemas / 'new.graphql', 'type Query { a: Int, b: String, c: Defined } type Defined { a: Int }',
+                delay=0.3)
+    _, appeared, _ = next(updates)
+    assert sorted(change.message for change in appeared) == [
+        'Field `c` was added to object type `Query`', 'Type `Defined` was added',
+    ]
+    assert "Unknown type 'NotYetDefined'" in capsys.readouterr().err
+    updates.close()